@@ -13,6 +13,14 @@ Demonstrates all area plot types with COMPREHENSIVE customization:
 
 import sys
 import os
+
+# Set PLOTLIB_SHOW=1 to open each figure in a Qt window; batch runs only
+# render once, through Agg, when saving.
+INTERACTIVE = os.environ.get('PLOTLIB_SHOW', '0') == '1'
+
+import matplotlib
+matplotlib.use('Qt5Agg' if INTERACTIVE else 'Agg')
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import numpy as np
@@ -467,13 +475,12 @@ def example_8_fill_only():
     
     # Create area plot without line
     fig, ax = create_area_plot(series, config, alpha=0.7, show_line=False)
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
     
     save_plot(fig, 'area_example8_fillonly.png', dpi=300)
     print("  ✓ Created area_example8_fillonly.png")
     print("     - No line on top (show_line=False)")
-    
-    plt.show()
 
 
 # ============================================================================
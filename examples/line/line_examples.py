@@ -14,12 +14,19 @@ Demonstrates all line and scatter plot capabilities with COMPREHENSIVE examples:
 
 import sys
 import os
+
+# Set PLOTLIB_SHOW=1 to open each figure in a Qt window; batch runs only
+# render once, through Agg, when saving.
+INTERACTIVE = os.environ.get('PLOTLIB_SHOW', '0') == '1'
+
+import matplotlib
+matplotlib.use('Qt5Agg' if INTERACTIVE else 'Agg')
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import matplotlib.pyplot as plt
 import numpy as np
-from pypsa_nza_plotter import create_line_plot, save_plot
-from models import SeriesConfig, PlotConfig
+from pypsa_nza_plotter import create_line_plot, save_plot, SeriesConfig, PlotConfig
 
 
 # ============================================================================
@@ -59,7 +66,8 @@ def example_1_basic_line():
     
     # Create line plot
     fig, ax = create_line_plot(series, config)
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
     
     save_plot(fig, 'line_example1_basic.png', dpi=300)
     print("  ✓ Created line_example1_basic.png")
@@ -13,16 +13,6 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from plotlib.timeseries import (
-    load_timeseries_csv,
-    select_columns,
-    fill_under_curve,
-    add_week_separators,
-    add_boundary_lines
-)
-from plotlib import create_line_plot, save_plot
-from models import SeriesConfig, PlotConfig
-
 
 # ============================================================================
 # EXAMPLE 1: Using New PlotConfig Options
@@ -32,6 +22,16 @@ def example_1_extended_config():
     """
     Demonstrate extended PlotConfig with all new formatting options.
     """
+    from plotlib.timeseries import (
+        load_timeseries_csv,
+        select_columns,
+        fill_under_curve,
+        add_week_separators,
+        add_boundary_lines,
+    )
+    from plotlib import create_line_plot, save_plot
+    from models import SeriesConfig, PlotConfig
+    
     print("Example 1: Extended PlotConfig...")
     
     # Load data
@@ -114,6 +114,16 @@ def example_2_custom_styling():
     """
     Demonstrate custom styling with different color scheme.
     """
+    from plotlib.timeseries import (
+        load_timeseries_csv,
+        select_columns,
+        fill_under_curve,
+        add_week_separators,
+        add_boundary_lines,
+    )
+    from plotlib import create_line_plot, save_plot
+    from models import SeriesConfig, PlotConfig
+    
     print("\nExample 2: Custom styling...")
     
     # Load data
@@ -187,6 +197,16 @@ def example_3_publication_style():
     """
     Clean, professional style suitable for publication.
     """
+    from plotlib.timeseries import (
+        load_timeseries_csv,
+        select_columns,
+        fill_under_curve,
+        add_week_separators,
+        add_boundary_lines,
+    )
+    from plotlib import create_line_plot, save_plot
+    from models import SeriesConfig, PlotConfig
+    
     print("\nExample 3: Publication style...")
     
     # Load data
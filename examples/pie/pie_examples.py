@@ -15,9 +15,6 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from plotlib import create_pie_chart, save_plot
-from models import PlotConfig
-
 
 # ============================================================================
 # EXAMPLE 1: Simple Pie Chart
@@ -27,6 +24,9 @@ def example_1_simple_pie():
     """
     Basic pie chart with custom colors.
     """
+    from plotlib import create_pie_chart, save_plot
+    from models import PlotConfig
+    
     print("Example 1: Simple pie chart...")
     
     # Data - NZ generation mix
@@ -57,6 +57,9 @@ def example_2_donut():
     """
     Donut chart (pie with hole in center).
     """
+    from plotlib import create_pie_chart, save_plot
+    from models import PlotConfig
+    
     print("\nExample 2: Donut chart...")
     
     # Data
@@ -92,6 +95,9 @@ def example_3_exploded():
     """
     Pie chart with exploded slices (pull out certain wedges).
     """
+    from plotlib import create_pie_chart, save_plot
+    from models import PlotConfig
+    
     print("\nExample 3: Exploded slices...")
     
     # Data
@@ -129,6 +135,9 @@ def example_4_hatching():
     """
     Black & white pie chart with hatch patterns.
     """
+    from plotlib import create_pie_chart, save_plot
+    from models import PlotConfig
+    
     print("\nExample 4: Cross-hatching for B&W...")
     
     # Data
@@ -169,6 +178,9 @@ def example_5_donut_hatching():
     """
     Donut chart with hatch patterns.
     """
+    from plotlib import create_pie_chart, save_plot
+    from models import PlotConfig
+    
     print("\nExample 5: Donut with hatching...")
     
     # Data
@@ -211,6 +223,9 @@ def example_6_exploded_donut():
     """
     Exploded donut chart with custom styling.
     """
+    from plotlib import create_pie_chart, save_plot
+    from models import PlotConfig
+    
     print("\nExample 6: Exploded donut...")
     
     # Data
@@ -249,6 +264,9 @@ def example_7_no_percentages():
     """
     Pie chart with labels only (no percentages).
     """
+    from plotlib import create_pie_chart, save_plot
+    from models import PlotConfig
+    
     print("\nExample 7: Labels only (no percentages)...")
     
     # Data
@@ -282,6 +300,9 @@ def example_8_rotated():
     """
     Pie chart with custom start angle.
     """
+    from plotlib import create_pie_chart, save_plot
+    from models import PlotConfig
+    
     print("\nExample 8: Rotated start angle...")
     
     # Data
@@ -316,6 +337,9 @@ def example_9_accessible():
     """
     Pie chart with both color AND pattern for accessibility.
     """
+    from plotlib import create_pie_chart, save_plot
+    from models import PlotConfig
+    
     print("\nExample 9: Accessible (color + pattern)...")
     
     # Data
@@ -16,13 +16,80 @@ Demonstrates all subplot capabilities with COMPREHENSIVE examples:
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from dataclasses import replace
+from functools import lru_cache
+
 import numpy as np
-from plotlib import (
-    create_subplots, add_subplot_labels, save_plot
-)
-from models import PlotConfig, SeriesConfig
+
+
+@lru_cache(maxsize=None)
+def cached_linspace(start, stop, num):
+    """Memoised np.linspace, read-only so one example cannot modify another's grid."""
+    x = np.linspace(start, stop, num)
+    x.flags.writeable = False
+    return x
+
+
+@lru_cache(maxsize=None)
+def damped_sine(start, stop, num, tau):
+    """sin(x) * exp(-x / tau) on cached_linspace(start, stop, num), read-only."""
+    x = cached_linspace(start, stop, num)
+    y = np.sin(x) * np.exp(-x / tau)
+    y.flags.writeable = False
+    return y
+
+
+@lru_cache(maxsize=None)
+def base_config(figure_width, figure_height, tick_label_size=9):
+    """
+    Shared PlotConfig for a figure size; examples derive from it with replace().
+    
+    The cached instance is never modified: dataclasses.replace() returns a new
+    PlotConfig each time.
+    """
+    from models import PlotConfig
+    return PlotConfig(
+        figure_width=figure_width,
+        figure_height=figure_height,
+        tick_label_size=tick_label_size
+    )
+
+
+def save_and_close(fig, filename, dpi=300):
+    """Save with plotlib's save_plot, then close the figure to free its canvas."""
+    from matplotlib import pyplot as plt
+    from plotlib import save_plot
+    save_plot(fig, filename, dpi=dpi)
+    plt.close(fig)
+
+
+# Fewer auto-ticks per axis keeps the many small panels below cheap to draw
+TICK_BINS = 5
+
+
+def limit_ticks(axes, nbins=TICK_BINS):
+    """Cap the number of major ticks on every axes in the grid."""
+    for ax in np.atleast_1d(axes).ravel():
+        ax.locator_params(nbins=nbins)
+
+
+def rasterize(*artists):
+    """
+    Mark data artists as rasterized (lines, bar containers, boxplot dicts).
+    
+    Text, ticks and spines stay vector in PDF/SVG output while dense data
+    is embedded as a single image at the save dpi.
+    """
+    for artist in artists:
+        if isinstance(artist, dict):
+            rasterize(*artist.values())
+        elif isinstance(artist, (list, tuple)):
+            rasterize(*artist)
+        else:
+            artist.set_rasterized(True)
 
 
 # ============================================================================
@@ -33,22 +100,19 @@ def example_1_simple_grid():
     """
     Simple 2×2 grid with line plots.
     """
+    from plotlib import create_subplots
+    
     print("Example 1: Simple 2×2 grid...")
     
     # Config
-    config = PlotConfig(
-        title='2×2 Subplot Grid',
-        figure_width=10,
-        figure_height=8,
-        tick_label_size=9
-    )
+    config = replace(base_config(10, 8), title='2×2 Subplot Grid')
     
     # Create 2×2 grid
     fig, axes = create_subplots(2, 2, config)
+    limit_ticks(axes)
     
     # Generate data
-    np.random.seed(42)
-    x = np.linspace(0, 10, 100)
+    x = cached_linspace(0, 10, 100)
     
     # Plot 1: Sine
     axes[0, 0].plot(x, np.sin(x), 'b-', linewidth=2)
@@ -74,7 +138,7 @@ def example_1_simple_grid():
     axes[1, 1].set_xlabel('Time (s)')
     axes[1, 1].grid(True, alpha=0.3)
     
-    save_plot(fig, 'subplot_example1_grid.png', dpi=300)
+    save_and_close(fig, 'subplot_example1_grid.png', dpi=300)
     print("  ✓ Created subplot_example1_grid.png")
 
 
@@ -86,25 +150,24 @@ def example_2_vertical_stack():
     """
     Vertical stack with shared x-axis (common for time-series).
     """
+    from plotlib import create_subplots
+    
     print("\nExample 2: Vertical stack...")
     
     # Config
-    config = PlotConfig(
-        title='Time-Series Stack - Shared X-Axis',
-        figure_width=10,
-        figure_height=8,
-        tick_label_size=9
-    )
+    config = replace(base_config(10, 8), title='Time-Series Stack - Shared X-Axis')
     
     # Create 3×1 grid with shared x-axis
     fig, axes = create_subplots(3, 1, config, sharex=True)
+    limit_ticks(axes)
     
     # Generate data
-    np.random.seed(42)
-    t = np.linspace(0, 24, 100)
-    signal1 = 10 + np.sin(t * 0.5) + np.random.randn(100) * 0.5
-    signal2 = 20 + np.cos(t * 0.3) + np.random.randn(100) * 0.8
-    signal3 = 15 + np.sin(t * 0.7) * np.cos(t * 0.2) + np.random.randn(100) * 0.3
+    rng = np.random.default_rng(42)
+    t = cached_linspace(0, 24, 100)
+    noise = rng.standard_normal((3, 100))
+    signal1 = 10 + np.sin(t * 0.5) + noise[0] * 0.5
+    signal2 = 20 + np.cos(t * 0.3) + noise[1] * 0.8
+    signal3 = 15 + np.sin(t * 0.7) * np.cos(t * 0.2) + noise[2] * 0.3
     
     # Plot 1
     axes[0].plot(t, signal1, 'b-', linewidth=1.5)
@@ -122,7 +185,7 @@ def example_2_vertical_stack():
     axes[2].set_xlabel('Time (hours)', fontsize=11)
     axes[2].grid(True, alpha=0.3)
     
-    save_plot(fig, 'subplot_example2_vertical.png', dpi=300)
+    save_and_close(fig, 'subplot_example2_vertical.png', dpi=300)
     print("  ✓ Created subplot_example2_vertical.png")
     print("     - Shared x-axis")
 
@@ -135,26 +198,22 @@ def example_3_horizontal():
     """
     Horizontal layout with shared y-axis.
     """
+    from plotlib import create_subplots
+    
     print("\nExample 3: Horizontal with shared y...")
     
     # Config
-    config = PlotConfig(
-        title='Side-by-Side Comparison - Shared Y-Axis',
-        figure_width=12,
-        figure_height=4,
-        tick_label_size=9
-    )
+    config = replace(base_config(12, 4), title='Side-by-Side Comparison - Shared Y-Axis')
     
     # Create 1×3 grid with shared y-axis
     fig, axes = create_subplots(1, 3, config, sharey=True)
+    limit_ticks(axes)
     
     # Generate data
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     categories = ['A', 'B', 'C', 'D']
     
-    data1 = np.random.rand(4) * 10
-    data2 = np.random.rand(4) * 10
-    data3 = np.random.rand(4) * 10
+    data1, data2, data3 = rng.random((3, 4)) * 10
     
     # Plot 1
     axes[0].bar(categories, data1, color='#0066CC')
@@ -172,7 +231,7 @@ def example_3_horizontal():
     axes[2].set_title('Dataset 3')
     axes[2].grid(True, alpha=0.3, axis='y')
     
-    save_plot(fig, 'subplot_example3_horizontal.png', dpi=300)
+    save_and_close(fig, 'subplot_example3_horizontal.png', dpi=300)
     print("  ✓ Created subplot_example3_horizontal.png")
     print("     - Shared y-axis")
 
@@ -185,26 +244,24 @@ def example_4_mixed_types():
     """
     Grid with different plot types in each subplot.
     """
+    from plotlib import create_subplots
+    
     print("\nExample 4: Mixed plot types...")
     
     # Config
-    config = PlotConfig(
-        title='Mixed Plot Types',
-        figure_width=12,
-        figure_height=8,
-        tick_label_size=9
-    )
+    config = replace(base_config(12, 8), title='Mixed Plot Types')
     
     # Create 2×2 grid
     fig, axes = create_subplots(2, 2, config)
+    limit_ticks(axes)
     
     # Generate data
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Plot 1: Line plot
-    x = np.linspace(0, 10, 100)
-    y = np.sin(x) * np.exp(-x/10)
-    axes[0, 0].plot(x, y, 'b-', linewidth=2)
+    x = cached_linspace(0, 10, 100)
+    y = damped_sine(0, 10, 100, 10)
+    line = axes[0, 0].plot(x, y, 'b-', linewidth=2)
     axes[0, 0].set_title('(a) Line Plot')
     axes[0, 0].set_ylabel('Amplitude')
     axes[0, 0].grid(True, alpha=0.3)
@@ -212,28 +269,31 @@ def example_4_mixed_types():
     # Plot 2: Bar chart
     categories = ['Q1', 'Q2', 'Q3', 'Q4']
     values = [85, 92, 88, 95]
-    axes[0, 1].bar(categories, values, color=['#0066CC', '#CC6666', '#00CC66', '#FFCC00'])
+    bars = axes[0, 1].bar(categories, values, color=['#0066CC', '#CC6666', '#00CC66', '#FFCC00'])
     axes[0, 1].set_title('(b) Bar Chart')
     axes[0, 1].set_ylabel('Sales ($1000s)')
     axes[0, 1].grid(True, alpha=0.3, axis='y')
     
     # Plot 3: Box plot
-    data = [np.random.randn(100) * 10 + 50 for _ in range(3)]
-    bp = axes[1, 0].boxplot(data, labels=['Group A', 'Group B', 'Group C'])
+    data = rng.standard_normal((3, 100)) * 10 + 50  # one row per group
+    bp = axes[1, 0].boxplot(data.T, labels=['Group A', 'Group B', 'Group C'])
     axes[1, 0].set_title('(c) Box Plot')
     axes[1, 0].set_xlabel('Groups')
     axes[1, 0].set_ylabel('Value')
     axes[1, 0].grid(True, alpha=0.3, axis='y')
     
     # Plot 4: Scatter plot
-    x_scatter = np.random.randn(50) * 2 + 5
-    y_scatter = x_scatter * 2 + np.random.randn(50) * 3
-    axes[1, 1].scatter(x_scatter, y_scatter, c='purple', alpha=0.6, s=50)
+    scatter_noise = rng.standard_normal((2, 50))
+    x_scatter = scatter_noise[0] * 2 + 5
+    y_scatter = x_scatter * 2 + scatter_noise[1] * 3
+    points = axes[1, 1].scatter(x_scatter, y_scatter, c='purple', alpha=0.6, s=50)
     axes[1, 1].set_title('(d) Scatter Plot')
     axes[1, 1].set_xlabel('X Variable')
     axes[1, 1].grid(True, alpha=0.3)
     
-    save_plot(fig, 'subplot_example4_mixed.png', dpi=300)
+    rasterize(line, bars, bp, points)
+    
+    save_and_close(fig, 'subplot_example4_mixed.png', dpi=300)
     print("  ✓ Created subplot_example4_mixed.png")
     print("     - Different plot types in each panel")
 
@@ -246,15 +306,12 @@ def example_5_custom_spacing():
     """
     Control spacing between subplots.
     """
+    from plotlib import create_subplots
+    
     print("\nExample 5: Custom spacing...")
     
     # Config
-    config = PlotConfig(
-        title='Custom Subplot Spacing',
-        figure_width=10,
-        figure_height=8,
-        tick_label_size=9
-    )
+    config = replace(base_config(10, 8), title='Custom Subplot Spacing')
     
     # Create grid with custom spacing
     fig, axes = create_subplots(
@@ -262,10 +319,10 @@ def example_5_custom_spacing():
         hspace=0.4,  # Vertical spacing
         wspace=0.3   # Horizontal spacing
     )
+    limit_ticks(axes)
     
     # Generate data
-    np.random.seed(42)
-    x = np.linspace(0, 10, 100)
+    x = cached_linspace(0, 10, 100)
     
     for i in range(2):
         for j in range(2):
@@ -278,7 +335,7 @@ def example_5_custom_spacing():
             if j == 0:
                 axes[i, j].set_ylabel('Y')
     
-    save_plot(fig, 'subplot_example5_spacing.png', dpi=300)
+    save_and_close(fig, 'subplot_example5_spacing.png', dpi=300)
     print("  ✓ Created subplot_example5_spacing.png")
     print("     - Custom hspace and wspace")
 
@@ -291,15 +348,12 @@ def example_6_titles():
     """
     Subplots with custom titles.
     """
+    from plotlib import create_subplots
+    
     print("\nExample 6: Subplot titles...")
     
     # Config
-    config = PlotConfig(
-        title='Subplot Titles Example',
-        figure_width=10,
-        figure_height=6,
-        tick_label_size=9
-    )
+    config = replace(base_config(10, 6), title='Subplot Titles Example')
     
     # Define titles
     titles = [
@@ -310,14 +364,17 @@ def example_6_titles():
     
     # Create 1×3 grid with titles
     fig, axes = create_subplots(1, 3, config, subplot_titles=titles)
+    limit_ticks(axes)
     
     # Generate data
-    np.random.seed(42)
-    t = np.linspace(0, 24, 100)
+    rng = np.random.default_rng(42)
+    t = cached_linspace(0, 24, 100)
     
-    temp = 20 + 5 * np.sin(t * 0.3) + np.random.randn(100) * 2
-    pressure = 1013 + 10 * np.cos(t * 0.2) + np.random.randn(100) * 5
-    humidity = 60 + 15 * np.sin(t * 0.4) + np.random.randn(100) * 5
+    noise = rng.standard_normal((3, 100))
+    
+    temp = 20 + 5 * np.sin(t * 0.3) + noise[0] * 2
+    pressure = 1013 + 10 * np.cos(t * 0.2) + noise[1] * 5
+    humidity = 60 + 15 * np.sin(t * 0.4) + noise[2] * 5
     
     axes[0].plot(t, temp, 'r-', linewidth=1.5)
     axes[0].set_ylabel('°C')
@@ -332,7 +389,7 @@ def example_6_titles():
     axes[2].set_ylabel('%')
     axes[2].grid(True, alpha=0.3)
     
-    save_plot(fig, 'subplot_example6_titles.png', dpi=300)
+    save_and_close(fig, 'subplot_example6_titles.png', dpi=300)
     print("  ✓ Created subplot_example6_titles.png")
 
 
@@ -344,27 +401,26 @@ def example_7_labels():
     """
     Add publication-style labels to subplots.
     """
+    from plotlib import create_subplots, add_subplot_labels
+    
     print("\nExample 7: Subplot labels (a, b, c, d)...")
     
     # Config
-    config = PlotConfig(
-        title='Publication Figure with Panel Labels',
-        figure_width=10,
-        figure_height=8,
-        tick_label_size=9
-    )
+    config = replace(base_config(10, 8), title='Publication Figure with Panel Labels')
     
     # Create 2×2 grid
     fig, axes = create_subplots(2, 2, config)
+    limit_ticks(axes)
     
     # Generate data
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
+    x = cached_linspace(0, 10, 50)
+    noise = rng.standard_normal((2, 2, 50))
     
     # Four different datasets
     for i in range(2):
         for j in range(2):
-            x = np.linspace(0, 10, 50)
-            y = np.random.randn(50) * (i + j + 1) + (i * 5 + j * 3)
+            y = noise[i, j] * (i + j + 1) + (i * 5 + j * 3)
             axes[i, j].plot(x, y, 'o-', linewidth=1.5, markersize=4)
             axes[i, j].grid(True, alpha=0.3)
             if i == 1:
@@ -375,7 +431,7 @@ def example_7_labels():
     # Add (a), (b), (c), (d) labels
     add_subplot_labels(fig, axes)
     
-    save_plot(fig, 'subplot_example7_labels.png', dpi=300)
+    save_and_close(fig, 'subplot_example7_labels.png', dpi=300)
     print("  ✓ Created subplot_example7_labels.png")
     print("     - Panel labels: (a), (b), (c), (d)")
 
@@ -388,15 +444,12 @@ def example_8_custom_ratios():
     """
     Custom width and height ratios for subplots.
     """
+    from plotlib import create_subplots
+    
     print("\nExample 8: Custom width/height ratios...")
     
     # Config
-    config = PlotConfig(
-        title='Custom Subplot Ratios',
-        figure_width=12,
-        figure_height=8,
-        tick_label_size=9
-    )
+    config = replace(base_config(12, 8), title='Custom Subplot Ratios')
     
     # Create grid with custom ratios
     # Left plot 2x wider than right plots
@@ -405,13 +458,14 @@ def example_8_custom_ratios():
         width_ratios=[2, 1],   # Left column twice as wide
         height_ratios=[1, 1]   # Equal heights
     )
+    limit_ticks(axes)
     
     # Generate data
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Main plot (large, left side)
-    x = np.linspace(0, 10, 200)
-    y = np.sin(x) * np.exp(-x/10)
+    x = cached_linspace(0, 10, 200)
+    y = damped_sine(0, 10, 200, 10)
     axes[0, 0].plot(x, y, 'b-', linewidth=2)
     axes[0, 0].set_title('Main Plot (2× width)')
     axes[0, 0].set_ylabel('Signal')
@@ -423,7 +477,7 @@ def example_8_custom_ratios():
     axes[1, 0].grid(True, alpha=0.3)
     
     # Side plots (smaller, right side)
-    data = np.random.randn(100)
+    data = rng.standard_normal(100)
     axes[0, 1].hist(data, bins=20, color='green', alpha=0.7)
     axes[0, 1].set_title('Distribution')
     axes[0, 1].grid(True, alpha=0.3, axis='y')
@@ -432,7 +486,7 @@ def example_8_custom_ratios():
     axes[1, 1].set_title('Summary')
     axes[1, 1].grid(True, alpha=0.3, axis='y')
     
-    save_plot(fig, 'subplot_example8_ratios.png', dpi=300)
+    save_and_close(fig, 'subplot_example8_ratios.png', dpi=300)
     print("  ✓ Created subplot_example8_ratios.png")
     print("     - Custom width ratios")
 
@@ -445,27 +499,29 @@ def example_9_publication():
     """
     Clean publication-ready multi-panel figure.
     """
+    from plotlib import create_subplots, add_subplot_labels
+    
     print("\nExample 9: Publication-ready...")
     
     # Config
-    config = PlotConfig(
+    config = replace(
+        base_config(10, 6, tick_label_size=10),
         title='Experimental Results',
-        title_weight='normal',
-        figure_width=10,
-        figure_height=6,
-        tick_label_size=10
+        title_weight='normal'
     )
     
     # Create 1×3 grid
     fig, axes = create_subplots(1, 3, config)
+    limit_ticks(axes)
     
     # Generate data
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Panel A: Time series
-    t = np.linspace(0, 10, 100)
-    signal = np.sin(t) * np.exp(-t/5) + np.random.randn(100) * 0.1
-    axes[0].plot(t, signal, 'k-', linewidth=1.5)
+    t = cached_linspace(0, 10, 100)
+    noise = rng.standard_normal((3, 100))
+    signal = damped_sine(0, 10, 100, 5) + noise[0] * 0.1
+    line = axes[0].plot(t, signal, 'k-', linewidth=1.5)
     axes[0].set_xlabel('Time (s)')
     axes[0].set_ylabel('Signal (mV)')
     axes[0].grid(True, alpha=0.3)
@@ -476,17 +532,16 @@ def example_9_publication():
     groups = ['Control', 'Treatment']
     means = [45, 68]
     errors = [5, 7]
-    axes[1].bar(groups, means, yerr=errors, capsize=5, 
-               color=['#CCCCCC', '#666666'], edgecolor='black', linewidth=1.5)
+    bars = axes[1].bar(groups, means, yerr=errors, capsize=5, 
+                      color=['#CCCCCC', '#666666'], edgecolor='black', linewidth=1.5)
     axes[1].set_ylabel('Response (units)')
     axes[1].grid(True, alpha=0.3, axis='y')
     axes[1].spines['top'].set_visible(False)
     axes[1].spines['right'].set_visible(False)
     
     # Panel C: Distribution
-    control_data = np.random.randn(100) * 10 + 45
-    treatment_data = np.random.randn(100) * 10 + 68
-    bp = axes[2].boxplot([control_data, treatment_data], labels=groups, 
+    group_data = noise[1:] * 10 + np.array([[45], [68]])  # control, treatment
+    bp = axes[2].boxplot(group_data.T, labels=groups, 
                          patch_artist=True)
     for patch, color in zip(bp['boxes'], ['#CCCCCC', '#666666']):
         patch.set_facecolor(color)
@@ -495,11 +550,13 @@ def example_9_publication():
     axes[2].spines['top'].set_visible(False)
     axes[2].spines['right'].set_visible(False)
     
+    rasterize(line, bars, bp)
+    
     # Add panel labels
     add_subplot_labels(fig, axes, labels=['A', 'B', 'C'], 
                       offset=(-0.15, 1.05))
     
-    save_plot(fig, 'subplot_example9_publication.png', dpi=300)
+    save_and_close(fig, 'subplot_example9_publication.png', dpi=300)
     print("  ✓ Created subplot_example9_publication.png")
     print("     - Publication-ready with panel labels")
 
@@ -512,44 +569,49 @@ def example_10_complex():
     """
     Complex figure with many panels.
     """
+    from matplotlib.collections import LineCollection
+    from plotlib import create_subplots
+    
     print("\nExample 10: Complex multi-panel...")
     
     # Config
-    config = PlotConfig(
-        title='Complex Multi-Panel Analysis',
-        figure_width=14,
-        figure_height=10,
-        tick_label_size=8
-    )
+    config = replace(base_config(14, 10, tick_label_size=8), title='Complex Multi-Panel Analysis')
     
     # Create 3×3 grid
     fig, axes = create_subplots(3, 3, config, hspace=0.3, wspace=0.3)
-    
-    # Generate various plots
-    np.random.seed(42)
+    limit_ticks(axes)
+    
+    # Generate data for every panel up front (indexed [i, j, ...])
+    rng = np.random.default_rng(42)
+    I, J = np.meshgrid(range(3), range(3), indexing='ij')
+    line_x = cached_linspace(0, 10, 50)
+    line_y = np.sin(line_x + (I + J)[..., None]) * (I + 1)[..., None]
+    # (x, y) vertices per panel, shape (3, 3, 50, 2), ready for LineCollection
+    line_xy = np.stack(np.broadcast_arrays(line_x, line_y), axis=-1)
+    bar_data = rng.random((3, 3, 4)) * 10
+    scatter_x = rng.standard_normal((3, 3, 30))
+    scatter_y = scatter_x * 2 + rng.standard_normal((3, 3, 30))
     
     for i in range(3):
         for j in range(3):
             if (i + j) % 3 == 0:
                 # Line plot
-                x = np.linspace(0, 10, 50)
-                y = np.sin(x + i + j) * (i + 1)
-                axes[i, j].plot(x, y, linewidth=1.5)
+                artists = LineCollection([line_xy[i, j]], linewidths=1.5)
+                axes[i, j].add_collection(artists)
+                axes[i, j].autoscale_view()
             elif (i + j) % 3 == 1:
                 # Bar plot
-                data = np.random.rand(4) * 10
-                axes[i, j].bar(['A', 'B', 'C', 'D'], data)
+                artists = axes[i, j].bar(['A', 'B', 'C', 'D'], bar_data[i, j])
             else:
                 # Scatter plot
-                x = np.random.randn(30)
-                y = x * 2 + np.random.randn(30)
-                axes[i, j].scatter(x, y, alpha=0.6)
+                artists = axes[i, j].scatter(scatter_x[i, j], scatter_y[i, j], alpha=0.6)
+            rasterize(artists)
             
             axes[i, j].set_title(f'Panel {i*3 + j + 1}', fontsize=9)
             axes[i, j].grid(True, alpha=0.3)
             axes[i, j].tick_params(labelsize=8)
     
-    save_plot(fig, 'subplot_example10_complex.png', dpi=300)
+    save_and_close(fig, 'subplot_example10_complex.png', dpi=300)
     print("  ✓ Created subplot_example10_complex.png")
     print("     - 3×3 grid with mixed plot types")
 
@@ -558,6 +620,37 @@ def example_10_complex():
 # MAIN
 # ============================================================================
 
+EXAMPLES = [
+    'example_1_simple_grid',
+    'example_2_vertical_stack',
+    'example_3_horizontal',
+    'example_4_mixed_types',
+    'example_5_custom_spacing',
+    'example_6_titles',
+    'example_7_labels',
+    'example_8_custom_ratios',
+    'example_9_publication',
+    'example_10_complex',
+]
+
+
+# rcParams applied around every example in batch runs: simplify line paths
+# (at matplotlib's default threshold) and render long paths in chunks.
+BATCH_RC = {
+    'savefig.bbox': 'tight',
+    'savefig.pad_inches': 0.05,
+    'agg.path.chunksize': 10000,
+    'path.simplify': True,
+}
+
+
+def run_example(name):
+    """Run one example by name (names pickle cleanly into worker processes)."""
+    from matplotlib import pyplot as plt
+    with plt.rc_context(BATCH_RC):
+        globals()[name]()
+
+
 if __name__ == '__main__':
     print("="*70)
     print("SUBPLOT EXAMPLES - PLOTLIB V2.7.0")
@@ -575,16 +668,9 @@ if __name__ == '__main__':
     print("  10. Complex 3×3 grid")
     print("="*70)
     
-    example_1_simple_grid()
-    example_2_vertical_stack()
-    example_3_horizontal()
-    example_4_mixed_types()
-    example_5_custom_spacing()
-    example_6_titles()
-    example_7_labels()
-    example_8_custom_ratios()
-    example_9_publication()
-    example_10_complex()
+    # Examples share no state, so render them in parallel worker processes
+    with ProcessPoolExecutor(max_workers=min(len(EXAMPLES), os.cpu_count() or 1)) as pool:
+        list(pool.map(run_example, EXAMPLES))
     
     print("\n" + "="*70)
     print("✓ All subplot examples completed successfully!")
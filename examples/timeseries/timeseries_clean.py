@@ -3,17 +3,24 @@ Time-Series Example - Final Clean Version
 
 Demonstrates all time-series features with Phil's electricity data.
 """
+import sys
+import os
+
+# Set PLOTLIB_SHOW=1 to open each figure in a Qt window; batch runs only
+# render once, through Agg, when saving.
+INTERACTIVE = os.environ.get('PLOTLIB_SHOW', '0') == '1'
+
 import matplotlib
-matplotlib.use('Qt5Agg')  # or 'Qt5Agg' if you have PyQt5
+matplotlib.use('Qt5Agg' if INTERACTIVE else 'Agg')
 import matplotlib.pyplot as plt
+import numpy as np
 
-import sys
-import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from plotlib.timeseries import (
     load_timeseries_csv,
     select_columns,
+    select_y_columns,
     fill_under_curve,
     add_week_separators,
     add_boundary_lines
@@ -22,14 +29,22 @@ from plotlib import create_line_plot, save_plot
 from models import PlotConfig
 from models import SeriesConfig
 
+# On-screen figures render at screen resolution; save_plot re-rasterizes
+# at SAVE_DPI, so the interactive draw does not pay for 300 dpi pixels.
+SCREEN_DPI = 100
+SAVE_DPI = 300
+
 
 # ============================================================================
 # EXAMPLE 1: Simple Clean Plot
 # ============================================================================
 
-def example_1_simple_clean():
+def example_1_simple_clean(fig=None):
     """
     Simplest time-series plot with all the features we finalized.
+    
+    Pass an existing Figure as ``fig`` to draw into it instead of creating
+    a new one (the batch run below reuses one Figure for all examples).
     """
     print("Example 1: Simple clean plot...")
     
@@ -48,6 +63,7 @@ def example_1_simple_clean():
     
     # Create config
     config = PlotConfig(
+        dpi=SCREEN_DPI,
         tick_label_size=12,
         axis_label_size=14,
         title='Huntly Generation - July 2024',
@@ -59,14 +75,15 @@ def example_1_simple_clean():
     )
     
     # Create plot
-    fig, ax = create_line_plot(series, config)
+    fig, ax = create_line_plot(series, config, fig=fig)
     
     # Add features
     fill_under_curve(ax, x, y, color='#0066CC', alpha=0.15)
     add_boundary_lines(ax, x, linewidth=0.75)
     add_week_separators(ax, df, linewidth=2.5, center_labels=True, include_first=True)
-    plt.show()
-    save_plot(fig, 'clean_example1.png', dpi=300)
+    if INTERACTIVE:
+        plt.show()
+    save_plot(fig, 'clean_example1.png', dpi=SAVE_DPI)
     print("  ✓ Created clean_example1.png")
 
 
@@ -74,7 +91,7 @@ def example_1_simple_clean():
 # EXAMPLE 2: Multiple Stations Comparison
 # ============================================================================
 
-def example_2_comparison():
+def example_2_comparison(fig=None):
     """
     Compare multiple stations on same plot.
     """
@@ -87,9 +104,12 @@ def example_2_comparison():
     stations = ['HLY', 'MAN', 'TKA']
     colors = ['#0066CC', '#CC0000', '#00CC66']
     
+    # One shared time-step axis for every station
+    x = np.arange(len(df))
+    
     series_list = []
     for station, color in zip(stations, colors):
-        x, y, _ = select_columns(df, station)
+        y = select_y_columns(df, station)
         series = SeriesConfig(
             x=x, y=y,
             line_style='-',
@@ -101,6 +121,7 @@ def example_2_comparison():
     
     # Config
     config = PlotConfig(
+        dpi=SCREEN_DPI,
         tick_label_size=12,
         axis_label_size=14,
         title='Station Comparison: HLY vs MAN vs TKA',
@@ -112,13 +133,14 @@ def example_2_comparison():
     )
     
     # Create plot
-    fig, ax = create_line_plot(series_list, config)
+    fig, ax = create_line_plot(series_list, config, fig=fig)
     
     # Add features
     add_boundary_lines(ax, x, linewidth=0.75)
     add_week_separators(ax, df, linewidth=2.5, center_labels=True, include_first=True)
-    plt.show()
-    save_plot(fig, 'clean_example2.png', dpi=300)
+    if INTERACTIVE:
+        plt.show()
+    save_plot(fig, 'clean_example2.png', dpi=SAVE_DPI)
     print("  ✓ Created clean_example2.png")
 
 
@@ -126,7 +148,7 @@ def example_2_comparison():
 # EXAMPLE 3: Total Generation (All Columns)
 # ============================================================================
 
-def example_3_total():
+def example_3_total(fig=None):
     """
     Plot total generation (all columns summed).
     """
@@ -150,6 +172,7 @@ def example_3_total():
     
     # Config
     config = PlotConfig(
+        dpi=SCREEN_DPI,
         tick_label_size=12,
         axis_label_size=14,
         title='Total NZ Generation - July 2024',
@@ -161,14 +184,15 @@ def example_3_total():
     )
     
     # Create plot
-    fig, ax = create_line_plot(series, config)
+    fig, ax = create_line_plot(series, config, fig=fig)
     
     # Add features
     fill_under_curve(ax, x, y, color='#0066CC', alpha=0.15)
     add_boundary_lines(ax, x, linewidth=0.75)
     add_week_separators(ax, df, linewidth=2.5, center_labels=True, include_first=True)
-    plt.show()
-    save_plot(fig, 'clean_example3.png', dpi=300)
+    if INTERACTIVE:
+        plt.show()
+    save_plot(fig, 'clean_example3.png', dpi=SAVE_DPI)
     print("  ✓ Created clean_example3.png")
 
 
@@ -177,20 +201,31 @@ def example_3_total():
 # ============================================================================
 
 if __name__ == '__main__':
-    print("="*70)
-    print("TIME-SERIES EXAMPLES - CONSOLIDATED VERSION")
-    print("="*70)
-    print("\nThese examples demonstrate the final, clean time-series API:")
-    print("  - Boundary lines at start/end (thin dashed)")
-    print("  - Week separators (thick solid with centered labels)")
-    print("  - Fill under curve")
-    print("  - Multi-series support")
-    print("="*70)
-    
-    example_1_simple_clean()
-    example_2_comparison()
-    example_3_total()
-    
-    print("\n" + "="*70)
-    print("✓ All examples completed successfully!")
-    print("="*70)
+    sys.stdout.write('\n'.join([
+        "="*70,
+        "TIME-SERIES EXAMPLES - CONSOLIDATED VERSION",
+        "="*70,
+        "\nThese examples demonstrate the final, clean time-series API:",
+        "  - Boundary lines at start/end (thin dashed)",
+        "  - Week separators (thick solid with centered labels)",
+        "  - Fill under curve",
+        "  - Multi-series support",
+        "="*70,
+    ]) + '\n')
+    
+    # Batch runs draw every example into one reused Figure; interactive
+    # runs need a fresh one each time since plt.show() closes the window.
+    shared_fig = None if INTERACTIVE else plt.figure()
+    
+    example_1_simple_clean(shared_fig)
+    example_2_comparison(shared_fig)
+    example_3_total(shared_fig)
+    
+    if shared_fig is not None:
+        plt.close(shared_fig)
+    
+    sys.stdout.write('\n'.join([
+        "\n" + "="*70,
+        "✓ All examples completed successfully!",
+        "="*70,
+    ]) + '\n')
@@ -34,16 +34,32 @@ except Exception:  # pragma: no cover
 # ---------------------------------------------------------------------------
 # Core public API: renderers (stable)
 # ---------------------------------------------------------------------------
-from .core.line_plotter import create_line_plot
-from .core.histogram_plotter import create_histogram
-from .core.subplot_plotter import create_subplots
+# Renderers pull in matplotlib, so they are imported on first attribute
+# access (PEP 562). Code that only builds PlotConfig/SeriesConfig objects
+# never pays for the matplotlib import.
+_LAZY_ATTRS = {
+    "create_line_plot": (".core.line_plotter", "create_line_plot"),
+    "create_histogram": (".core.histogram_plotter", "create_histogram"),
+    "create_subplots": (".core.subplot_plotter", "create_subplots"),
+    "save_plot": (".utils", "save_plot"),
+}
 
-# Optional: expose save_plot if it exists somewhere in your codebase.
-# If you place it in src/pypsa_nza_plotter/utils.py, change the import accordingly.
-try:
-    from .utils import save_plot  # type: ignore
-except Exception:  # pragma: no cover
-    save_plot = None  # type: ignore
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 
 # ---------------------------------------------------------------------------
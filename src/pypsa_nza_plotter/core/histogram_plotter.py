@@ -26,26 +26,28 @@ Stacked:
 
 Custom bin edges:
     fig, ax = create_histogram(series, config, bins=[0, 10, 20, 30, 40, 50])
+
+Pre-split columns (SeriesBundle):
+    bundle = SeriesBundle(ys=[data1, data2], labels=['Group A', 'Group B'])
+    fig, ax = create_histogram(bundle, config, bins=20)
 """
 
 import matplotlib
 ##matplotlib.use('Agg')  # Commented for interactive  # Commented for interactive
 from matplotlib.figure import Figure
+from matplotlib.collections import PolyCollection
 from matplotlib import pyplot as plt
 import numpy as np
 from typing import List, Union, Tuple, Optional
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models.plot_config import PlotConfig
-from models.series_config import SeriesConfig
+from ..models.plot_config import PlotConfig
+from ..models.series_config import SeriesConfig
+from ..models.series_bundle import SeriesBundle
+from ..utils import as_plot_array, png_save_kwargs
 
 
 def create_histogram(
-    series: Union[SeriesConfig, List[SeriesConfig]],
+    series: Union[SeriesConfig, List[SeriesConfig], SeriesBundle],
     config: PlotConfig,
     bins: Union[int, List[float]] = 10,
     density: bool = False,
@@ -53,14 +55,17 @@ def create_histogram(
     cumulative: bool = False,
     orientation: str = 'vertical',
     bin_range: Optional[Tuple[float, float]] = None,
-    alpha: float = 0.7
+    alpha: float = 0.7,
+    fig: Optional[Figure] = None,
+    fast: bool = False
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
     Create histogram (frequency distribution).
     
     Args:
-        series: SeriesConfig or list of SeriesConfig objects
+        series: SeriesConfig, list of SeriesConfig objects, or a SeriesBundle
                 Note: For histograms, use .y for the data values
+                (SeriesBundle columns are passed to matplotlib as-is)
         config: PlotConfig for global settings
         bins: Number of bins (int) or explicit bin edges (list)
         density: If True, normalize to probability density
@@ -69,6 +74,12 @@ def create_histogram(
         orientation: 'vertical' or 'horizontal'
         bin_range: (min, max) tuple to limit histogram range
         alpha: Transparency (0-1, default 0.7 for overlapping)
+        fig: Optional existing Figure to draw into (cleared and resized to
+             the config) instead of creating a new one
+        fast: If True and there is a single non-stacked series, bin with
+              np.histogram and draw all bars as one PolyCollection instead of
+              one Rectangle per bin. Much cheaper for many bins, but
+              ax.patches is empty (the bars are in ax.collections)
     
     Returns:
         (fig, ax): Matplotlib figure and axes
@@ -89,157 +100,224 @@ def create_histogram(
         >>> # Density (normalized)
         >>> fig, ax = create_histogram(series, config, bins=20, density=True)
     """
-    # Normalize to list
-    if not isinstance(series, list):
-        series = [series]
+    # SeriesBundle already holds per-field columns
+    is_bundle = isinstance(series, SeriesBundle)
+    # A bare SeriesConfig (the common case) is unpacked directly below
+    is_single = not is_bundle and not isinstance(series, list)
     
     # Validate
-    if not series:
+    if not is_single and len(series) == 0:
         raise ValueError("Must provide at least one series")
     
-    # Create figure
-    fig = plt.figure(
-        figsize=(config.figure_width, config.figure_height),
-        dpi=config.dpi,
-        facecolor=config.figure_facecolor
-    )
+    # Create figure (or reuse the caller's)
+    if fig is None:
+        fig = plt.figure(
+            figsize=(config.figure_width, config.figure_height),
+            dpi=config.dpi,
+            facecolor=config.figure_facecolor
+        )
+    else:
+        fig.clear()
+        fig.set_size_inches(config.figure_width, config.figure_height)
+        fig.set_dpi(config.dpi)
+        fig.set_facecolor(config.figure_facecolor)
     
     ax = fig.add_subplot(111, facecolor=config.axes_facecolor)
     
-    # Extract data from series
-    data = [s.y for s in series]
-    colors = [s.color if s.color else None for s in series]
-    labels = [s.label if s.label else None for s in series]
-    edgecolors = [s.marker_edgecolor if s.marker_edgecolor else 'black' for s in series]
-    linewidths = [s.marker_edgewidth if s.marker_edgewidth else 0 for s in series]
-    hatches = [s.hatch if hasattr(s, 'hatch') and s.hatch else None for s in series]
+    if is_bundle:
+        data = [as_plot_array(y, config.data_dtype) for y in series.ys]
+        colors = series.colors
+        labels = series.labels
+        edgecolors = series.edgecolors
+        linewidths = series.linewidths
+        hatches = series.hatches
+    elif is_single:
+        # Single series: read the fields once, no list normalisation/loop
+        data = [as_plot_array(series.y, config.data_dtype)]
+        colors = [series.color or None]
+        labels = [series.label or None]
+        edgecolors = [series.marker_edgecolor or 'black']
+        linewidths = [series.marker_edgewidth or 0]
+        hatches = [series.hatch or None]
+    else:
+        # Extract data and styling from series in a single pass
+        # (hatch is a SeriesConfig field, so no hasattr check is needed)
+        data, colors, labels, edgecolors, linewidths, hatches = [], [], [], [], [], []
+        for s in series:
+            data.append(as_plot_array(s.y, config.data_dtype))
+            colors.append(s.color or None)
+            labels.append(s.label or None)
+            edgecolors.append(s.marker_edgecolor or 'black')
+            linewidths.append(s.marker_edgewidth or 0)
+            hatches.append(s.hatch or None)
     
-    # Create histogram
-    if orientation == 'vertical':
-        n, bins_out, patches = ax.hist(
-            data,
-            bins=bins,
-            range=bin_range,
-            density=density,
-            cumulative=cumulative,
-            histtype='bar' if not stacked else 'barstacked',
-            color=colors,
-            label=labels,
-            alpha=alpha,
-            edgecolor=edgecolors[0] if len(edgecolors) == 1 else 'black',
-            linewidth=linewidths[0] if len(linewidths) == 1 else 0.5,
-            stacked=stacked
-        )
-    else:  # horizontal
-        n, bins_out, patches = ax.hist(
-            data,
-            bins=bins,
-            range=bin_range,
-            density=density,
-            cumulative=cumulative,
-            histtype='bar' if not stacked else 'barstacked',
-            color=colors,
-            label=labels,
-            alpha=alpha,
-            edgecolor=edgecolors[0] if len(edgecolors) == 1 else 'black',
-            linewidth=linewidths[0] if len(linewidths) == 1 else 0.5,
-            stacked=stacked,
-            orientation='horizontal'
+    # Unset colours follow the property cycle and unset labels stay out of
+    # the legend (ax.hist rejects None colours and shows None as 'None')
+    has_labels = any(labels)
+    colors = [c if c is not None else f'C{i}' for i, c in enumerate(colors)]
+    labels = [label if label else '_nolegend_' for label in labels]
+    # Unset edge colours follow the series colour, as in SeriesConfig
+    edgecolors = [e if e is not None else c for e, c in zip(edgecolors, colors)]
+    
+    if fast and len(data) == 1 and not stacked:
+        # Single series: one PolyCollection instead of one Rectangle per bin
+        _draw_histogram_collection(
+            ax, data[0], bins, bin_range, density, cumulative, orientation,
+            color=colors[0], label=labels[0], edgecolor=edgecolors[0],
+            linewidth=linewidths[0], hatch=hatches[0], alpha=alpha
         )
+    else:
+        # Create histogram
+        if orientation == 'vertical':
+            n, bins_out, patches = ax.hist(
+                data,
+                bins=bins,
+                range=bin_range,
+                density=density,
+                cumulative=cumulative,
+                histtype='bar' if not stacked else 'barstacked',
+                color=colors,
+                label=labels,
+                alpha=alpha,
+                edgecolor=edgecolors[0] if len(edgecolors) == 1 else 'black',
+                linewidth=linewidths[0] if len(linewidths) == 1 else 0.5,
+                stacked=stacked
+            )
+        else:  # horizontal
+            n, bins_out, patches = ax.hist(
+                data,
+                bins=bins,
+                range=bin_range,
+                density=density,
+                cumulative=cumulative,
+                histtype='bar' if not stacked else 'barstacked',
+                color=colors,
+                label=labels,
+                alpha=alpha,
+                edgecolor=edgecolors[0] if len(edgecolors) == 1 else 'black',
+                linewidth=linewidths[0] if len(linewidths) == 1 else 0.5,
+                stacked=stacked,
+                orientation='horizontal'
+            )
     
-    # Apply hatch patterns if specified
-    # Note: matplotlib's hist doesn't support per-series hatching directly,
-    # so we apply it to the patch collections after creation
-    if hatches and any(hatches):
-        if stacked or len(series) == 1:
-            # For stacked or single histogram, patches is a list of BarContainer
-            for i, (hatch, patch_container) in enumerate(zip(hatches, patches if isinstance(patches, list) else [patches])):
-                if hatch:
-                    for patch in patch_container:
-                        patch.set_hatch(hatch)
-        else:
-            # For overlapping histograms
-            for i, (hatch, patch_container) in enumerate(zip(hatches, patches)):
+        # Apply hatch patterns if specified
+        # Note: matplotlib's hist doesn't support per-series hatching directly,
+        # so we apply it to the patch collections after creation
+        if any(hatches):
+            # A single series returns one BarContainer, several return a list
+            containers = patches if isinstance(patches, list) else [patches]
+            for hatch, patch_container in zip(hatches, containers):
                 if hatch:
-                    for patch in patch_container:
-                        patch.set_hatch(hatch)
+                    # One setp call per container instead of a per-patch loop
+                    plt.setp(patch_container.patches, hatch=hatch)
     
     # Apply global formatting
-    _apply_global_formatting(ax, config)
+    # Labels are known up front, so unlabeled histograms can skip the
+    # legend handle scan (which walks every bar patch)
+    _apply_global_formatting(ax, config, has_labels=has_labels)
     
     return fig, ax
 
 
-def _apply_global_formatting(ax: plt.Axes, config: PlotConfig) -> None:
+def _draw_histogram_collection(
+    ax: plt.Axes,
+    y: np.ndarray,
+    bins: Union[int, List[float]],
+    bin_range: Optional[Tuple[float, float]],
+    density: bool,
+    cumulative: bool,
+    orientation: str,
+    color: Optional[str],
+    label: Optional[str],
+    edgecolor: str,
+    linewidth: float,
+    hatch: Optional[str],
+    alpha: float
+) -> PolyCollection:
+    """
+    Draw a single-series histogram as one PolyCollection.
+    
+    Bar heights match ax.hist(histtype='bar') for one dataset.
+    """
+    counts, edges = np.histogram(y, bins=bins, range=bin_range, density=density)
+    if cumulative:
+        # Same as ax.hist: a cumulative density ends at 1
+        if density:
+            counts = counts * np.diff(edges)
+        counts = np.cumsum(counts)
+    
+    # (nbins, 4, 2) rectangle vertices, built in one shot
+    left, right = edges[:-1], edges[1:]
+    zero = np.zeros_like(counts, dtype=float)
+    verts = np.stack([
+        np.column_stack([left, zero]),
+        np.column_stack([left, counts]),
+        np.column_stack([right, counts]),
+        np.column_stack([right, zero]),
+    ], axis=1)
+    if orientation != 'vertical':
+        verts = verts[..., ::-1]
+    
+    collection = PolyCollection(
+        verts,
+        facecolors=color,
+        edgecolors=edgecolor,
+        linewidths=linewidth,
+        alpha=alpha,
+        label=label,
+        hatch=hatch
+    )
+    # Keep the count axis pinned at zero, like ax.hist
+    if orientation == 'vertical':
+        collection.sticky_edges.y.append(0)
+    else:
+        collection.sticky_edges.x.append(0)
+    
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def _apply_global_formatting(
+    ax: plt.Axes,
+    config: PlotConfig,
+    has_labels: bool = True
+) -> None:
     """
     Apply PlotConfig settings to axes (same as bar plotter).
     
-    This keeps formatting consistent across all plot types.
+    This keeps formatting consistent across all plot types. Pass
+    has_labels=False when no series carries a label to skip the legend.
     """
-    # Labels
+    # Labels (kwargs dicts are cached on the config)
     if config.x_label:
-        ax.set_xlabel(
-            config.x_label,
-            fontsize=config.x_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_xlabel(config.x_label, **config.x_label_kwargs())
     
     if config.y_label:
-        ax.set_ylabel(
-            config.y_label,
-            fontsize=config.y_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_ylabel(config.y_label, **config.y_label_kwargs())
     
     # Title
     if config.title:
-        title_kwargs = {
-            'fontsize': config.title_size,
-            'fontfamily': config.title_family,
-            'fontweight': config.title_weight,
-            'fontstyle': config.title_style,
-            'color': config.title_color
-        }
-        if config.title_pad is not None:
-            title_kwargs['pad'] = config.title_pad
-        ax.set_title(config.title, **title_kwargs)
+        ax.set_title(config.title, **config.title_kwargs())
     
     # Tick labels
-    x_tick_size = config.x_tick_label_size or config.tick_label_size
-    y_tick_size = config.y_tick_label_size or config.tick_label_size
+    ax.tick_params(axis='x', labelsize=config.effective_x_tick_label_size)
+    ax.tick_params(axis='y', labelsize=config.effective_y_tick_label_size)
     
-    ax.tick_params(axis='x', labelsize=x_tick_size)
-    ax.tick_params(axis='y', labelsize=y_tick_size)
-    
-    for label in ax.get_xticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
-    
-    for label in ax.get_yticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
+    # One batched update per axis instead of three setters per label
+    tick_label_props = config.tick_label_kwargs()
+    x_tick_labels = ax.get_xticklabels()
+    y_tick_labels = ax.get_yticklabels()
+    plt.setp(x_tick_labels, **tick_label_props)
+    plt.setp(y_tick_labels, **tick_label_props)
     
     # Grid
     if config.show_grid:
-        ax.grid(
-            True,
-            alpha=config.grid_alpha,
-            linestyle=config.grid_style,
-            linewidth=config.grid_linewidth,
-            color=config.grid_color
-        )
+        ax.grid(True, **config.grid_kwargs())
         ax.set_axisbelow(True)
     
     # Legend
-    if config.show_legend:
+    if config.show_legend and has_labels:
         # Check if there are any labeled artists before creating legend
         handles, labels = ax.get_legend_handles_labels()
         if handles and labels:
@@ -254,22 +332,28 @@ def _apply_global_formatting(ax: plt.Axes, config: PlotConfig) -> None:
                 for text in legend.get_texts():
                     text.set_fontweight(config.legend_font_weight)
     
-    # Spines
-    if not config.show_top_spine:
-        ax.spines['top'].set_visible(False)
-    if not config.show_right_spine:
-        ax.spines['right'].set_visible(False)
-    if not config.show_left_spine:
-        ax.spines['left'].set_visible(False)
-    if not config.show_bottom_spine:
-        ax.spines['bottom'].set_visible(False)
+    # Spines (rcParams can hide them on new axes, so compare both ways)
+    for name, visible in (
+        ('top', config.show_top_spine),
+        ('right', config.show_right_spine),
+        ('bottom', config.show_bottom_spine),
+        ('left', config.show_left_spine),
+    ):
+        spine = ax.spines[name]
+        if spine.get_visible() != visible:
+            spine.set_visible(visible)
     
     # Tight layout
     if config.tight_layout:
-        plt.tight_layout()
+        ax.figure.tight_layout()
 
 
-def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
+def save_plot(
+    fig: plt.Figure,
+    filename: str,
+    dpi: int = 300,
+    bbox_inches: Optional[str] = 'tight'
+) -> None:
     """
     Save figure to file.
     
@@ -277,6 +361,10 @@ def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
         fig: Matplotlib figure
         filename: Output filename
         dpi: Resolution (default: 300)
+        bbox_inches: Bounding box (default 'tight' crops to the drawn
+                     artists; None skips that extra draw pass and uses
+                     rcParams['savefig.bbox'])
     """
-    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    # Fast zlib level for PNG (shared with utils.save_plot)
+    fig.savefig(filename, dpi=dpi, bbox_inches=bbox_inches, **png_save_kwargs(filename))
     plt.close(fig)
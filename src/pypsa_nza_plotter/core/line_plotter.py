@@ -38,17 +38,15 @@ import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 from matplotlib.figure import Figure
 from matplotlib import pyplot as plt
-from matplotlib.font_manager import FontProperties
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from itertools import groupby
 import numpy as np
 from typing import List, Union, Tuple, Optional
-import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from models.plot_config import PlotConfig
-from models.series_config import SeriesConfig
+from ..models.plot_config import PlotConfig
+from ..models.series_config import SeriesConfig
+from ..utils import as_plot_array, get_font_props, save_plot as _utils_save_plot
 
 
 def create_line_plot(
@@ -57,7 +55,8 @@ def create_line_plot(
     subplot_layout: Tuple[int, int] = (1, 1),
     sharex: bool = False,
     sharey: bool = False,
-    subplot_titles: Optional[List[str]] = None
+    subplot_titles: Optional[List[str]] = None,
+    fig: Optional[Figure] = None
 ) -> Tuple[Figure, Union[plt.Axes, np.ndarray]]:
     """
     Create line/scatter plot(s) with full subplot support.
@@ -82,6 +81,9 @@ def create_line_plot(
         sharex: Share x-axis across subplots
         sharey: Share y-axis across subplots  
         subplot_titles: Optional list of titles for each subplot
+        fig: Optional existing Figure to draw into. It is cleared and resized
+             to the config, which avoids building a new Figure and canvas
+             when generating many plots in a row
     
     Returns:
         (fig, ax) if subplot_layout is (1, 1)
@@ -148,20 +150,33 @@ def create_line_plot(
         )
     
     # ========== Create Figure and Subplots ==========
-    fig, axes = plt.subplots(
-        rows, cols,
-        figsize=(config.figure_width, config.figure_height),
-        dpi=config.dpi,
-        sharex=sharex,
-        sharey=sharey
-    )
+    if fig is None:
+        fig, axes = plt.subplots(
+            rows, cols,
+            figsize=(config.figure_width, config.figure_height),
+            dpi=config.dpi,
+            sharex=sharex,
+            sharey=sharey,
+            subplot_kw={'facecolor': config.axes_facecolor}
+        )
+    else:
+        # Reuse the caller's figure (and its canvas)
+        fig.clear()
+        fig.set_size_inches(config.figure_width, config.figure_height)
+        fig.set_dpi(config.dpi)
+        axes = fig.subplots(
+            rows, cols,
+            sharex=sharex,
+            sharey=sharey,
+            subplot_kw={'facecolor': config.axes_facecolor}
+        )
     
     # Normalize axes to always be array (even for single subplot)
     if rows == 1 and cols == 1:
         axes = np.array([axes])
         return_single_ax = True
     else:
-        axes = np.array(axes).flatten()  # Flatten to 1D for easy iteration
+        axes = np.asarray(axes).ravel()  # 1D view for easy iteration (no copy)
         return_single_ax = False
     
     # Set figure background
@@ -169,31 +184,24 @@ def create_line_plot(
     
     # ========== Plot on Each Subplot ==========
     for idx, (ax, series_group) in enumerate(zip(axes, series_list)):
-        # Set axes background
-        ax.set_facecolor(config.axes_facecolor)
-        
         # Plot each series in this subplot
-        for series in series_group:
-            _plot_series_on_axes(ax, series)
+        _plot_series_group(
+            ax, series_group,
+            dtype=config.data_dtype,
+            downsample=config.auto_downsample
+        )
         
         # Apply global formatting to this subplot
         _apply_global_formatting(ax, config)
         
         # Apply subplot-specific title if provided
+        # (same cached kwargs as the main title, built once per config)
         if subplot_titles and idx < len(subplot_titles):
-            title_kwargs = {
-                'fontsize': config.title_size,
-                'fontfamily': config.title_family,
-                'fontweight': config.title_weight,
-                'fontstyle': config.title_style,
-                'color': config.title_color
-            }
-            if config.title_pad is not None:
-                title_kwargs['pad'] = config.title_pad
-            ax.set_title(subplot_titles[idx], **title_kwargs)
+            ax.set_title(subplot_titles[idx], **config.title_kwargs())
     
     # ========== Final Layout ==========
-    if config.tight_layout:
+    # Skipped when subplot_adjust below overrides everything it computes
+    if config.tight_layout_needed(rows, cols):
         fig.tight_layout()
     
     if config.subplot_adjust:
@@ -206,12 +214,103 @@ def create_line_plot(
         return fig, axes.reshape((rows, cols))  # Return array for multi-plot
 
 
-def _plot_series_on_axes(ax: plt.Axes, series: SeriesConfig):
+def _merge_key(series: SeriesConfig) -> Optional[tuple]:
+    """
+    Style key for series that can share one LineCollection, else None.
+    
+    Only plain lines qualify: unlabelled (no legend entry), no markers, no
+    fill, no explicit z-order, an explicit color and non-empty numeric data.
+    """
+    if (series.label or series.marker or series.fill_below
+            or series.z_order is not None or not series.line_style
+            or series.color is None or len(series.y) == 0):
+        return None
+    if series.x is not None and np.asarray(series.x).dtype.kind not in 'fiu':
+        return None
+    if np.asarray(series.y).dtype.kind not in 'fiu':
+        return None
+    return (series.color, series.line_style, series.line_width, series.line_alpha)
+
+
+def _plot_series_group(
+    ax: plt.Axes,
+    series_group: List[SeriesConfig],
+    dtype: Optional[str] = None,
+    downsample: bool = False
+):
+    """
+    Plot all series of one subplot.
+    
+    Consecutive plain-line series with the same (color, line_style,
+    line_width, line_alpha) are drawn as a single LineCollection instead of
+    one Line2D each, which is much cheaper to draw for plots with many
+    identically styled series. Everything else goes through
+    _plot_series_on_axes, and draw order is unchanged.
+    """
+    for key, run in groupby(series_group, key=_merge_key):
+        run = list(run)
+        if key is None or len(run) < 2:
+            for series in run:
+                _plot_series_on_axes(ax, series, dtype=dtype, downsample=downsample)
+            continue
+        
+        color, line_style, line_width, alpha = key
+        segments = []
+        for series in run:
+            x, y = _prepare_xy(ax, series, dtype, downsample)
+            if x is None:
+                x = np.arange(len(y))
+            segments.append(np.column_stack((x, y)))
+        
+        # Match what ax.plot would draw: Line2D's zorder and cap/join style
+        prefix = 'solid' if line_style in ('-', 'solid') else 'dash'
+        collection = LineCollection(
+            segments,
+            colors=color,
+            linestyles=line_style,
+            linewidths=line_width,
+            alpha=alpha,
+            zorder=Line2D.zorder,
+            capstyle=plt.rcParams[f'lines.{prefix}_capstyle'],
+            joinstyle=plt.rcParams[f'lines.{prefix}_joinstyle']
+        )
+        ax.add_collection(collection)
+        ax.autoscale_view()
+
+
+def _prepare_xy(
+    ax: plt.Axes,
+    series: SeriesConfig,
+    dtype: Optional[str],
+    downsample: bool
+):
+    """Convert series data to plot arrays, decimating if requested"""
+    # Only y takes the configured dtype. x keeps its own precision: epoch
+    # seconds or date numbers would lose their fine resolution in float32
+    x = series.x if series.x is None else np.asarray(series.x)
+    y = as_plot_array(series.y, dtype)
+    
+    if downsample and not series.marker and x is not None:
+        fig = ax.figure
+        columns = int(fig.get_size_inches()[0] * fig.dpi)
+        x, y = _downsample_m4(x, y, columns)
+    return x, y
+
+
+def _plot_series_on_axes(
+    ax: plt.Axes,
+    series: SeriesConfig,
+    dtype: Optional[str] = None,
+    downsample: bool = False
+):
     """
     Plot a single series on the given axes.
     
     This is where the actual plotting happens. It's separated into
-    its own function for clarity.
+    its own function for clarity. Numeric y data is converted to
+    ``dtype`` (see PlotConfig.data_dtype) first. With ``downsample``,
+    dense marker-less series are decimated to at most four points per
+    horizontal pixel (see PlotConfig.auto_downsample).
     
     This function implements the core insight:
     - Line and scatter are the same, just different styling
@@ -229,6 +328,11 @@ def _plot_series_on_axes(ax: plt.Axes, series: SeriesConfig):
             f"Must specify at least one."
         )
     
+    # Nothing to draw (e.g. a filtered-out series): skip the artist
+    # entirely, unless it is labelled and so still needs a legend entry
+    if len(series.y) == 0 and not series.label:
+        return
+    
     # Prepare plot arguments
     plot_kwargs = {
         'color': series.color,
@@ -258,11 +362,12 @@ def _plot_series_on_axes(ax: plt.Axes, series: SeriesConfig):
     if series.z_order is not None:
         plot_kwargs['zorder'] = series.z_order
     
-    line = ax.plot(series.x, series.y, **plot_kwargs)
+    x, y = _prepare_xy(ax, series, dtype, downsample)
+    line = ax.plot(x, y, **plot_kwargs)
     
     # ========== Area Fill ==========
     # Fill between curve and bottom of plot (if enabled)
-    if series.fill_below:
+    if series.fill_below and len(y):
         fill_kwargs = {
             'color': series.fill_color,
             'alpha': series.fill_alpha,
@@ -278,7 +383,44 @@ def _plot_series_on_axes(ax: plt.Axes, series: SeriesConfig):
             fill_kwargs['zorder'] = series.z_order - 0.5
         
         # Fill between curve and zero
-        ax.fill_between(series.x, series.y, 0, **fill_kwargs)
+        ax.fill_between(x, y, 0, **fill_kwargs)
+
+
+def _downsample_m4(
+    x: np.ndarray,
+    y: np.ndarray,
+    columns: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decimate (x, y) for a plot ``columns`` pixels wide (M4 aggregation).
+    
+    Points are split into one equal index bucket per pixel column and the
+    first, last, min and max of every bucket are kept, in their original
+    order. Drawn as a line this is visually identical to the full series
+    (spikes and the joins between columns survive) with at most 4 points
+    per column. The whole pass is vectorized, so no compiled kernel is
+    needed. Series with at most 4 points per column, or whose x is not
+    sorted ascending, are returned unchanged.
+    """
+    n = len(y)
+    if columns < 1 or n <= 4 * columns or x.dtype.kind not in 'fiu':
+        return x, y
+    if np.any(np.diff(x) < 0):
+        return x, y
+    
+    k = n // columns                     # points per bucket
+    m = columns * k                      # points covered by full buckets
+    blocks = y[:m].reshape(columns, k)
+    firsts = np.arange(0, m, k)
+    keep = np.concatenate((
+        firsts,
+        firsts + (k - 1),
+        firsts + blocks.argmin(axis=1),
+        firsts + blocks.argmax(axis=1),
+        np.arange(m, n),                 # leftover tail, kept as-is
+    ))
+    keep = np.unique(keep)               # sorted, duplicates removed
+    return x[keep], y[keep]
 
 
 def _apply_global_formatting(ax: plt.Axes, config: PlotConfig):
@@ -297,79 +439,66 @@ def _apply_global_formatting(ax: plt.Axes, config: PlotConfig):
     """
     
     # ========== Labels ==========
+    # Keyword dicts are built once per config (see PlotConfig.*_kwargs)
     if config.x_label:
-        ax.set_xlabel(
-            config.x_label,
-            fontsize=config.x_axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_xlabel(config.x_label, **config.x_label_kwargs())
     
     if config.y_label:
-        ax.set_ylabel(
-            config.y_label,
-            fontsize=config.y_axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_ylabel(config.y_label, **config.y_label_kwargs())
     
     if config.title:
-        title_kwargs = {
-            'fontsize': config.title_size,
-            'fontfamily': config.title_family,
-            'fontweight': config.title_weight,
-            'fontstyle': config.title_style,
-            'color': config.title_color
-        }
-        if config.title_pad is not None:
-            title_kwargs['pad'] = config.title_pad
-        ax.set_title(config.title, **title_kwargs)
+        ax.set_title(config.title, **config.title_kwargs())
     
     # ========== Text Sizing ==========
     # Tick label sizes
-    ax.tick_params(axis='x', labelsize=config.x_tick_label_size)
-    ax.tick_params(axis='y', labelsize=config.y_tick_label_size)
+    ax.tick_params(axis='x', labelsize=config.effective_x_tick_label_size)
+    ax.tick_params(axis='y', labelsize=config.effective_y_tick_label_size)
     
     # Tick label font properties
-    for label in ax.get_xticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
-    
-    for label in ax.get_yticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
+    # One batched update per axis instead of three setters per label
+    tick_label_props = config.tick_label_kwargs()
+    x_tick_labels = ax.get_xticklabels()
+    y_tick_labels = ax.get_yticklabels()
+    plt.setp(x_tick_labels, **tick_label_props)
+    plt.setp(y_tick_labels, **tick_label_props)
     
     # ========== Axes Configuration ==========
+    # Collected into one ax.set() call; setters that would only re-apply
+    # matplotlib's defaults are skipped (plan computed once per config).
+    # Insertion order matters: ax.set applies keys in order, so scales
+    # come before limits and ticks before tick labels.
+    plan = config.formatting_plan()
+    axes_kwargs = {}
+    
     # Scale
-    ax.set_xscale(config.x_scale)
-    ax.set_yscale(config.y_scale)
+    if plan['set_xscale']:
+        axes_kwargs['xscale'] = config.x_scale
+    if plan['set_yscale']:
+        axes_kwargs['yscale'] = config.y_scale
     
     # Limits
-    if config.x_limits:
-        ax.set_xlim(config.x_limits)
-    if config.y_limits:
-        ax.set_ylim(config.y_limits)
+    if plan['set_xlim']:
+        axes_kwargs['xlim'] = config.x_limits
+    if plan['set_ylim']:
+        axes_kwargs['ylim'] = config.y_limits
     
     # Custom ticks
     if config.x_ticks:
-        ax.set_xticks(config.x_ticks)
+        axes_kwargs['xticks'] = config.x_ticks
     if config.y_ticks:
-        ax.set_yticks(config.y_ticks)
+        axes_kwargs['yticks'] = config.y_ticks
     
     # Custom tick labels
     if config.x_tick_labels:
-        ax.set_xticklabels(config.x_tick_labels)
+        axes_kwargs['xticklabels'] = config.x_tick_labels
     if config.y_tick_labels:
-        ax.set_yticklabels(config.y_tick_labels)
+        axes_kwargs['yticklabels'] = config.y_tick_labels
+    
+    if axes_kwargs:
+        ax.set(**axes_kwargs)
     
     # Minor ticks
-    if config.show_minor_ticks:
+    if plan['minor_ticks']:
         ax.minorticks_on()
     
     # ========== Grid ==========
@@ -378,10 +507,7 @@ def _apply_global_formatting(ax: plt.Axes, config: PlotConfig):
             True,
             which=config.grid_which,
             axis=config.grid_axis,
-            alpha=config.grid_alpha,
-            linestyle=config.grid_style,
-            linewidth=config.grid_linewidth,
-            color=config.grid_color
+            **config.grid_kwargs()
         )
     
     # ========== Legend ==========
@@ -390,9 +516,9 @@ def _apply_global_formatting(ax: plt.Axes, config: PlotConfig):
         handles, labels = ax.get_legend_handles_labels()
         if handles and labels:
             # Create proper font properties object (Windows-compatible!)
-            font_props = FontProperties(
-                family=config.legend_font_family,
-                size=config.legend_font_size
+            font_props = get_font_props(
+                config.legend_font_family,
+                config.legend_font_size
             )
             
             ax.legend(
@@ -404,10 +530,17 @@ def _apply_global_formatting(ax: plt.Axes, config: PlotConfig):
             )
     
     # ========== Spines ==========
-    ax.spines['top'].set_visible(config.show_top_spine)
-    ax.spines['right'].set_visible(config.show_right_spine)
-    ax.spines['bottom'].set_visible(config.show_bottom_spine)
-    ax.spines['left'].set_visible(config.show_left_spine)
+    # rcParams can hide spines on new axes, so compare both ways;
+    # set_visible marks the axes stale even when nothing changes
+    for name, visible in (
+        ('top', config.show_top_spine),
+        ('right', config.show_right_spine),
+        ('bottom', config.show_bottom_spine),
+        ('left', config.show_left_spine),
+    ):
+        spine = ax.spines[name]
+        if spine.get_visible() != visible:
+            spine.set_visible(visible)
 
 
 # ========== Convenience Functions ==========
@@ -417,24 +550,34 @@ def save_plot(
     filepath: str,
     dpi: Optional[int] = None,
     transparent: bool = False,
-    bbox_inches: str = 'tight',
+    bbox_inches: Optional[str] = 'tight',
     **kwargs
 ):
     """
     Save figure to file.
     
+    Thin wrapper around utils.save_plot (the package-level save_plot), kept
+    for its positional signature and figure-dpi / rcParams padding defaults.
+    
     Args:
         fig: matplotlib Figure object
         filepath: Output path (.png, .pdf, .svg, .eps)
         dpi: Resolution (default: from figure)
         transparent: Transparent background
-        bbox_inches: Bounding box ('tight' removes whitespace)
+        bbox_inches: Bounding box ('tight' removes whitespace; pass None to
+                     skip the extra layout pass and use
+                     rcParams['savefig.bbox'])
         **kwargs: Additional arguments for fig.savefig()
     """
-    fig.savefig(
+    pad_inches = kwargs.pop('pad_inches', None)
+    if pad_inches is None:
+        pad_inches = plt.rcParams['savefig.pad_inches']
+    _utils_save_plot(
+        fig,
         filepath,
         dpi=dpi or fig.dpi,
         transparent=transparent,
         bbox_inches=bbox_inches,
+        pad_inches=pad_inches,
         **kwargs
     )
@@ -29,13 +29,39 @@ Mixed plot types:
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.gridspec import GridSpec
 import numpy as np
 from typing import Tuple, Optional, List
 
 from ..models.plot_config import PlotConfig
+from ..utils import get_font_props
 
 
+@lru_cache(maxsize=32)
+def _gridspec_ratios(
+    nrows: int,
+    ncols: int,
+    width_ratios: Optional[Tuple[float, ...]],
+    height_ratios: Optional[Tuple[float, ...]]
+) -> Tuple[Optional[Tuple[float, ...]], Optional[Tuple[float, ...]]]:
+    """
+    Validate and normalise the width/height ratios for a layout.
+    
+    Only these immutable tuples are cached; each figure gets its own
+    GridSpec, so later changes to one figure's grid cannot leak into others.
+    """
+    if width_ratios is not None and len(width_ratios) != ncols:
+        raise ValueError("width_ratios must have one entry per column")
+    if height_ratios is not None and len(height_ratios) != nrows:
+        raise ValueError("height_ratios must have one entry per row")
+    return (
+        tuple(float(r) for r in width_ratios) if width_ratios else None,
+        tuple(float(r) for r in height_ratios) if height_ratios else None
+    )
 
 
 def create_subplots(
@@ -49,11 +75,18 @@ def create_subplots(
     width_ratios: Optional[List[float]] = None,
     height_ratios: Optional[List[float]] = None,
     hspace: Optional[float] = None,
-    wspace: Optional[float] = None
+    wspace: Optional[float] = None,
+    fig: Optional[Figure] = None
 ) -> Tuple[plt.Figure, np.ndarray]:
     """
     Create a figure with multiple subplots in a grid layout.
     
+    Layout is applied last: fig.tight_layout() first (if config.tight_layout),
+    then fig.subplots_adjust() with config.subplot_adjust updated by hspace
+    and wspace. Explicit spacing therefore wins over tight_layout instead of
+    being overwritten by it, and tight_layout is skipped entirely when that
+    spacing pins every parameter it would compute.
+    
     Args:
         nrows: Number of rows (default 1)
         ncols: Number of columns (default 1)
@@ -64,8 +97,13 @@ def create_subplots(
         figure_title: Overall figure title (optional)
         width_ratios: Relative widths of columns (optional)
         height_ratios: Relative heights of rows (optional)
-        hspace: Height spacing between subplots (optional)
-        wspace: Width spacing between subplots (optional)
+        hspace: Height spacing between subplots (optional, overrides
+                config.subplot_adjust['hspace'])
+        wspace: Width spacing between subplots (optional, overrides
+                config.subplot_adjust['wspace'])
+        fig: Optional existing Figure to draw into. It is cleared and resized
+             to the config, which avoids building a new Figure and canvas
+             for every plot in batch jobs
     
     Returns:
         (fig, axes): Figure and axes array
@@ -98,34 +136,42 @@ def create_subplots(
         raise ValueError("nrows and ncols must be >= 1")
     
     # Create figure
-    fig = plt.figure(
-        figsize=(config.figure_width, config.figure_height),
-        dpi=config.dpi,
-        facecolor=config.figure_facecolor
-    )
+    if fig is None:
+        fig = plt.figure(
+            figsize=(config.figure_width, config.figure_height),
+            dpi=config.dpi,
+            facecolor=config.figure_facecolor
+        )
+    else:
+        # Reuse the caller's figure (and its canvas)
+        fig.clear()
+        fig.set_size_inches(config.figure_width, config.figure_height)
+        fig.set_dpi(config.dpi)
+        fig.set_facecolor(config.figure_facecolor)
     
     # Create subplots with gridspec
     if width_ratios or height_ratios:
-        from matplotlib.gridspec import GridSpec
+        gs_width_ratios, gs_height_ratios = _gridspec_ratios(
+            nrows, ncols,
+            tuple(width_ratios) if width_ratios else None,
+            tuple(height_ratios) if height_ratios else None
+        )
         gs = GridSpec(
             nrows, ncols,
             figure=fig,
-            width_ratios=width_ratios,
-            height_ratios=height_ratios,
+            width_ratios=gs_width_ratios,
+            height_ratios=gs_height_ratios,
             hspace=hspace,
             wspace=wspace
         )
         
-        # Create axes manually
-        axes = []
+        # Create axes manually, straight into a (nrows, ncols) object array
+        axes = np.empty((nrows, ncols), dtype=object)
         for i in range(nrows):
-            row = []
             for j in range(ncols):
-                ax = fig.add_subplot(gs[i, j])
-                ax.set_facecolor(config.axes_facecolor)
-                row.append(ax)
-            axes.append(row)
-        axes = np.array(axes)
+                axes[i, j] = fig.add_subplot(
+                    gs[i, j], facecolor=config.axes_facecolor
+                )
         
         # Handle axis sharing manually if needed
         if sharex:
@@ -137,31 +183,18 @@ def create_subplots(
                 for j in range(1, ncols):
                     axes[i, j].sharey(axes[i, 0])
     else:
-        # Use standard subplots
-        fig, axes = plt.subplots(
+        # Use standard subplots on the figure created above; the axes
+        # facecolor is set at construction time
+        axes = fig.subplots(
             nrows, ncols,
             sharex=sharex,
             sharey=sharey,
-            figsize=(config.figure_width, config.figure_height),
-            dpi=config.dpi,
-            facecolor=config.figure_facecolor
+            subplot_kw={'facecolor': config.axes_facecolor}
         )
-        
-        # Set axes facecolor
-        if nrows == 1 and ncols == 1:
-            axes.set_facecolor(config.axes_facecolor)
-        else:
-            axes_flat = axes.flatten() if hasattr(axes, 'flatten') else [axes]
-            for ax in axes_flat:
-                ax.set_facecolor(config.axes_facecolor)
-    
-    # Apply subplot spacing
-    if hspace is not None or wspace is not None:
-        plt.subplots_adjust(hspace=hspace, wspace=wspace)
     
     # Add subplot titles
     if subplot_titles:
-        axes_flat = axes.flatten() if hasattr(axes, 'flatten') else [axes]
+        axes_flat = axes.ravel() if hasattr(axes, 'ravel') else [axes]
         for i, (ax, title) in enumerate(zip(axes_flat, subplot_titles)):
             ax.set_title(
                 title,
@@ -182,9 +215,19 @@ def create_subplots(
             color=config.title_color
         )
     
-    # Apply tight layout if requested
-    if config.tight_layout:
-        plt.tight_layout()
+    # Layout: explicit spacing arguments take precedence over
+    # config.subplot_adjust and are applied after tight_layout, which is
+    # skipped when they override everything it computes
+    adjust = dict(config.subplot_adjust or {})
+    if hspace is not None:
+        adjust['hspace'] = hspace
+    if wspace is not None:
+        adjust['wspace'] = wspace
+    
+    if config.tight_layout_needed(nrows, ncols, adjust):
+        fig.tight_layout()
+    if adjust:
+        fig.subplots_adjust(**adjust)
     
     return fig, axes
 
@@ -211,74 +254,57 @@ def apply_subplot_formatting(
         >>> apply_subplot_formatting(axes[0,0], config)
         >>> apply_subplot_formatting(axes[0,1], config, hide_ylabel=True)
     """
-    # Labels
+    # Labels (sizes and kwargs are resolved once per config, not per axes)
     if not hide_xlabel and config.x_label:
-        ax.set_xlabel(
-            config.x_label,
-            fontsize=config.x_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_xlabel(config.x_label, **config.x_label_kwargs())
     
     if not hide_ylabel and config.y_label:
-        ax.set_ylabel(
-            config.y_label,
-            fontsize=config.y_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_ylabel(config.y_label, **config.y_label_kwargs())
     
     # Tick labels
-    x_tick_size = config.x_tick_label_size or config.tick_label_size
-    y_tick_size = config.y_tick_label_size or config.tick_label_size
-    
-    ax.tick_params(axis='x', labelsize=x_tick_size)
-    ax.tick_params(axis='y', labelsize=y_tick_size)
+    ax.tick_params(axis='x', labelsize=config.effective_x_tick_label_size)
+    ax.tick_params(axis='y', labelsize=config.effective_y_tick_label_size)
     
-    for label in ax.get_xticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
-    
-    for label in ax.get_yticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
+    # One batched update per axis instead of three setters per label
+    tick_label_props = config.tick_label_kwargs()
+    x_tick_labels = ax.get_xticklabels()
+    y_tick_labels = ax.get_yticklabels()
+    plt.setp(x_tick_labels, **tick_label_props)
+    plt.setp(y_tick_labels, **tick_label_props)
     
     # Grid
     if config.show_grid:
-        ax.grid(
-            True,
-            alpha=config.grid_alpha,
-            linestyle=config.grid_style,
-            linewidth=config.grid_linewidth,
-            color=config.grid_color
-        )
+        ax.grid(True, **config.grid_kwargs())
         ax.set_axisbelow(True)
     
-    # Spines
-    if not config.show_top_spine:
-        ax.spines['top'].set_visible(False)
-    if not config.show_right_spine:
-        ax.spines['right'].set_visible(False)
-    if not config.show_left_spine:
-        ax.spines['left'].set_visible(False)
-    if not config.show_bottom_spine:
-        ax.spines['bottom'].set_visible(False)
+    # Spines: the axes may already be styled, so compare before setting;
+    # set_visible marks the axes stale even when nothing changes
+    for name, visible in (
+        ('top', config.show_top_spine),
+        ('right', config.show_right_spine),
+        ('bottom', config.show_bottom_spine),
+        ('left', config.show_left_spine),
+    ):
+        spine = ax.spines[name]
+        if spine.get_visible() != visible:
+            spine.set_visible(visible)
     
-    # Legend
+    # Legend (only when something is labelled; an empty legend is still
+    # a full artist scan plus a frame)
     if config.show_legend:
-        ax.legend(
-            loc=config.legend_location,
-            fontsize=config.legend_fontsize,
-            frameon=config.legend_frameon,
-            framealpha=config.legend_framealpha,
-            edgecolor=config.legend_edgecolor
-        )
+        handles, labels = ax.get_legend_handles_labels()
+        if handles:
+            ax.legend(
+                handles, labels,
+                loc=config.legend_location,
+                frameon=config.legend_frameon,
+                framealpha=config.legend_framealpha,
+                shadow=config.legend_shadow,
+                prop=get_font_props(
+                    config.legend_font_family,
+                    config.legend_font_size
+                )
+            )
 
 
 def add_subplot_labels(
@@ -308,14 +334,14 @@ def add_subplot_labels(
         >>> # Or custom labels:
         >>> add_subplot_labels(fig, axes, labels=['A', 'B', 'C', 'D'])
     """
+    axes_flat = axes.ravel() if hasattr(axes, 'ravel') else [axes]
+    
     # Generate default labels if not provided
     if labels is None:
-        axes_flat = axes.flatten() if hasattr(axes, 'flatten') else [axes]
         n_subplots = len(axes_flat)
         labels = [f'({chr(97 + i)})' for i in range(n_subplots)]  # (a), (b), (c), ...
     
     # Add labels to each subplot
-    axes_flat = axes.flatten() if hasattr(axes, 'flatten') else [axes]
     for ax, label in zip(axes_flat, labels):
         ax.text(
             offset[0], offset[1],
@@ -7,11 +7,11 @@ from pathlib import Path
 
 import matplotlib
 matplotlib.use("Agg")  # headless-safe (CI/reviewers)
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
 
 import numpy as np
 
-from pypsa_nza_plotter import PlotConfig, SeriesConfig, create_line_plot, create_histogram, save_plot
-
 from pypsa_nza_plotter import (
     PlotConfig,
     SeriesConfig,
@@ -22,7 +22,7 @@ from pypsa_nza_plotter import (
 )
 
 
-def demo_line(outdir: Path) -> Path:
+def demo_line(fig: Figure, outdir: Path) -> Path:
     x = np.linspace(0, 1, 400)
     y = np.sin(2 * np.pi * x)
 
@@ -35,14 +35,14 @@ def demo_line(outdir: Path) -> Path:
     s = SeriesConfig(x=x, y=y, label="sin", color="#0066CC")
 
     # One subplot containing one (or many) series => list-of-lists form
-    fig, ax = create_line_plot([[s]], cfg)
+    fig, ax = create_line_plot([[s]], cfg, fig=fig)
 
     out = outdir / "demo_line.png"
     save_plot(fig, out, dpi=300)
     return out
 
 
-def demo_histogram(outdir: Path) -> Path:
+def demo_histogram(fig: Figure, outdir: Path) -> Path:
     rng = np.random.default_rng(0)
     data = rng.normal(loc=0.0, scale=1.0, size=2000)
 
@@ -57,13 +57,13 @@ def demo_histogram(outdir: Path) -> Path:
 
     # Many of your plotters use list-of-lists input normalisation patterns.
     # Histogram_plotter expects an iterable of SeriesConfig -> pass [s].
-    fig, ax = create_histogram([s], cfg)
+    fig, ax = create_histogram([s], cfg, fig=fig)
 
     out = outdir / "demo_histogram.png"
     save_plot(fig, out, dpi=300)
     return out
 
-def demo_subplots(outdir: Path) -> Path:
+def demo_subplots(fig: Figure, outdir: Path) -> Path:
     x = np.linspace(0, 1, 200)
 
     cfg = PlotConfig(
@@ -72,7 +72,9 @@ def demo_subplots(outdir: Path) -> Path:
         y_label="y",
     )
 
-    fig, axes = create_subplots(2, 1, cfg, sharex=True, subplot_titles=["sin", "cos"])
+    fig, axes = create_subplots(
+        2, 1, cfg, sharex=True, subplot_titles=["sin", "cos"], fig=fig
+    )
 
     axes[0].plot(x, np.sin(2 * np.pi * x))
     axes[1].plot(x, np.cos(2 * np.pi * x))
@@ -98,10 +100,15 @@ def main() -> None:
     outdir = Path(args.outdir).resolve()
     outdir.mkdir(parents=True, exist_ok=True)
 
+    # One Figure (and Agg canvas) shared by all demos; each plotter clears
+    # and resizes it, so nothing is reallocated between plots
+    fig = plt.figure()
+
     created = []
-    created.append(demo_line(outdir))
-    created.append(demo_histogram(outdir))
-    created.append(demo_subplots(outdir))
+    created.append(demo_line(fig, outdir))
+    created.append(demo_histogram(fig, outdir))
+    created.append(demo_subplots(fig, outdir))
+    plt.close(fig)
 
 
     print("\nDemo figures created:")
@@ -30,7 +30,7 @@ from matplotlib.figure import Figure
 from matplotlib import pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import numpy as np
-from typing import Tuple, Optional, List, Union
+from typing import Callable, Tuple, Optional, List, Union
 import sys
 import os
 
@@ -38,6 +38,11 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.plot_config import PlotConfig
+from ..utils import png_save_kwargs
+from ..extras._surface_common import (
+    _SURFACE_FUNCTIONS, _add_fast_surface, _evaluate_sparse, _grid_vectors, _meshgrid,
+    _stride_grid
+)
 
 
 def create_surface_plot(
@@ -52,13 +57,17 @@ def create_surface_plot(
     linewidth: float = 0.0,
     cbar: bool = True,
     cbar_label: Optional[str] = None,
+    cbar_ticks: Optional[int] = None,
     elev: float = 30,
     azim: float = -60,
     stride: int = 1,
     antialiased: bool = True,
     shade: bool = True,
     vmin: Optional[float] = None,
-    vmax: Optional[float] = None
+    vmax: Optional[float] = None,
+    dtype: Optional[np.dtype] = None,
+    validate: bool = True,
+    fast: bool = False
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
     Create 3D surface plot for 3D function visualization.
@@ -75,6 +84,9 @@ def create_surface_plot(
         linewidth: Width of edges (default 0.0)
         cbar: Show color bar (default True)
         cbar_label: Label for color bar (optional)
+        cbar_ticks: Number of evenly spaced color bar ticks. Fixes the tick
+                    positions instead of running the adaptive tick locator
+                    (optional; default None = automatic ticks)
         elev: Elevation viewing angle in degrees (default 30)
         azim: Azimuth viewing angle in degrees (default -60)
         stride: Stride for surface sampling (default 1)
@@ -82,6 +94,14 @@ def create_surface_plot(
         shade: Use shading (default True)
         vmin: Minimum value for colormap (optional)
         vmax: Maximum value for colormap (optional)
+        dtype: Cast X, Y, Z to this dtype before plotting, e.g. np.float32
+               to halve the memory touched by the polygon depth-sort (optional)
+        validate: Check that X, Y and Z have the same shape (default True).
+                  Callers that build all three from one grid can skip it
+        fast: Draw the surface as a single re-projected QuadMesh instead of
+              plot_surface's per-cell 3D polygons. Much faster for large
+              grids; intended for single-valued z = f(x, y) surfaces.
+              Ignores shade (default False)
     
     Returns:
         (fig, ax): Matplotlib figure and 3D axes
@@ -105,7 +125,7 @@ def create_surface_plot(
         config = PlotConfig()
     
     # Validate data
-    if X.shape != Y.shape or X.shape != Z.shape:
+    if validate and (X.shape != Y.shape or X.shape != Z.shape):
         raise ValueError("X, Y, and Z must have the same shape")
     
     # Validate plot type
@@ -113,6 +133,12 @@ def create_surface_plot(
     if plot_type not in valid_types:
         raise ValueError(f"plot_type must be one of {valid_types}")
     
+    # Optional down-cast (no copy if already the requested dtype)
+    if dtype is not None:
+        X = np.asarray(X, dtype=dtype)
+        Y = np.asarray(Y, dtype=dtype)
+        Z = np.asarray(Z, dtype=dtype)
+    
     # Create figure with 3D projection
     fig = plt.figure(
         figsize=(config.figure_width, config.figure_height),
@@ -125,19 +151,33 @@ def create_surface_plot(
     # Create plot based on type
     surf = None
     if plot_type == 'surface':
-        surf = ax.plot_surface(
-            X, Y, Z,
-            cmap=cmap,
-            alpha=alpha,
-            edgecolor=edgecolor,
-            linewidth=linewidth,
-            rstride=stride,
-            cstride=stride,
-            antialiased=antialiased,
-            shade=shade,
-            vmin=vmin,
-            vmax=vmax
-        )
+        Xs, Ys, Zs = X, Y, Z
+        if stride > 1:
+            # Subsample up front (see _stride_grid)
+            Xs, Ys, Zs = _stride_grid((X, Y, Z), stride, stride)
+        if fast:
+            surf = _add_fast_surface(
+                ax, Xs, Ys, Zs, vmin, vmax,
+                cmap=cmap,
+                alpha=alpha,
+                edgecolor=edgecolor,
+                linewidth=linewidth,
+                antialiased=antialiased
+            )
+        else:
+            surf = ax.plot_surface(
+                Xs, Ys, Zs,
+                cmap=cmap,
+                alpha=alpha,
+                edgecolor=edgecolor,
+                linewidth=linewidth,
+                rstride=1,
+                cstride=1,
+                antialiased=antialiased,
+                shade=shade,
+                vmin=vmin,
+                vmax=vmax
+            )
     elif plot_type == 'wireframe':
         surf = ax.plot_wireframe(
             X, Y, Z,
@@ -147,10 +187,17 @@ def create_surface_plot(
             alpha=alpha
         )
     elif plot_type == 'contour3d':
+        # With a pinned color range, use fixed levels across it so animation
+        # frames share levels; otherwise let matplotlib pick 20 nice levels
+        levels = 20
+        if vmin is not None and vmax is not None:
+            levels = np.linspace(vmin, vmax, 20)
         surf = ax.contour3D(
             X, Y, Z,
-            levels=20,
+            levels=levels,
             cmap=cmap,
+            vmin=vmin,
+            vmax=vmax,
             linewidth=linewidth if linewidth > 0 else 1.0,
             alpha=alpha
         )
@@ -160,7 +207,12 @@ def create_surface_plot(
     
     # Add color bar (for surface and contour3d)
     if cbar and surf is not None and plot_type in ['surface', 'contour3d']:
-        cbar_obj = fig.colorbar(surf, ax=ax, shrink=0.5, aspect=5)
+        cbar_ticks_arr = None
+        if cbar_ticks:
+            # Evenly spaced fixed ticks over the mappable's color limits
+            surf.autoscale_None()
+            cbar_ticks_arr = np.linspace(surf.norm.vmin, surf.norm.vmax, cbar_ticks)
+        cbar_obj = fig.colorbar(surf, ax=ax, shrink=0.5, aspect=5, ticks=cbar_ticks_arr)
         if cbar_label:
             cbar_obj.set_label(cbar_label, fontsize=config.axis_label_size)
     
@@ -170,24 +222,36 @@ def create_surface_plot(
     return fig, ax
 
 
+# ========== Built-in Surfaces ==========
 def create_surface_from_function(
-    func,
+    func: Union[Callable, str],
     x_range: Tuple[float, float],
     y_range: Tuple[float, float],
     config: Optional[PlotConfig] = None,
     resolution: int = 50,
+    sparse: bool = True,
     **kwargs
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
     Convenience function to create 3D surface plot from a function.
     
     Args:
-        func: Function that takes (x, y) and returns z
+        func: Function that takes (x, y) and returns z, or the name of a
+              built-in surface: 'radial_sin', 'gaussian' or 'saddle'
         x_range: (x_min, x_max) tuple
         y_range: (y_min, y_max) tuple
         config: PlotConfig (optional)
         resolution: Number of points in each direction (default 50)
-        **kwargs: Additional arguments passed to create_surface_plot
+        sparse: Call func with a row vector x and a column vector y and let
+                NumPy broadcast, instead of two full meshgrid arrays. Falls
+                back to meshgrid only if func raises a shape ValueError or
+                returns the wrong shape; other errors propagate (default True).
+                func gets writable copies of the vectors, but the fallback
+                meshgrid arrays are cached and read-only, so a func that
+                does not broadcast must not modify its arguments in place
+        **kwargs: Additional arguments passed to create_surface_plot. A
+                  ``dtype`` there also sets the grid dtype, so evaluating
+                  func never promotes float32 back to float64
     
     Returns:
         (fig, ax): Matplotlib figure and 3D axes
@@ -198,11 +262,35 @@ def create_surface_from_function(
         >>> fig, ax = create_surface_from_function(
         ...     my_function, (-5, 5), (-5, 5), config
         ... )
+        
+        >>> # Built-in surface by name
+        >>> fig, ax = create_surface_from_function('gaussian', (-2, 2), (-2, 2))
     """
+    if isinstance(func, str):
+        if func not in _SURFACE_FUNCTIONS:
+            raise ValueError(
+                f"Unknown surface '{func}'. "
+                f"Choose from: {', '.join(_SURFACE_FUNCTIONS)}"
+            )
+        func = _SURFACE_FUNCTIONS[func]
+    
+    # Grids are cached per domain (see _grid_vectors / _meshgrid)
+    grid_key = (tuple(x_range), tuple(y_range), resolution, kwargs.get('dtype'))
+    
+    # Sparse grid: x as (1, n), y as (n, 1). Broadcasting inside func yields
+    # the same Z as a meshgrid without allocating the two n×n coordinate
+    # arrays; X and Y are passed on as read-only broadcast views
+    if sparse:
+        x_row, y_col = _grid_vectors(*grid_key)
+        Z = _evaluate_sparse(func, x_row, y_col)
+        if Z is not None:
+            # Shapes are consistent by construction; skip re-validation
+            X, Y = np.broadcast_arrays(x_row, y_col)
+            kwargs.setdefault('validate', False)
+            return create_surface_plot(X, Y, Z, config, **kwargs)
+    
     # Create meshgrid
-    x = np.linspace(x_range[0], x_range[1], resolution)
-    y = np.linspace(y_range[0], y_range[1], resolution)
-    X, Y = np.meshgrid(x, y)
+    X, Y = _meshgrid(*grid_key)
     
     # Evaluate function
     Z = func(X, Y)
@@ -216,54 +304,25 @@ def _apply_global_formatting(ax: Axes3D, config: PlotConfig) -> None:
     Apply PlotConfig settings to 3D axes.
     """
     # Labels
+    # Label/title/grid kwargs are resolved once per config and cached on it
     if config.x_label:
-        ax.set_xlabel(
-            config.x_label,
-            fontsize=config.x_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_xlabel(config.x_label, **config.x_label_kwargs())
     
     if config.y_label:
-        ax.set_ylabel(
-            config.y_label,
-            fontsize=config.y_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_ylabel(config.y_label, **config.y_label_kwargs())
     
     # Z label (3D specific)
     z_label = getattr(config, 'z_label', 'Z')
     if z_label:
-        ax.set_zlabel(
-            z_label,
-            fontsize=config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_zlabel(z_label, **config.z_label_kwargs())
     
     # Title
     if config.title:
-        title_kwargs = {
-            'fontsize': config.title_size,
-            'fontfamily': config.title_family,
-            'fontweight': config.title_weight,
-            'fontstyle': config.title_style,
-            'color': config.title_color
-        }
-        if config.title_pad is not None:
-            title_kwargs['pad'] = config.title_pad
-        ax.set_title(config.title, **title_kwargs)
+        ax.set_title(config.title, **config.title_kwargs())
     
     # Tick labels
-    x_tick_size = config.x_tick_label_size or config.tick_label_size
-    y_tick_size = config.y_tick_label_size or config.tick_label_size
+    x_tick_size = config.effective_x_tick_label_size
+    y_tick_size = config.effective_y_tick_label_size
     z_tick_size = config.tick_label_size
     
     ax.tick_params(axis='x', labelsize=x_tick_size)
@@ -272,20 +331,24 @@ def _apply_global_formatting(ax: Axes3D, config: PlotConfig) -> None:
     
     # Grid
     if config.show_grid:
-        ax.grid(
-            True,
-            alpha=config.grid_alpha,
-            linestyle=config.grid_style,
-            linewidth=config.grid_linewidth,
-            color=config.grid_color
-        )
+        ax.grid(True, **config.grid_kwargs())
     
-    # Tight layout
+    # Tight layout: installed as the figure's layout engine, which runs once
+    # per draw with the final artists instead of an extra pass here
     if config.tight_layout:
-        plt.tight_layout()
+        if hasattr(ax.figure, 'set_layout_engine'):
+            ax.figure.set_layout_engine('tight')
+        else:
+            # matplotlib < 3.6 has no layout engines: one pass now
+            ax.figure.tight_layout()
 
 
-def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
+def save_plot(
+    fig: plt.Figure,
+    filename: str,
+    dpi: int = 300,
+    bbox_inches: Optional[str] = 'tight'
+) -> None:
     """
     Save figure to file.
     
@@ -293,6 +356,10 @@ def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
         fig: Matplotlib figure
         filename: Output filename
         dpi: Resolution (default: 300)
+        bbox_inches: Bounding box (default 'tight' crops to the drawn
+                     artists; None skips that extra draw pass and uses
+                     rcParams['savefig.bbox'])
     """
-    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    # Fast zlib level for PNG (shared with utils.save_plot)
+    fig.savefig(filename, dpi=dpi, bbox_inches=bbox_inches, **png_save_kwargs(filename))
     plt.close(fig)
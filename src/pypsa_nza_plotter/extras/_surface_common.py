@@ -0,0 +1,169 @@
+"""
+Shared Surface Helpers
+
+Grid construction, built-in test surfaces and the QuadMesh fast path used
+by both surface plotters (extras.surface_plotter and
+experimental.surface3d_plotter).
+"""
+
+from matplotlib.collections import QuadMesh
+from mpl_toolkits.mplot3d import Axes3D, proj3d
+import numpy as np
+from functools import lru_cache
+from typing import Tuple, Optional
+
+
+# Common test surfaces for create_surface_from_function(func='<name>').
+# Each evaluates on a broadcast grid with one n×n buffer and in-place
+# ufuncs, so no full-size temporaries are allocated per operation.
+
+def _radial_sin(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """sin(sqrt(x² + y²))"""
+    z = np.add(x * x, y * y)
+    np.sqrt(z, out=z)
+    np.sin(z, out=z)
+    return z
+
+
+def _gaussian(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """exp(-(x² + y²))"""
+    z = np.add(x * x, y * y)
+    np.negative(z, out=z)
+    np.exp(z, out=z)
+    return z
+
+
+def _saddle(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """x² - y²"""
+    return np.subtract(x * x, y * y)
+
+
+_SURFACE_FUNCTIONS = {
+    'radial_sin': _radial_sin,
+    'gaussian': _gaussian,
+    'saddle': _saddle,
+}
+
+
+@lru_cache(maxsize=16)
+def _grid_vectors(
+    x_range: Tuple[float, float],
+    y_range: Tuple[float, float],
+    resolution: int,
+    dtype
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sparse grid for a domain: x as a (1, n) row, y as an (n, 1) column.
+    
+    Cached so animation frames over the same domain reuse the arrays;
+    read-only because they are shared between calls.
+    """
+    x = np.linspace(x_range[0], x_range[1], resolution, dtype=dtype)[np.newaxis, :]
+    y = np.linspace(y_range[0], y_range[1], resolution, dtype=dtype)[:, np.newaxis]
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y
+
+
+@lru_cache(maxsize=16)
+def _meshgrid(
+    x_range: Tuple[float, float],
+    y_range: Tuple[float, float],
+    resolution: int,
+    dtype
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Full (read-only, cached) meshgrid for funcs that do not broadcast"""
+    x_row, y_col = _grid_vectors(x_range, y_range, resolution, dtype)
+    X, Y = np.meshgrid(x_row.ravel(), y_col.ravel())
+    X.setflags(write=False)
+    Y.setflags(write=False)
+    return X, Y
+
+
+def _evaluate_sparse(
+    func,
+    x_row: np.ndarray,
+    y_col: np.ndarray
+) -> Optional[np.ndarray]:
+    """
+    Evaluate func on a sparse grid: x as a (1, n) row, y as an (m, 1) column.
+    
+    Returns Z of shape (m, n), or None when func does not broadcast (it
+    raises a shape ValueError or returns another shape), in which case the
+    caller falls back to a full meshgrid. Any other exception propagates.
+    func gets its own writable copies of the (cached, read-only) vectors,
+    so in-place arithmetic on its arguments works.
+    """
+    try:
+        Z = np.asarray(func(x_row.copy(), y_col.copy()))
+    except ValueError:
+        return None
+    if Z.shape != (y_col.shape[0], x_row.shape[1]):
+        return None
+    return Z
+
+
+def _stride_grid(
+    arrays: Tuple[np.ndarray, ...],
+    rstride: int,
+    cstride: int
+) -> Tuple[np.ndarray, ...]:
+    """
+    Subsample 2D grids the way plot_surface's rstride/cstride do.
+    
+    Every rstride-th row and cstride-th column is kept, plus the last row
+    and column, so the surface still spans the full grid. Passing the
+    result with rstride=cstride=1 skips plot_surface's generic strided
+    polygon construction, which is far slower on large grids.
+    """
+    rows, cols = arrays[0].shape
+    r_idx = np.r_[0:rows - 1:rstride, rows - 1]
+    c_idx = np.r_[0:cols - 1:cstride, cols - 1]
+    grid = np.ix_(r_idx, c_idx)
+    return tuple(np.asarray(a)[grid] for a in arrays)
+
+
+class _ProjectedQuadMesh(QuadMesh):
+    """
+    Flat-colored z = f(x, y) surface drawn as one 2D QuadMesh on 3D axes.
+    
+    plot_surface builds one Poly3DCollection polygon per cell and depth-sorts
+    them on every draw. For a single-valued height field it is enough to
+    re-project the grid nodes and draw the cells back-to-front in grid order
+    (rows/columns flipped so the corner farthest from the viewer is first),
+    which QuadMesh renders in one pass. Re-projection happens in
+    do_3d_projection, which Axes3D calls on every draw, so rotating the
+    view keeps working. No lighting/shading is applied.
+    """
+    
+    def __init__(self, X: np.ndarray, Y: np.ndarray, Z: np.ndarray, **kwargs):
+        super().__init__(np.zeros(Z.shape + (2,)), **kwargs)
+        self._xyz = (np.ravel(X), np.ravel(Y), np.ravel(Z))
+        self._grid_shape = Z.shape
+        # One color value per cell: the corner average, as plot_surface uses
+        self._cell_values = 0.25 * (Z[:-1, :-1] + Z[1:, :-1] + Z[:-1, 1:] + Z[1:, 1:])
+        self.set_array(self._cell_values)
+    
+    def do_3d_projection(self) -> float:
+        txs, tys, tzs = proj3d.proj_transform(*self._xyz, self.axes.M)
+        depth = tzs.reshape(self._grid_shape)
+        rows = slice(None, None, -1) if depth[0, 0] < depth[-1, 0] else slice(None)
+        cols = slice(None, None, -1) if depth[0, 0] < depth[0, -1] else slice(None)
+        # get_coordinates() returns the mesh's own node array; fill it in place
+        coords = self.get_coordinates()
+        coords[..., 0] = txs.reshape(self._grid_shape)[rows, cols]
+        coords[..., 1] = tys.reshape(self._grid_shape)[rows, cols]
+        self.set_array(self._cell_values[rows, cols])
+        return np.min(tzs)
+
+
+def _add_fast_surface(ax: Axes3D, X: np.ndarray, Y: np.ndarray, Z: np.ndarray,
+                      vmin: Optional[float], vmax: Optional[float],
+                      **kwargs) -> _ProjectedQuadMesh:
+    """Add a _ProjectedQuadMesh surface to ax and autoscale like plot_surface"""
+    had_data = ax.has_data()
+    mesh = _ProjectedQuadMesh(X, Y, Z, **kwargs)
+    mesh.set_clim(vmin, vmax)
+    ax.add_collection(mesh, autolim=False)
+    ax.auto_scale_xyz(X, Y, Z, had_data)
+    return mesh
@@ -31,6 +31,10 @@ import matplotlib
 ##matplotlib.use('Agg')  # Commented for interactive  # Commented for interactive
 from matplotlib.figure import Figure
 from matplotlib import pyplot as plt
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.lines import Line2D
+from matplotlib.colors import to_rgba, to_rgba_array
+from functools import lru_cache
 import numpy as np
 from typing import List, Union, Tuple, Optional
 import sys
@@ -41,6 +45,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.plot_config import PlotConfig
 from models.series_config import SeriesConfig
+from ..utils import png_save_kwargs
 
 
 def create_area_plot(
@@ -134,15 +139,19 @@ def create_area_plot(
 
 def _create_single_areas(ax, series, baseline, alpha, show_line):
     """Create single or overlapping area fills"""
+    if _can_bulk_draw_areas(series):
+        _create_single_areas_bulk(ax, series, baseline, alpha, show_line)
+        return
+    
     for s in series:
         # Get customization from SeriesConfig
         fill_color = s.color if s.color else '#0066CC'
-        line_color = s.line_color if hasattr(s, 'line_color') and s.line_color else fill_color
+        line_color = s.line_color or fill_color
         line_style = s.line_style if s.line_style else '-'
         line_width = s.line_width if s.line_width else 1.5
         edge_color = s.marker_edgecolor if s.marker_edgecolor else None
         edge_width = s.marker_edgewidth if s.marker_edgewidth else 0
-        hatch = s.hatch if hasattr(s, 'hatch') and s.hatch else None
+        hatch = s.hatch or None
         label = s.label if s.label else None
         
         # Fill area
@@ -167,20 +176,116 @@ def _create_single_areas(ax, series, baseline, alpha, show_line):
             )
 
 
+def _can_bulk_draw_areas(series) -> bool:
+    """
+    Whether overlapping areas can be drawn as one PolyCollection.
+    
+    Needs several unlabelled series (a collection has a single legend
+    entry) on one shared x with finite data (fill_between splits polygons
+    at NaNs), one line style (a collection has one cap style), no hatch
+    and no edge width without an explicit edge color (fill_between derives
+    hatch and default edge colors in version-specific ways).
+    """
+    if len(series) < 2 or any(s.label for s in series):
+        return False
+    if len({s.line_style or '-' for s in series}) != 1:
+        return False
+    if any(s.hatch or (s.marker_edgewidth and not s.marker_edgecolor) for s in series):
+        return False
+    x = np.asarray(series[0].x)
+    if x.dtype.kind not in 'fiu' or not np.isfinite(x).all():
+        return False
+    for s in series:
+        if not (s.x is series[0].x or np.array_equal(s.x, x)):
+            return False
+        y = np.asarray(s.y)
+        if y.shape != x.shape or y.dtype.kind not in 'fiu' or not np.isfinite(y).all():
+            return False
+    return True
+
+
+def _create_single_areas_bulk(ax, series, baseline, alpha, show_line):
+    """
+    Draw overlapping areas as one PolyCollection plus one LineCollection.
+    
+    Same output as the per-series fill_between/plot loop in
+    _create_single_areas, with two artists instead of 2 * len(series).
+    """
+    x = np.asarray(series[0].x, dtype=float)
+    ys = np.stack([np.asarray(s.y, dtype=float) for s in series])   # (n_series, n_x)
+    n_series, n_x = ys.shape
+    
+    # Polygon per series: along the curve, then back along the baseline
+    verts = np.empty((n_series, 2 * n_x, 2))
+    verts[:, :n_x, 0] = x
+    verts[:, :n_x, 1] = ys
+    verts[:, n_x:, 0] = x[::-1]
+    verts[:, n_x:, 1] = baseline
+    
+    # Colors resolved in one batch; edges and lines reuse the fill rows
+    fill_rgba = to_rgba_array([s.color or '#0066CC' for s in series])
+    fills = PolyCollection(
+        verts,
+        facecolors=fill_rgba,
+        edgecolors=_override_colors(fill_rgba, [s.marker_edgecolor for s in series]),
+        linewidths=[s.marker_edgewidth or 0 for s in series],
+        alpha=alpha
+    )
+    ax.add_collection(fills)
+    
+    # Lines on top (same zorder and cap/join style as ax.plot); the line
+    # style is shared, see _can_bulk_draw_areas
+    line_style = series[0].line_style or '-'
+    if show_line and line_style != '':
+        segments = np.empty((n_series, n_x, 2))
+        segments[:, :, 0] = x
+        segments[:, :, 1] = ys
+        prefix = 'solid' if line_style in ('-', 'solid') else 'dash'
+        ax.add_collection(LineCollection(
+            segments,
+            colors=_override_colors(fill_rgba, [s.line_color for s in series]),
+            linestyles=line_style,
+            linewidths=[s.line_width or 1.5 for s in series],
+            zorder=Line2D.zorder,
+            capstyle=plt.rcParams[f'lines.{prefix}_capstyle'],
+            joinstyle=plt.rcParams[f'lines.{prefix}_joinstyle']
+        ))
+    
+    ax.autoscale_view()
+
+
+@lru_cache(maxsize=256)
+def _rgba(color: str) -> Tuple[float, float, float, float]:
+    """Resolve a color spec to RGBA once; repeated frames reuse the tuple"""
+    return to_rgba(color)
+
+
+def _override_colors(base: np.ndarray, overrides: List[Optional[str]]) -> np.ndarray:
+    """RGBA rows ``base`` with row i replaced wherever overrides[i] is set"""
+    if not any(overrides):
+        return base
+    resolved = base.copy()
+    for i, color in enumerate(overrides):
+        if color:
+            resolved[i] = _rgba(color)
+    return resolved
+
+
 def _create_stacked_areas(ax, series, alpha, show_line):
     """Create stacked area plot"""
-    # Extract data
+    # Extract data (colors resolved through the RGBA cache)
     x = series[0].x
-    y_data = [s.y for s in series]
-    colors = [s.color if s.color else None for s in series]
+    # One contiguous float (n_series, n_x) block, owned by this function
+    stack = np.array([s.y for s in series], dtype=float)
+    colors = [_rgba(s.color) if s.color else None for s in series]
     labels = [s.label if s.label else None for s in series]
     
     # Get hatch patterns (if any)
-    hatches = [s.hatch if hasattr(s, 'hatch') and s.hatch else None for s in series]
+    hatches = [s.hatch or None for s in series]
     
     # Create stacked plot
     polys = ax.stackplot(
-        x, *y_data,
+        x, stack,
         colors=colors,
         labels=labels,
         alpha=alpha
@@ -200,24 +305,64 @@ def _create_stacked_areas(ax, series, alpha, show_line):
     
     # Draw lines on top if requested
     if show_line:
-        # Calculate cumulative sums for stacked areas
-        cumsum = np.zeros_like(y_data[0])
-        for i, s in enumerate(series):
-            cumsum = cumsum + s.y
-            
-            line_color = s.line_color if hasattr(s, 'line_color') and s.line_color else s.color
-            line_style = s.line_style if s.line_style else '-'
-            line_width = s.line_width if s.line_width else 1.0
-            
-            if line_style != '':
+        # Top edge of every layer in one prefix sum (row i = layers 0..i)
+        # stackplot has copied what it needs, so accumulate in place
+        tops = np.cumsum(stack, axis=0, out=stack)
+        
+        drawn = [i for i, s in enumerate(series) if (s.line_style or '-') != '']
+        line_colors = [series[i].line_color or colors[i] for i in drawn]
+        line_styles = [series[i].line_style or '-' for i in drawn]
+        line_widths = [series[i].line_width or 1.0 for i in drawn]
+        
+        # One LineCollection when every line takes the same cap/join style
+        # (all solid or all dashed), otherwise one ax.plot per line
+        prefixes = {'solid' if ls in ('-', 'solid') else 'dash' for ls in line_styles}
+        if len(drawn) > 1 and len(prefixes) == 1 and all(c is not None for c in line_colors):
+            prefix = prefixes.pop()
+            segments = [np.column_stack((series[i].x, tops[i])) for i in drawn]
+            ax.add_collection(LineCollection(
+                segments,
+                colors=line_colors,
+                linestyles=line_styles,
+                linewidths=line_widths,
+                zorder=Line2D.zorder,
+                capstyle=plt.rcParams[f'lines.{prefix}_capstyle'],
+                joinstyle=plt.rcParams[f'lines.{prefix}_joinstyle']
+            ))
+        else:
+            for i, color, style, width in zip(drawn, line_colors, line_styles, line_widths):
                 ax.plot(
-                    s.x, cumsum,
-                    color=line_color,
-                    linestyle=line_style,
-                    linewidth=line_width
+                    series[i].x, tops[i],
+                    color=color,
+                    linestyle=style,
+                    linewidth=width
                 )
 
 
+def _fill_between_verts(x, y1, y2) -> Optional[np.ndarray]:
+    """
+    Polygon vertices for the region between y1 and y2 over x.
+    
+    Forward along (x, y1), then back along (x, y2), the same outline
+    fill_between draws. Returns None when the data is not finite 1D
+    numeric data of one length (fill_between then handles masking, NaN
+    gaps and unit conversion itself).
+    """
+    x, y1, y2 = np.asarray(x), np.asarray(y1), np.asarray(y2)
+    if x.ndim != 1 or y1.shape != x.shape or y2.shape != x.shape or not len(x):
+        return None
+    if any(a.dtype.kind not in 'fiu' or not np.isfinite(a).all() for a in (x, y1, y2)):
+        return None
+    
+    n = len(x)
+    verts = np.empty((2 * n, 2))
+    verts[:n, 0] = x
+    verts[:n, 1] = y1
+    verts[n:, 0] = x[::-1]
+    verts[n:, 1] = y2[::-1]
+    return verts
+
+
 def _create_fill_between(ax, series, alpha, show_line):
     """Fill between two curves"""
     if len(series) != 2:
@@ -229,12 +374,10 @@ def _create_fill_between(ax, series, alpha, show_line):
     fill_color = s1.color if s1.color else '#0066CC'
     edge_color = s1.marker_edgecolor if s1.marker_edgecolor else None
     edge_width = s1.marker_edgewidth if s1.marker_edgewidth else 0
-    hatch = s1.hatch if hasattr(s1, 'hatch') and s1.hatch else None
+    hatch = s1.hatch or None
     label = s1.label if s1.label else None
     
-    # Fill between curves
-    ax.fill_between(
-        s1.x, s1.y, s2.y,
+    fill_kwargs = dict(
         color=fill_color,
         alpha=alpha,
         edgecolor=edge_color,
@@ -243,10 +386,19 @@ def _create_fill_between(ax, series, alpha, show_line):
         label=label if not show_line else None
     )
     
+    # Fill between curves. Finite numeric data needs none of fill_between's
+    # masking/NaN splitting, so the polygon is built directly
+    verts = _fill_between_verts(s1.x, s1.y, s2.y)
+    if verts is not None:
+        ax.add_collection(PolyCollection([verts], **fill_kwargs))
+        ax.autoscale_view()
+    else:
+        ax.fill_between(s1.x, s1.y, s2.y, **fill_kwargs)
+    
     # Draw boundary lines if requested
     if show_line:
         for s in [s1, s2]:
-            line_color = s.line_color if hasattr(s, 'line_color') and s.line_color else s.color
+            line_color = s.line_color or s.color
             line_style = s.line_style if s.line_style else '-'
             line_width = s.line_width if s.line_width else 1.5
             
@@ -265,97 +417,69 @@ def _apply_global_formatting(ax: plt.Axes, config: PlotConfig) -> None:
     Apply PlotConfig settings to axes (same as other plotters).
     """
     # Labels
+    # Label/title/grid kwargs are resolved once per config and cached on it
     if config.x_label:
-        ax.set_xlabel(
-            config.x_label,
-            fontsize=config.x_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_xlabel(config.x_label, **config.x_label_kwargs())
     
     if config.y_label:
-        ax.set_ylabel(
-            config.y_label,
-            fontsize=config.y_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_ylabel(config.y_label, **config.y_label_kwargs())
     
     # Title
     if config.title:
-        title_kwargs = {
-            'fontsize': config.title_size,
-            'fontfamily': config.title_family,
-            'fontweight': config.title_weight,
-            'fontstyle': config.title_style,
-            'color': config.title_color
-        }
-        if config.title_pad is not None:
-            title_kwargs['pad'] = config.title_pad
-        ax.set_title(config.title, **title_kwargs)
+        ax.set_title(config.title, **config.title_kwargs())
     
     # Tick labels
-    x_tick_size = config.x_tick_label_size or config.tick_label_size
-    y_tick_size = config.y_tick_label_size or config.tick_label_size
+    x_tick_size = config.effective_x_tick_label_size
+    y_tick_size = config.effective_y_tick_label_size
     
     ax.tick_params(axis='x', labelsize=x_tick_size)
     ax.tick_params(axis='y', labelsize=y_tick_size)
     
-    for label in ax.get_xticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
-    
-    for label in ax.get_yticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
+    x_tick_labels = ax.get_xticklabels()
+    y_tick_labels = ax.get_yticklabels()
+    tick_label_props = config.tick_label_kwargs()
+    plt.setp(x_tick_labels, **tick_label_props)
+    plt.setp(y_tick_labels, **tick_label_props)
     
     # Grid
     if config.show_grid:
-        ax.grid(
-            True,
-            alpha=config.grid_alpha,
-            linestyle=config.grid_style,
-            linewidth=config.grid_linewidth,
-            color=config.grid_color
-        )
+        ax.grid(True, **config.grid_kwargs())
         ax.set_axisbelow(True)
     
-    # Legend
+    # Legend (only when something is labelled; the collected handles are
+    # passed on so ax.legend does not gather them a second time)
     if config.show_legend:
         handles, labels = ax.get_legend_handles_labels()
-        if handles and labels:
-            legend = ax.legend(
+        if handles:
+            ax.legend(
+                handles, labels,
                 loc=config.legend_location,
                 frameon=config.legend_frameon,
                 framealpha=config.legend_framealpha,
-                fontsize=config.legend_font_size
+                prop={'size': config.legend_font_size,
+                      'weight': config.legend_font_weight}
             )
-            if hasattr(config, 'legend_font_weight'):
-                for text in legend.get_texts():
-                    text.set_fontweight(config.legend_font_weight)
-    
-    # Spines
-    if not config.show_top_spine:
-        ax.spines['top'].set_visible(False)
-    if not config.show_right_spine:
-        ax.spines['right'].set_visible(False)
-    if not config.show_left_spine:
-        ax.spines['left'].set_visible(False)
-    if not config.show_bottom_spine:
-        ax.spines['bottom'].set_visible(False)
-    
-    # Tight layout
+    
+    # Spines (new axes show all four; only hide the ones turned off)
+    for name in config.formatting_plan()['hidden_spines']:
+        ax.spines[name].set_visible(False)
+    
+    # Tight layout: installed as the figure's layout engine, which runs once
+    # per draw with the final artists instead of an extra pass here
     if config.tight_layout:
-        plt.tight_layout()
+        if hasattr(ax.figure, 'set_layout_engine'):
+            ax.figure.set_layout_engine('tight')
+        else:
+            # matplotlib < 3.6 has no layout engines: one pass now
+            ax.figure.tight_layout()
 
 
-def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
+def save_plot(
+    fig: plt.Figure,
+    filename: str,
+    dpi: int = 300,
+    bbox_inches: Optional[str] = 'tight'
+) -> None:
     """
     Save figure to file.
     
@@ -363,6 +487,10 @@ def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
         fig: Matplotlib figure
         filename: Output filename
         dpi: Resolution (default: 300)
+        bbox_inches: Bounding box (default 'tight' crops to the drawn
+                     artists; None skips that extra draw pass and uses
+                     rcParams['savefig.bbox'])
     """
-    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    # Fast zlib level for PNG (shared with utils.save_plot)
+    fig.savefig(filename, dpi=dpi, bbox_inches=bbox_inches, **png_save_kwargs(filename))
     plt.close(fig)
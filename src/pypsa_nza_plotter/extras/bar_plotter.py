@@ -42,6 +42,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.plot_config import PlotConfig
 from models.series_config import SeriesConfig
+from ..utils import png_save_kwargs
 
 
 def create_bar_plot(
@@ -224,15 +225,12 @@ def _apply_global_formatting(ax: plt.Axes, config: PlotConfig) -> None:
     ax.tick_params(axis='x', labelsize=x_tick_size)
     ax.tick_params(axis='y', labelsize=y_tick_size)
     
-    for label in ax.get_xticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
-    
-    for label in ax.get_yticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
+    # Resolve each axis' tick labels once, then style them in one batch
+    x_tick_labels = ax.get_xticklabels()
+    y_tick_labels = ax.get_yticklabels()
+    tick_label_props = config.tick_label_kwargs()
+    plt.setp(x_tick_labels, **tick_label_props)
+    plt.setp(y_tick_labels, **tick_label_props)
     
     # Grid
     if config.show_grid:
@@ -276,7 +274,12 @@ def _apply_global_formatting(ax: plt.Axes, config: PlotConfig) -> None:
         plt.tight_layout()
 
 
-def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
+def save_plot(
+    fig: plt.Figure,
+    filename: str,
+    dpi: int = 300,
+    bbox_inches: Optional[str] = 'tight'
+) -> None:
     """
     Save figure to file.
     
@@ -284,6 +287,10 @@ def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
         fig: Matplotlib figure
         filename: Output filename
         dpi: Resolution (default: 300)
+        bbox_inches: Bounding box (default 'tight' crops to the drawn
+                     artists; None skips that extra draw pass and uses
+                     rcParams['savefig.bbox'])
     """
-    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    # Fast zlib level for PNG (shared with utils.save_plot)
+    fig.savefig(filename, dpi=dpi, bbox_inches=bbox_inches, **png_save_kwargs(filename))
     plt.close(fig)
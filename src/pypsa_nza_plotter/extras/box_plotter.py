@@ -33,9 +33,13 @@ Grouped box plots:
 import matplotlib
 ##matplotlib.use('Agg')  # Commented for interactive  # Commented for interactive
 from matplotlib.figure import Figure
+from matplotlib import cbook
 from matplotlib import pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 from typing import List, Union, Tuple, Optional
+import inspect
 import sys
 import os
 
@@ -43,6 +47,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.plot_config import PlotConfig
+from ..utils import png_save_kwargs
 
 
 def create_box_plot(
@@ -58,7 +63,8 @@ def create_box_plot(
     grouped: bool = False,
     group_labels: Optional[List[str]] = None,
     whisker_range: float = 1.5,
-    patch_artist: bool = True
+    patch_artist: bool = True,
+    use_pyplot: bool = True
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
     Create box plot(s) for statistical data visualization.
@@ -77,6 +83,10 @@ def create_box_plot(
         group_labels: Labels for groups (for grouped plots)
         whisker_range: IQR multiplier for whiskers (default 1.5)
         patch_artist: Use filled boxes (default True)
+        use_pyplot: Create the figure through pyplot (default True). False
+                    builds it directly on an Agg canvas, skipping the GUI
+                    canvas and pyplot's figure registry; use for batch or
+                    server rendering (plt.show() will not display it)
     
     Returns:
         (fig, ax): Matplotlib figure and axes
@@ -114,11 +124,16 @@ def create_box_plot(
         raise ValueError("orientation must be 'vertical' or 'horizontal'")
     
     # Create figure
-    fig = plt.figure(
+    figure_kwargs = dict(
         figsize=(config.figure_width, config.figure_height),
         dpi=config.dpi,
         facecolor=config.figure_facecolor
     )
+    if use_pyplot:
+        fig = plt.figure(**figure_kwargs)
+    else:
+        fig = Figure(**figure_kwargs)
+        FigureCanvasAgg(fig)
     
     ax = fig.add_subplot(111, facecolor=config.axes_facecolor)
     
@@ -146,19 +161,18 @@ def _create_simple_box_plot(
     notch, box_width, whisker_range, patch_artist
 ):
     """Create simple (non-grouped) box plots"""
-    # Create box plot
-    vert = (orientation == 'vertical')
-    
-    bp = ax.boxplot(
-        data,
-        labels=labels,
-        vert=vert,
+    # Create box plot from precomputed statistics; means and outliers are
+    # drawn afterwards as one artist each instead of a Line2D per box
+    stats = _box_stats(data, whisker_range, labels)
+    bp = ax.bxp(
+        stats,
         patch_artist=patch_artist,
-        showmeans=show_means,
-        showfliers=show_outliers,
-        notch=notch,
+        showmeans=False,
+        showfliers=False,
+        shownotches=notch,
         widths=box_width,
-        whis=whisker_range
+        boxprops=_box_props(patch_artist),
+        **_orientation_kwargs(orientation)
     )
     
     # Apply colors if provided
@@ -169,6 +183,8 @@ def _create_simple_box_plot(
     
     # Style the plot elements
     _style_box_plot_elements(bp, colors)
+    _draw_point_markers(ax, stats, np.arange(1, len(stats) + 1), orientation,
+                        show_means, show_outliers)
 
 
 def _create_grouped_box_plot(
@@ -204,19 +220,20 @@ def _create_grouped_box_plot(
         flat_data.extend(group_data)
         box_colors.extend(colors)
     
-    # Create box plot
+    # Create box plot from precomputed statistics
     vert = (orientation == 'vertical')
     
-    bp = ax.boxplot(
-        flat_data,
+    stats = _box_stats(flat_data, whisker_range)
+    bp = ax.bxp(
+        stats,
         positions=positions,
-        vert=vert,
         patch_artist=patch_artist,
-        showmeans=show_means,
-        showfliers=show_outliers,
-        notch=notch,
+        showmeans=False,
+        showfliers=False,
+        shownotches=notch,
         widths=box_width,
-        whis=whisker_range
+        boxprops=_box_props(patch_artist),
+        **_orientation_kwargs(orientation)
     )
     
     # Apply colors
@@ -227,6 +244,8 @@ def _create_grouped_box_plot(
     
     # Style elements
     _style_box_plot_elements(bp, box_colors)
+    _draw_point_markers(ax, stats, positions, orientation,
+                        show_means, show_outliers)
     
     # Set x-axis labels for groups
     if group_labels:
@@ -251,6 +270,82 @@ def _create_grouped_box_plot(
         ax.legend(handles=legend_elements, loc='best')
 
 
+# Axes.bxp takes orientation= from matplotlib 3.10 on (vert= is deprecated)
+_BXP_HAS_ORIENTATION = 'orientation' in inspect.signature(Axes.bxp).parameters
+
+
+def _orientation_kwargs(orientation: str) -> dict:
+    """Orientation keyword for Axes.bxp in this matplotlib version"""
+    if _BXP_HAS_ORIENTATION:
+        return {'orientation': orientation}
+    return {'vert': orientation == 'vertical'}
+
+
+def _box_props(patch_artist: bool) -> dict:
+    """Box properties as Axes.boxplot passes them to bxp"""
+    return {'linestyle': 'solid'} if patch_artist else {}
+
+
+def _box_stats(datasets, whisker_range, labels=None) -> List[dict]:
+    """
+    Box plot statistics in the format Axes.bxp expects.
+    
+    Equal-length, finite 1D samples are stacked and reduced in one
+    vectorized pass (quartiles, whiskers, fliers, means, notch bounds),
+    with the same definitions as matplotlib.cbook.boxplot_stats. Anything
+    else (ragged, masked or non-finite data, percentile whiskers) goes
+    through cbook.boxplot_stats itself, as Axes.boxplot would.
+    """
+    arrays = [np.asarray(d) for d in datasets]
+    if (
+        not np.isscalar(whisker_range)
+        or not arrays
+        or any(np.ma.isMaskedArray(d) for d in datasets)
+        or any(a.ndim != 1 or a.dtype.kind not in 'fiu' for a in arrays)
+        or len({len(a) for a in arrays}) != 1
+        or not len(arrays[0])
+    ):
+        return cbook.boxplot_stats(datasets, whis=whisker_range, labels=labels)
+    
+    samples = np.stack(arrays)    # (n_boxes, n_samples)
+    if not np.isfinite(samples).all():
+        return cbook.boxplot_stats(datasets, whis=whisker_range, labels=labels)
+    if labels is not None and len(labels) != len(arrays):
+        raise ValueError("Dimensions of labels and X must be compatible")
+    
+    q1, med, q3 = np.percentile(samples, [25, 50, 75], axis=1)
+    iqr = q3 - q1
+    
+    # Whiskers reach the most extreme sample within whisker_range * IQR,
+    # but never retract inside the box
+    high = q3 + whisker_range * iqr
+    low = q1 - whisker_range * iqr
+    whishi = np.maximum(np.where(samples <= high[:, None], samples, -np.inf).max(axis=1), q3)
+    whislo = np.minimum(np.where(samples >= low[:, None], samples, np.inf).min(axis=1), q1)
+    
+    means = samples.mean(axis=1)
+    notch = 1.57 * iqr / np.sqrt(samples.shape[1])
+    
+    stats = []
+    for i, row in enumerate(samples):
+        entry = {
+            'mean': means[i],
+            'iqr': iqr[i],
+            'cilo': med[i] - notch[i],
+            'cihi': med[i] + notch[i],
+            'whishi': whishi[i],
+            'whislo': whislo[i],
+            'fliers': np.concatenate([row[row < whislo[i]], row[row > whishi[i]]]),
+            'q1': q1[i],
+            'med': med[i],
+            'q3': q3[i],
+        }
+        if labels is not None:
+            entry['label'] = labels[i]
+        stats.append(entry)
+    return stats
+
+
 def _style_box_plot_elements(bp, colors):
     """Style box plot elements (whiskers, caps, medians, etc.)"""
     # Whiskers
@@ -264,18 +359,29 @@ def _style_box_plot_elements(bp, colors):
     # Medians
     for median in bp['medians']:
         median.set(color='#CC0000', linewidth=2.0)
+
+
+def _draw_point_markers(ax, stats, positions, orientation, show_means, show_outliers):
+    """Draw all means, then all outliers, as a single marker-only line each"""
+    vert = (orientation == 'vertical')
     
-    # Means (if shown)
-    if 'means' in bp:
-        for mean in bp['means']:
-            mean.set(marker='D', markerfacecolor='green', 
-                    markeredgecolor='green', markersize=6)
+    def markers(pos, values, **kwargs):
+        xy = (pos, values) if vert else (values, pos)
+        # Same artist type and zorder as the per-box markers of Axes.bxp
+        # (means sit 0.1 above the boxes), so the output is unchanged
+        ax.plot(*xy, linestyle='none', **kwargs)
+    
+    # Means
+    if show_means:
+        markers(positions, [s['mean'] for s in stats],
+                marker='D', color='green', markersize=6, zorder=2.1)
     
     # Fliers (outliers)
-    if 'fliers' in bp:
-        for flier in bp['fliers']:
-            flier.set(marker='o', markerfacecolor='red', 
-                     markeredgecolor='red', markersize=4, alpha=0.5)
+    counts = [len(s['fliers']) for s in stats]
+    if show_outliers and any(counts):
+        markers(np.repeat(positions, counts),
+                np.concatenate([s['fliers'] for s in stats]),
+                marker='o', color='red', markersize=4, alpha=0.5, zorder=2)
 
 
 def _apply_global_formatting(ax: plt.Axes, config: PlotConfig, orientation: str) -> None:
@@ -283,84 +389,54 @@ def _apply_global_formatting(ax: plt.Axes, config: PlotConfig, orientation: str)
     Apply PlotConfig settings to axes.
     """
     # Labels
+    # Label/title/grid kwargs are resolved once per config and cached on it
     if config.x_label:
-        ax.set_xlabel(
-            config.x_label,
-            fontsize=config.x_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_xlabel(config.x_label, **config.x_label_kwargs())
     
     if config.y_label:
-        ax.set_ylabel(
-            config.y_label,
-            fontsize=config.y_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_ylabel(config.y_label, **config.y_label_kwargs())
     
     # Title
     if config.title:
-        title_kwargs = {
-            'fontsize': config.title_size,
-            'fontfamily': config.title_family,
-            'fontweight': config.title_weight,
-            'fontstyle': config.title_style,
-            'color': config.title_color
-        }
-        if config.title_pad is not None:
-            title_kwargs['pad'] = config.title_pad
-        ax.set_title(config.title, **title_kwargs)
+        ax.set_title(config.title, **config.title_kwargs())
     
     # Tick labels
-    x_tick_size = config.x_tick_label_size or config.tick_label_size
-    y_tick_size = config.y_tick_label_size or config.tick_label_size
+    x_tick_size = config.effective_x_tick_label_size
+    y_tick_size = config.effective_y_tick_label_size
     
     ax.tick_params(axis='x', labelsize=x_tick_size)
     ax.tick_params(axis='y', labelsize=y_tick_size)
     
-    for label in ax.get_xticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
-    
-    for label in ax.get_yticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
+    x_tick_labels = ax.get_xticklabels()
+    y_tick_labels = ax.get_yticklabels()
+    tick_label_props = config.tick_label_kwargs()
+    plt.setp(x_tick_labels, **tick_label_props)
+    plt.setp(y_tick_labels, **tick_label_props)
     
     # Grid
     if config.show_grid:
         ax.grid(
             True,
-            alpha=config.grid_alpha,
-            linestyle=config.grid_style,
-            linewidth=config.grid_linewidth,
-            color=config.grid_color,
-            axis='y' if orientation == 'vertical' else 'x'  # Grid perpendicular to boxes
+            axis='y' if orientation == 'vertical' else 'x',  # Grid perpendicular to boxes
+            **config.grid_kwargs()
         )
         ax.set_axisbelow(True)
     
-    # Spines
-    if not config.show_top_spine:
-        ax.spines['top'].set_visible(False)
-    if not config.show_right_spine:
-        ax.spines['right'].set_visible(False)
-    if not config.show_left_spine:
-        ax.spines['left'].set_visible(False)
-    if not config.show_bottom_spine:
-        ax.spines['bottom'].set_visible(False)
+    # Spines (new axes show all four; only hide the ones turned off)
+    for name in config.formatting_plan()['hidden_spines']:
+        ax.spines[name].set_visible(False)
     
     # Tight layout
     if config.tight_layout:
-        plt.tight_layout()
+        ax.figure.tight_layout()
 
 
-def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
+def save_plot(
+    fig: plt.Figure,
+    filename: str,
+    dpi: int = 300,
+    bbox_inches: Optional[str] = 'tight'
+) -> None:
     """
     Save figure to file.
     
@@ -368,6 +444,10 @@ def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
         fig: Matplotlib figure
         filename: Output filename
         dpi: Resolution (default: 300)
+        bbox_inches: Bounding box (default 'tight' crops to the drawn
+                     artists; None skips that extra draw pass and uses
+                     rcParams['savefig.bbox'])
     """
-    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    # Fast zlib level for PNG (shared with utils.save_plot)
+    fig.savefig(filename, dpi=dpi, bbox_inches=bbox_inches, **png_save_kwargs(filename))
     plt.close(fig)
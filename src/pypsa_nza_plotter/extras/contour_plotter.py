@@ -31,6 +31,8 @@ import matplotlib
 ##matplotlib.use('Agg')  # Commented for interactive  # Commented for interactive
 from matplotlib.figure import Figure
 from matplotlib import pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.contour import QuadContourSet
 import numpy as np
 from typing import Tuple, Optional, List, Union
 import sys
@@ -40,6 +42,8 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.plot_config import PlotConfig
+from ..utils import png_save_kwargs
+from ._surface_common import _evaluate_sparse, _grid_vectors, _meshgrid
 
 
 def create_contour_plot(
@@ -61,7 +65,10 @@ def create_contour_plot(
     line_styles: str = 'solid',
     alpha: float = 1.0,
     vmin: Optional[float] = None,
-    vmax: Optional[float] = None
+    vmax: Optional[float] = None,
+    use_pyplot: bool = True,
+    max_cells: Optional[int] = None,
+    use_pcolormesh: bool = False
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
     Create contour plot for 2D function visualization.
@@ -86,6 +93,19 @@ def create_contour_plot(
         alpha: Transparency for filled contours (default 1.0)
         vmin: Minimum value for colormap (optional)
         vmax: Maximum value for colormap (optional)
+        use_pyplot: Create the figure through pyplot (default True). False
+                    builds it directly on an Agg canvas, skipping the GUI
+                    canvas and pyplot's figure registry; use for batch or
+                    server rendering (plt.show() will not display it)
+        max_cells: Largest grid (rows * columns) to contour (optional). A
+                   bigger grid is stride-sliced down to fit, always keeping
+                   the last row and column so the plotted extent is
+                   unchanged. When omitted and config.auto_downsample is
+                   set, the budget is the figure's pixel count
+        use_pcolormesh: Draw the filled layer with pcolormesh instead of
+                        contourf (default False). Colours vary
+                        continuously rather than in level bands, but no
+                        contour polygons are traced
     
     Returns:
         (fig, ax): Matplotlib figure and axes
@@ -115,13 +135,26 @@ def create_contour_plot(
     # Validate data
     if X.shape != Y.shape or X.shape != Z.shape:
         raise ValueError("X, Y, and Z must have the same shape")
+    if not filled and not lines:
+        raise ValueError("At least one of filled or lines must be True")
+    
+    # A grid finer than the output resolution only costs contouring time
+    if max_cells is None and config.auto_downsample:
+        max_cells = int(config.figure_width * config.dpi) * int(config.figure_height * config.dpi)
+    if max_cells and Z.ndim == 2 and Z.size > max_cells:
+        X, Y, Z = _downsample_grid(X, Y, Z, max_cells)
     
     # Create figure
-    fig = plt.figure(
+    figure_kwargs = dict(
         figsize=(config.figure_width, config.figure_height),
         dpi=config.dpi,
         facecolor=config.figure_facecolor
     )
+    if use_pyplot:
+        fig = plt.figure(**figure_kwargs)
+    else:
+        fig = Figure(**figure_kwargs)
+        FigureCanvasAgg(fig)
     
     ax = fig.add_subplot(111, facecolor=config.axes_facecolor)
     
@@ -131,7 +164,16 @@ def create_contour_plot(
     
     # Create filled contours
     contour_set = None
-    if filled:
+    if filled and use_pcolormesh:
+        contour_set = ax.pcolormesh(
+            X, Y, Z,
+            cmap=cmap,
+            alpha=alpha,
+            vmin=vmin,
+            vmax=vmax,
+            shading='auto'
+        )
+    elif filled:
         contour_set = ax.contourf(
             X, Y, Z,
             levels=levels,
@@ -144,9 +186,15 @@ def create_contour_plot(
     # Create line contours
     line_set = None
     if lines:
+        # Lines over contourf reuse its contour generator and levels instead
+        # of rebuilding them from the grid
+        if isinstance(contour_set, QuadContourSet):
+            line_args, line_levels = (contour_set,), None
+        else:
+            line_args, line_levels = (X, Y, Z), levels
         line_set = ax.contour(
-            X, Y, Z,
-            levels=levels,
+            *line_args,
+            levels=line_levels,
             colors=line_colors,
             linewidths=line_widths,
             linestyles=line_styles,
@@ -176,6 +224,7 @@ def create_contour_from_function(
     y_range: Tuple[float, float],
     config: Optional[PlotConfig] = None,
     resolution: int = 100,
+    sparse: bool = True,
     **kwargs
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
@@ -187,6 +236,13 @@ def create_contour_from_function(
         y_range: (y_min, y_max) tuple
         config: PlotConfig (optional)
         resolution: Number of points in each direction (default 100)
+        sparse: Call func with a row vector x and a column vector y and let
+                NumPy broadcast, instead of two full meshgrid arrays. Falls
+                back to meshgrid only if func raises a shape ValueError or
+                returns the wrong shape; other errors propagate (default True).
+                func gets writable copies of the vectors, but the fallback
+                meshgrid arrays are cached and read-only, so a func that
+                does not broadcast must not modify its arguments in place
         **kwargs: Additional arguments passed to create_contour_plot
     
     Returns:
@@ -199,10 +255,21 @@ def create_contour_from_function(
         ...     my_function, (-5, 5), (-5, 5), config
         ... )
     """
+    # Same cached grids as the surface plotters
+    grid_key = (tuple(x_range), tuple(y_range), resolution, None)
+    
+    # Sparse grid: x as (1, n), y as (n, 1). Broadcasting inside func yields
+    # the same Z as a meshgrid without allocating the two n×n coordinate
+    # arrays; X and Y are passed on as read-only broadcast views
+    if sparse:
+        x_row, y_col = _grid_vectors(*grid_key)
+        Z = _evaluate_sparse(func, x_row, y_col)
+        if Z is not None:
+            X, Y = np.broadcast_arrays(x_row, y_col)
+            return create_contour_plot(X, Y, Z, config, **kwargs)
+    
     # Create meshgrid
-    x = np.linspace(x_range[0], x_range[1], resolution)
-    y = np.linspace(y_range[0], y_range[1], resolution)
-    X, Y = np.meshgrid(x, y)
+    X, Y = _meshgrid(*grid_key)
     
     # Evaluate function
     Z = func(X, Y)
@@ -211,91 +278,77 @@ def create_contour_from_function(
     return create_contour_plot(X, Y, Z, config, **kwargs)
 
 
+def _downsample_grid(
+    X: np.ndarray,
+    Y: np.ndarray,
+    Z: np.ndarray,
+    max_cells: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stride-slice a meshgrid so it holds at most about max_cells points.
+    
+    The same stride is used along both axes and the last row and column
+    are always kept, so the grid still spans the full data range.
+    """
+    stride = int(np.ceil(np.sqrt(Z.size / max_cells)))
+    rows = np.r_[0:Z.shape[0] - 1:stride, Z.shape[0] - 1]
+    cols = np.r_[0:Z.shape[1] - 1:stride, Z.shape[1] - 1]
+    index = np.ix_(rows, cols)
+    return X[index], Y[index], Z[index]
+
+
 def _apply_global_formatting(ax: plt.Axes, config: PlotConfig) -> None:
     """
     Apply PlotConfig settings to axes.
     """
     # Labels
+    # Label/title/grid kwargs are resolved once per config and cached on it
     if config.x_label:
-        ax.set_xlabel(
-            config.x_label,
-            fontsize=config.x_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_xlabel(config.x_label, **config.x_label_kwargs())
     
     if config.y_label:
-        ax.set_ylabel(
-            config.y_label,
-            fontsize=config.y_axis_label_size or config.axis_label_size,
-            fontfamily=config.axis_label_family,
-            fontweight=config.axis_label_weight,
-            fontstyle=config.axis_label_style,
-            color=config.axis_label_color
-        )
+        ax.set_ylabel(config.y_label, **config.y_label_kwargs())
     
     # Title
     if config.title:
-        title_kwargs = {
-            'fontsize': config.title_size,
-            'fontfamily': config.title_family,
-            'fontweight': config.title_weight,
-            'fontstyle': config.title_style,
-            'color': config.title_color
-        }
-        if config.title_pad is not None:
-            title_kwargs['pad'] = config.title_pad
-        ax.set_title(config.title, **title_kwargs)
+        ax.set_title(config.title, **config.title_kwargs())
     
     # Tick labels
-    x_tick_size = config.x_tick_label_size or config.tick_label_size
-    y_tick_size = config.y_tick_label_size or config.tick_label_size
+    x_tick_size = config.effective_x_tick_label_size
+    y_tick_size = config.effective_y_tick_label_size
     
     ax.tick_params(axis='x', labelsize=x_tick_size)
     ax.tick_params(axis='y', labelsize=y_tick_size)
     
-    for label in ax.get_xticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
-    
-    for label in ax.get_yticklabels():
-        label.set_fontfamily(config.tick_label_family)
-        label.set_fontweight(config.tick_label_weight)
-        label.set_color(config.tick_label_color)
+    x_tick_labels = ax.get_xticklabels()
+    y_tick_labels = ax.get_yticklabels()
+    tick_label_props = config.tick_label_kwargs()
+    plt.setp(x_tick_labels, **tick_label_props)
+    plt.setp(y_tick_labels, **tick_label_props)
     
     # Grid
     if config.show_grid:
-        ax.grid(
-            True,
-            alpha=config.grid_alpha,
-            linestyle=config.grid_style,
-            linewidth=config.grid_linewidth,
-            color=config.grid_color
-        )
+        ax.grid(True, **config.grid_kwargs())
         ax.set_axisbelow(True)
     
-    # Spines
-    if not config.show_top_spine:
-        ax.spines['top'].set_visible(False)
-    if not config.show_right_spine:
-        ax.spines['right'].set_visible(False)
-    if not config.show_left_spine:
-        ax.spines['left'].set_visible(False)
-    if not config.show_bottom_spine:
-        ax.spines['bottom'].set_visible(False)
+    # Spines (new axes show all four; only hide the ones turned off)
+    for name in config.formatting_plan()['hidden_spines']:
+        ax.spines[name].set_visible(False)
     
     # Equal aspect ratio (often desired for contour plots)
     # ax.set_aspect('equal')
     
     # Tight layout
     if config.tight_layout:
-        plt.tight_layout()
+        ax.figure.tight_layout()
 
 
-def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
+def save_plot(
+    fig: plt.Figure,
+    filename: str,
+    dpi: int = 300,
+    bbox_inches: Optional[str] = 'tight'
+) -> None:
     """
     Save figure to file.
     
@@ -303,6 +356,10 @@ def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
         fig: Matplotlib figure
         filename: Output filename
         dpi: Resolution (default: 300)
+        bbox_inches: Bounding box (default 'tight' crops to the drawn
+                     artists; None skips that extra draw pass and uses
+                     rcParams['savefig.bbox'])
     """
-    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    # Fast zlib level for PNG (shared with utils.save_plot)
+    fig.savefig(filename, dpi=dpi, bbox_inches=bbox_inches, **png_save_kwargs(filename))
     plt.close(fig)
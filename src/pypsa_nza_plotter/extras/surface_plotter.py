@@ -31,7 +31,7 @@ from matplotlib.figure import Figure
 from matplotlib import pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import numpy as np
-from typing import Tuple, Optional, List, Union
+from typing import Callable, Tuple, Optional, List, Union
 import sys
 import os
 
@@ -39,6 +39,11 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.plot_config import PlotConfig
+from ..utils import png_save_kwargs
+from ._surface_common import (
+    _SURFACE_FUNCTIONS, _add_fast_surface, _evaluate_sparse, _grid_vectors, _meshgrid,
+    _stride_grid
+)
 
 
 def create_surface_plot(
@@ -54,6 +59,7 @@ def create_surface_plot(
     antialiased: bool = True,
     cbar: bool = True,
     cbar_label: Optional[str] = None,
+    cbar_ticks: Optional[int] = None,
     elev: float = 30,
     azim: float = -60,
     contour_proj: bool = False,
@@ -61,7 +67,10 @@ def create_surface_plot(
     vmin: Optional[float] = None,
     vmax: Optional[float] = None,
     rstride: int = 1,
-    cstride: int = 1
+    cstride: int = 1,
+    dtype: Optional[np.dtype] = None,
+    validate: bool = True,
+    fast: bool = False
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
     Create 3D surface plot.
@@ -79,6 +88,9 @@ def create_surface_plot(
         antialiased: Smooth shading (default True)
         cbar: Show color bar (default True)
         cbar_label: Label for color bar (optional)
+        cbar_ticks: Number of evenly spaced color bar ticks. Fixes the tick
+                    positions instead of running the adaptive tick locator
+                    (optional; default None = automatic ticks)
         elev: Elevation viewing angle in degrees (default 30)
         azim: Azimuthal viewing angle in degrees (default -60)
         contour_proj: Project contours on bottom plane (default False)
@@ -87,6 +99,15 @@ def create_surface_plot(
         vmax: Maximum value for colormap (optional)
         rstride: Row stride for surface (default 1)
         cstride: Column stride for surface (default 1)
+        dtype: Cast X, Y, Z to this dtype before plotting, e.g. np.float32
+               to halve the memory read by projection and colormapping;
+               keep None (no cast) when full float64 precision matters
+        validate: Check that X, Y and Z have the same shape (default True).
+                  Callers that build all three from one grid can skip it
+        fast: Draw the surface as a single re-projected QuadMesh instead of
+              plot_surface's per-cell 3D polygons. Much faster for large
+              grids; intended for single-valued z = f(x, y) surfaces
+              (default False)
     
     Returns:
         (fig, ax): Matplotlib figure and 3D axes
@@ -111,13 +132,19 @@ def create_surface_plot(
         config = PlotConfig()
     
     # Validate data
-    if X.shape != Y.shape or X.shape != Z.shape:
+    if validate and (X.shape != Y.shape or X.shape != Z.shape):
         raise ValueError("X, Y, and Z must have the same shape")
     
     # Validate plot type
     if plot_type not in ['surface', 'wireframe', 'both']:
         raise ValueError("plot_type must be 'surface', 'wireframe', or 'both'")
     
+    # Optional down-cast (no copy if already the requested dtype)
+    if dtype is not None:
+        X = np.asarray(X, dtype=dtype)
+        Y = np.asarray(Y, dtype=dtype)
+        Z = np.asarray(Z, dtype=dtype)
+    
     # Create figure with 3D axes
     fig = plt.figure(
         figsize=(config.figure_width, config.figure_height),
@@ -133,18 +160,32 @@ def create_surface_plot(
     # Create surface or wireframe
     surf = None
     if plot_type == 'surface' or plot_type == 'both':
-        surf = ax.plot_surface(
-            X, Y, Z,
-            cmap=cmap,
-            alpha=alpha,
-            edgecolor=edgecolor,
-            linewidth=linewidth,
-            antialiased=antialiased,
-            vmin=vmin,
-            vmax=vmax,
-            rstride=rstride,
-            cstride=cstride
-        )
+        Xs, Ys, Zs = X, Y, Z
+        if rstride > 1 or cstride > 1:
+            # Subsample up front (see _stride_grid)
+            Xs, Ys, Zs = _stride_grid((X, Y, Z), rstride, cstride)
+        if fast:
+            surf = _add_fast_surface(
+                ax, Xs, Ys, Zs, vmin, vmax,
+                cmap=cmap,
+                alpha=alpha,
+                edgecolor=edgecolor,
+                linewidth=linewidth,
+                antialiased=antialiased
+            )
+        else:
+            surf = ax.plot_surface(
+                Xs, Ys, Zs,
+                cmap=cmap,
+                alpha=alpha,
+                edgecolor=edgecolor,
+                linewidth=linewidth,
+                antialiased=antialiased,
+                vmin=vmin,
+                vmax=vmax,
+                rstride=1,
+                cstride=1
+            )
     
     if plot_type == 'wireframe' or plot_type == 'both':
         wire_color = 'black' if plot_type == 'both' else None
@@ -161,12 +202,18 @@ def create_surface_plot(
     # Add contour projections on bottom plane
     if contour_proj:
         if contour_offset is None:
-            contour_offset = Z.min()
+            # NaN-aware: a masked/NaN cell must not push the plane to nan
+            contour_offset = float(np.nanmin(Z))
         ax.contour(X, Y, Z, zdir='z', offset=contour_offset, cmap=cmap, alpha=0.6)
     
     # Add color bar
     if cbar and surf is not None:
-        cbar_obj = fig.colorbar(surf, ax=ax, shrink=0.5, aspect=5)
+        cbar_ticks_arr = None
+        if cbar_ticks:
+            # Evenly spaced fixed ticks over the mappable's color limits
+            surf.autoscale_None()
+            cbar_ticks_arr = np.linspace(surf.norm.vmin, surf.norm.vmax, cbar_ticks)
+        cbar_obj = fig.colorbar(surf, ax=ax, shrink=0.5, aspect=5, ticks=cbar_ticks_arr)
         if cbar_label:
             cbar_obj.set_label(cbar_label, fontsize=config.axis_label_size)
     
@@ -176,24 +223,36 @@ def create_surface_plot(
     return fig, ax
 
 
+# ========== Built-in Surfaces ==========
 def create_surface_from_function(
-    func,
+    func: Union[Callable, str],
     x_range: Tuple[float, float],
     y_range: Tuple[float, float],
     config: Optional[PlotConfig] = None,
     resolution: int = 50,
+    sparse: bool = True,
     **kwargs
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
     Convenience function to create 3D surface plot from a function.
     
     Args:
-        func: Function that takes (x, y) and returns z
+        func: Function that takes (x, y) and returns z, or the name of a
+              built-in surface: 'radial_sin', 'gaussian' or 'saddle'
         x_range: (x_min, x_max) tuple
         y_range: (y_min, y_max) tuple
         config: PlotConfig (optional)
         resolution: Number of points in each direction (default 50)
-        **kwargs: Additional arguments passed to create_surface_plot
+        sparse: Call func with a row vector x and a column vector y and let
+                NumPy broadcast, instead of two full meshgrid arrays. Falls
+                back to meshgrid only if func raises a shape ValueError or
+                returns the wrong shape; other errors propagate (default True).
+                func gets writable copies of the vectors, but the fallback
+                meshgrid arrays are cached and read-only, so a func that
+                does not broadcast must not modify its arguments in place
+        **kwargs: Additional arguments passed to create_surface_plot. A
+                  ``dtype`` there also sets the grid dtype, so evaluating
+                  func never promotes float32 back to float64
     
     Returns:
         (fig, ax): Matplotlib figure and 3D axes
@@ -204,11 +263,35 @@ def create_surface_from_function(
         >>> fig, ax = create_surface_from_function(
         ...     my_function, (-5, 5), (-5, 5), config
         ... )
+        
+        >>> # Built-in surface by name
+        >>> fig, ax = create_surface_from_function('gaussian', (-2, 2), (-2, 2))
     """
+    if isinstance(func, str):
+        if func not in _SURFACE_FUNCTIONS:
+            raise ValueError(
+                f"Unknown surface '{func}'. "
+                f"Choose from: {', '.join(_SURFACE_FUNCTIONS)}"
+            )
+        func = _SURFACE_FUNCTIONS[func]
+    
+    # Grids are cached per domain (see _grid_vectors / _meshgrid)
+    grid_key = (tuple(x_range), tuple(y_range), resolution, kwargs.get('dtype'))
+    
+    # Sparse grid: x as (1, n), y as (n, 1). Broadcasting inside func yields
+    # the same Z as a meshgrid without allocating the two n×n coordinate
+    # arrays; X and Y are passed on as read-only broadcast views
+    if sparse:
+        x_row, y_col = _grid_vectors(*grid_key)
+        Z = _evaluate_sparse(func, x_row, y_col)
+        if Z is not None:
+            # Shapes are consistent by construction; skip re-validation
+            X, Y = np.broadcast_arrays(x_row, y_col)
+            kwargs.setdefault('validate', False)
+            return create_surface_plot(X, Y, Z, config, **kwargs)
+    
     # Create meshgrid
-    x = np.linspace(x_range[0], x_range[1], resolution)
-    y = np.linspace(y_range[0], y_range[1], resolution)
-    X, Y = np.meshgrid(x, y)
+    X, Y = _meshgrid(*grid_key)
     
     # Evaluate function
     Z = func(X, Y)
@@ -280,12 +363,22 @@ def _apply_global_formatting(ax: plt.Axes, config: PlotConfig) -> None:
             color=config.grid_color
         )
     
-    # Tight layout
+    # Tight layout: installed as the figure's layout engine, which runs once
+    # per draw with the final artists instead of an extra pass here
     if config.tight_layout:
-        plt.tight_layout()
+        if hasattr(ax.figure, 'set_layout_engine'):
+            ax.figure.set_layout_engine('tight')
+        else:
+            # matplotlib < 3.6 has no layout engines: one pass now
+            ax.figure.tight_layout()
 
 
-def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
+def save_plot(
+    fig: plt.Figure,
+    filename: str,
+    dpi: int = 300,
+    bbox_inches: Optional[str] = 'tight'
+) -> None:
     """
     Save figure to file.
     
@@ -293,6 +386,10 @@ def save_plot(fig: plt.Figure, filename: str, dpi: int = 300) -> None:
         fig: Matplotlib figure
         filename: Output filename
         dpi: Resolution (default: 300)
+        bbox_inches: Bounding box (default 'tight' crops to the drawn
+                     artists; None skips that extra draw pass and uses
+                     rcParams['savefig.bbox'])
     """
-    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    # Fast zlib level for PNG (shared with utils.save_plot)
+    fig.savefig(filename, dpi=dpi, bbox_inches=bbox_inches, **png_save_kwargs(filename))
     plt.close(fig)
@@ -22,8 +22,10 @@ Integrates seamlessly with PlotLib v2.0:
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from typing import List, Optional, Union, Tuple
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import sys
 import os
 
@@ -41,26 +43,75 @@ from plotlib import create_line_plot
 def load_timeseries_csv(
     csv_file: str,
     date_column: str = 'DATE',
-    parse_dates: bool = True
+    parse_dates: bool = True,
+    disk_cache: bool = False,
+    date_format: Optional[str] = None
 ) -> pd.DataFrame:
     """
     Load CSV file with time-series data.
     
+    Parsed files are memoized in-process, keyed by absolute path and
+    modification time, so loading the same unchanged file again skips
+    the CSV parse. Editing the file invalidates the cached copy.
+    
     Args:
         csv_file: Path to CSV file
         date_column: Name of date/time column (default: 'DATE')
         parse_dates: Parse date column to datetime (default: True)
+        disk_cache: Also persist the parsed DataFrame to a '<csv_file>.pkl'
+                    sidecar and reuse it across runs while the CSV is
+                    unchanged (default: False)
+        date_format: strftime format of the date column, e.g.
+                     '%Y-%m-%d %H:%M:%S'. Skips per-file format inference
+                     (default: None = infer)
     
     Returns:
         pandas DataFrame with index as time-steps (0, 1, 2, ...)
     """
-    df = pd.read_csv(csv_file)
+    abspath = os.path.abspath(csv_file)
+    df = _load_timeseries_csv_cached(
+        abspath, os.path.getmtime(abspath), date_column, parse_dates,
+        disk_cache, date_format
+    )
+    # Callers may modify the frame, so never hand out the cached object
+    return df.copy()
+
+
+@lru_cache(maxsize=32)
+def _load_timeseries_csv_cached(
+    abspath: str,
+    mtime: float,
+    date_column: str,
+    parse_dates: bool,
+    disk_cache: bool,
+    date_format: Optional[str]
+) -> pd.DataFrame:
+    """Parse a CSV once per (path, mtime, options); see load_timeseries_csv."""
+    key = (mtime, date_column, parse_dates, date_format)
+    sidecar = abspath + '.pkl'
+    
+    if disk_cache and os.path.exists(sidecar):
+        try:
+            cached = pd.read_pickle(sidecar)
+            if cached.get('key') == key:
+                return cached['df']
+        except Exception:
+            pass  # Stale or unreadable sidecar - fall back to the CSV
+    
+    df = pd.read_csv(abspath)
     
     if parse_dates and date_column in df.columns:
-        df[date_column] = pd.to_datetime(df[date_column])
+        # cache=True parses each distinct date string once; an explicit
+        # format avoids per-element format inference
+        df[date_column] = pd.to_datetime(
+            df[date_column], format=date_format, cache=True
+        )
     
     df = df.reset_index(drop=True)
     
+    if disk_cache:
+        pd.to_pickle({'key': key, 'df': df}, sidecar)
+    
     return df
 
 
@@ -87,13 +138,38 @@ def select_columns(
         columns = [columns]
     
     x = np.arange(len(df))
+    y = select_y_columns(df, columns)
+    
+    return x, y, columns
+
+
+def select_y_columns(
+    df: pd.DataFrame,
+    columns: Union[str, List[str]]
+) -> np.ndarray:
+    """
+    Select column(s) from DataFrame and return only the y values.
+    
+    Use this when plotting several columns against the same time-step
+    axis: build x once (np.arange(len(df))) and share it between series
+    instead of getting a fresh copy from select_columns() per column.
+    
+    Args:
+        df: DataFrame with time-series data
+        columns: Column name (str) or list of column names (summed)
+    
+    Returns:
+        y = data values (single column or summed if multiple)
+    """
+    if isinstance(columns, str):
+        columns = [columns]
     
     if len(columns) == 1:
-        y = df[columns[0]].values
-    else:
-        y = df[columns].sum(axis=1).values
+        return df[columns[0]].values
     
-    return x, y, columns
+    # One 2-D buffer and a single row-wise reduction; nansum keeps
+    # pandas' skipna semantics
+    return np.nansum(df[columns].to_numpy(dtype=np.float64), axis=1)
 
 
 def aggregate_columns(
@@ -123,7 +199,7 @@ def aggregate_columns(
     x = np.arange(len(df))
     
     if operation == 'sum':
-        y = df[columns].sum(axis=1).values
+        y = np.nansum(df[columns].to_numpy(dtype=np.float64), axis=1)
         label = f'Total ({len(columns)} columns)'
     elif operation == 'mean':
         y = df[columns].mean(axis=1).values
@@ -182,64 +258,46 @@ def add_week_separators(
     if date_column not in df.columns:
         return
     
-    df_copy = df.copy()
-    df_copy['week'] = pd.to_datetime(df_copy[date_column]).dt.isocalendar().week
-    
-    week_changes = df_copy['week'].diff() != 0
-    week_indices = df_copy[week_changes].index.tolist()
-    
-    # Draw vertical lines
-    start_idx = 0 if include_first else 1
-    for idx in week_indices[start_idx:]:
-        ax.axvline(x=idx, color=color, linestyle=linestyle, 
-                  alpha=alpha, linewidth=linewidth, zorder=2)
+    # Week boundaries: positions where the ISO week number changes
+    weeks = pd.to_datetime(df[date_column]).dt.isocalendar().week.to_numpy(dtype=np.int64)
+    week_indices = np.flatnonzero(np.diff(weeks)) + 1
+    
+    # Draw all separators as one LineCollection spanning the full axes height
+    # (x in data coordinates, y in axes coordinates, like axvline)
+    line_x = week_indices[0 if include_first else 1:]
+    if len(line_x):
+        segments = np.zeros((len(line_x), 2, 2))
+        segments[:, :, 0] = line_x[:, None]
+        segments[:, 1, 1] = 1.0
+        separators = LineCollection(
+            segments, colors=color, linestyles=linestyle, alpha=alpha,
+            linewidths=linewidth, zorder=2, transform=ax.get_xaxis_transform()
+        )
+        ax.add_collection(separators, autolim=False)
     
     # Add week labels
     if label_weeks:
+        y_pos = ax.get_ylim()[1] * label_y_position
+        text_kwargs = {
+            'fontsize': label_fontsize,
+            'color': label_color,
+            'fontweight': label_weight,
+            'va': 'bottom'
+        }
         if center_labels:
-            # FIRST WEEK - from start to first boundary
-            if len(week_indices) > 0:
-                start_pos = 0
-                end_pos = week_indices[0]
-                center_pos = (start_pos + end_pos) / 2
-                week_num = df_copy.loc[0, 'week']
-                
-                y_pos = ax.get_ylim()[1] * label_y_position
-                ax.text(center_pos, y_pos, f'W{int(week_num)}', 
-                       fontsize=label_fontsize, color=label_color, 
-                       fontweight=label_weight, ha='center', va='bottom')
-            
-            # MIDDLE WEEKS
-            for i in range(len(week_indices) - 1):
-                start_pos = week_indices[i]
-                end_pos = week_indices[i + 1]
-                center_pos = (start_pos + end_pos) / 2
-                week_num = df_copy.loc[start_pos, 'week']
-                
-                y_pos = ax.get_ylim()[1] * label_y_position
-                ax.text(center_pos, y_pos, f'W{int(week_num)}', 
-                       fontsize=label_fontsize, color=label_color,
-                       fontweight=label_weight, ha='center', va='bottom')
-            
-            # LAST WEEK
+            # One label per week, centred between consecutive boundaries
+            # (first week starts at 0, last week ends at the final row)
             if len(week_indices) > 0:
-                start_pos = week_indices[-1]
-                end_pos = len(df) - 1
-                center_pos = (start_pos + end_pos) / 2
-                week_num = df_copy.loc[start_pos, 'week']
-                
-                y_pos = ax.get_ylim()[1] * label_y_position
-                ax.text(center_pos, y_pos, f'W{int(week_num)}', 
-                       fontsize=label_fontsize, color=label_color,
-                       fontweight=label_weight, ha='center', va='bottom')
+                starts = np.concatenate(([0], week_indices))
+                ends = np.concatenate((week_indices, [len(df) - 1]))
+                for center_pos, week_num in zip((starts + ends) / 2, weeks[starts]):
+                    ax.text(center_pos, y_pos, f'W{int(week_num)}',
+                            ha='center', **text_kwargs)
         else:
             # Labels AT the line
-            for idx in week_indices[start_idx:]:
-                week_num = df_copy.loc[idx, 'week']
-                y_pos = ax.get_ylim()[1] * label_y_position
-                ax.text(idx, y_pos, f'W{int(week_num)}', 
-                       fontsize=label_fontsize, color=label_color,
-                       fontweight=label_weight, ha='left', va='bottom')
+            for idx in line_x:
+                ax.text(idx, y_pos, f'W{int(weeks[idx])}',
+                        ha='left', **text_kwargs)
 
 
 def add_boundary_lines(
@@ -282,7 +340,8 @@ def fill_under_curve(
     y: np.ndarray,
     color: str = '#0066CC',
     alpha: float = 0.3,
-    baseline: float = 0.0
+    baseline: float = 0.0,
+    zorder: Optional[float] = None
 ) -> None:
     """
     Fill area under the curve.
@@ -294,8 +353,14 @@ def fill_under_curve(
         color: Fill color (default: blue)
         alpha: Transparency (default: 0.3)
         baseline: Y-value to fill to (default: 0.0)
+        zorder: Draw order of the fill (default: None = matplotlib default)
     """
-    ax.fill_between(x, baseline, y, color=color, alpha=alpha)
+    # Plain ndarrays (not pandas Series) so fill_between builds the
+    # polygon straight from contiguous buffers
+    kwargs = {'color': color, 'alpha': alpha}
+    if zorder is not None:
+        kwargs['zorder'] = zorder
+    ax.fill_between(np.asarray(x), baseline, np.asarray(y), **kwargs)
 
 
 # ============================================================================
@@ -16,6 +16,9 @@ SeriesConfig = Individual series settings (applies to one line/scatter)
   - Marker style, size
   - Data (x, y arrays)
 
+SeriesBundle = Many series stored as parallel columns (structure-of-arrays)
+  - Consumed directly by bulk plotters such as create_histogram
+
 This separation makes it clear what applies globally vs. per-series!
 """
 
@@ -34,6 +37,9 @@ from .series_config import (
     create_line_scatter_series
 )
 
+# Multi-series columns
+from .series_bundle import SeriesBundle
+
 __all__ = [
     # Global configuration
     'PlotConfig',
@@ -45,4 +51,7 @@ __all__ = [
     'create_line_series',
     'create_scatter_series',
     'create_line_scatter_series',
+    
+    # Multi-series columns
+    'SeriesBundle',
 ]
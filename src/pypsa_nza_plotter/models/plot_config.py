@@ -32,7 +32,8 @@ WHAT DOES NOT BELONG HERE:
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, Any, Tuple
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Tuple, Mapping, Callable
 import yaml
 from datetime import datetime
 
@@ -166,6 +167,20 @@ class PlotConfig:
     tight_layout: bool = True
     subplot_adjust: Optional[Dict[str, float]] = None  # left, right, top, bottom
     
+    # ========== Data ==========
+    # dtype numeric data is converted to (as one contiguous buffer) before
+    # it is handed to matplotlib. None (default) passes data through;
+    # 'float32' halves the bytes moved but loses precision on large or
+    # offset values.
+    data_dtype: Optional[str] = None
+    
+    # Decimate marker-less line series that have far more points than the
+    # figure has horizontal pixels (keeps the first, last, min and max per
+    # pixel column, so the drawn line looks the same). Contour plots also
+    # read it: grids with more cells than the figure has pixels are
+    # stride-sliced down, keeping the last row and column. Off by default.
+    auto_downsample: bool = False
+    
     def __post_init__(self):
         """Set defaults and validate"""
         if self.created is None:
@@ -233,6 +248,168 @@ class PlotConfig:
         for key, value in kwargs.items():
             if hasattr(self, key):
                 setattr(self, key, value)
+    
+    # ========== Cached Formatting Kwargs ==========
+    # Plotters format every axes from the same config. The keyword dicts
+    # below are built once per config and reused; assigning any public
+    # attribute drops the cache so the next call sees the new values.
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith('_'):
+            self.__dict__.pop('_style_cache', None)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cache holds read-only mappings that cannot be pickled or
+        # deep-copied; it is rebuilt on demand, so both skip it
+        state = self.__dict__.copy()
+        state.pop('_style_cache', None)
+        return state
+    
+    def _cached(self, key: str, build: Callable[[], Any]) -> Any:
+        """Return the value cached under ``key``, building it once"""
+        cache = self.__dict__.setdefault('_style_cache', {})
+        if key not in cache:
+            cache[key] = build()
+        return cache[key]
+    
+    def _cached_kwargs(
+        self,
+        key: str,
+        build: Callable[[], Dict[str, Any]]
+    ) -> Mapping[str, Any]:
+        """Return the read-only kwargs for ``key``, building them once"""
+        return self._cached(key, lambda: MappingProxyType(build()))
+    
+    # ========== Effective Sizes ==========
+    # Per-axis sizes fall back to the shared size when unset (None/0).
+    # Resolved once per config; cleared with the rest of the style cache.
+    
+    @property
+    def effective_x_tick_label_size(self) -> float:
+        return self._cached('eff_x_tick', lambda: self.x_tick_label_size or self.tick_label_size)
+    
+    @property
+    def effective_y_tick_label_size(self) -> float:
+        return self._cached('eff_y_tick', lambda: self.y_tick_label_size or self.tick_label_size)
+    
+    @property
+    def effective_x_axis_label_size(self) -> float:
+        return self._cached('eff_x_label', lambda: self.x_axis_label_size or self.axis_label_size)
+    
+    @property
+    def effective_y_axis_label_size(self) -> float:
+        return self._cached('eff_y_label', lambda: self.y_axis_label_size or self.axis_label_size)
+    
+    def x_label_kwargs(self) -> Mapping[str, Any]:
+        """Keyword arguments for ax.set_xlabel()"""
+        return self._cached_kwargs('x_label', lambda: {
+            'fontsize': self.effective_x_axis_label_size,
+            'fontfamily': self.axis_label_family,
+            'fontweight': self.axis_label_weight,
+            'fontstyle': self.axis_label_style,
+            'color': self.axis_label_color
+        })
+    
+    def y_label_kwargs(self) -> Mapping[str, Any]:
+        """Keyword arguments for ax.set_ylabel()"""
+        return self._cached_kwargs('y_label', lambda: {
+            'fontsize': self.effective_y_axis_label_size,
+            'fontfamily': self.axis_label_family,
+            'fontweight': self.axis_label_weight,
+            'fontstyle': self.axis_label_style,
+            'color': self.axis_label_color
+        })
+    
+    def z_label_kwargs(self) -> Mapping[str, Any]:
+        """Keyword arguments for ax.set_zlabel() (3D axes)"""
+        return self._cached_kwargs('z_label', lambda: {
+            'fontsize': self.axis_label_size,
+            'fontfamily': self.axis_label_family,
+            'fontweight': self.axis_label_weight,
+            'fontstyle': self.axis_label_style,
+            'color': self.axis_label_color
+        })
+    
+    def title_kwargs(self) -> Mapping[str, Any]:
+        """Keyword arguments for ax.set_title() (includes pad if set)"""
+        def build():
+            kwargs = {
+                'fontsize': self.title_size,
+                'fontfamily': self.title_family,
+                'fontweight': self.title_weight,
+                'fontstyle': self.title_style,
+                'color': self.title_color
+            }
+            if self.title_pad is not None:
+                kwargs['pad'] = self.title_pad
+            return kwargs
+        return self._cached_kwargs('title', build)
+    
+    def tick_label_kwargs(self) -> Mapping[str, Any]:
+        """Font properties for tick label Text objects (plt.setp)"""
+        return self._cached_kwargs('tick_label', lambda: {
+            'fontfamily': self.tick_label_family,
+            'fontweight': self.tick_label_weight,
+            'color': self.tick_label_color
+        })
+    
+    def grid_kwargs(self) -> Mapping[str, Any]:
+        """Keyword arguments for ax.grid(True, ...)"""
+        return self._cached_kwargs('grid', lambda: {
+            'alpha': self.grid_alpha,
+            'linestyle': self.grid_style,
+            'linewidth': self.grid_linewidth,
+            'color': self.grid_color
+        })
+    
+    def tight_layout_needed(
+        self,
+        nrows: int = 1,
+        ncols: int = 1,
+        adjust: Optional[Dict[str, float]] = None
+    ) -> bool:
+        """
+        Whether fig.tight_layout() should run for an nrows x ncols grid.
+        
+        tight_layout does a trial draw to measure labels. That is wasted when
+        the subplots_adjust applied after it (``adjust``, by default
+        subplot_adjust) sets every spacing parameter it would compute.
+        """
+        if not self.tight_layout:
+            return False
+        if adjust is None:
+            adjust = self.subplot_adjust or {}
+        
+        pinned = {'left', 'right', 'bottom', 'top'}
+        if nrows > 1:
+            pinned.add('hspace')
+        if ncols > 1:
+            pinned.add('wspace')
+        return not pinned <= adjust.keys()
+    
+    def formatting_plan(self) -> Mapping[str, Any]:
+        """
+        Which axes setters actually change a freshly created Axes.
+        
+        Computed once per config so plotters that format many subplots with
+        the same config can skip calls that would only re-apply defaults.
+        """
+        return self._cached_kwargs('formatting_plan', lambda: {
+            'set_xscale': self.x_scale != 'linear',
+            'set_yscale': self.y_scale != 'linear',
+            'minor_ticks': bool(self.show_minor_ticks),
+            'set_xlim': bool(self.x_limits),
+            'set_ylim': bool(self.y_limits),
+            'hidden_spines': tuple(
+                name for name, visible in (
+                    ('top', self.show_top_spine),
+                    ('right', self.show_right_spine),
+                    ('bottom', self.show_bottom_spine),
+                    ('left', self.show_left_spine),
+                ) if not visible
+            ),
+        })
 
 
 # ========== Preset Configurations ==========
@@ -0,0 +1,120 @@
+"""
+Series Bundle Model
+
+This module defines the SeriesBundle class, a structure-of-arrays (SoA)
+alternative to a list of SeriesConfig objects.
+
+DESIGN PHILOSOPHY:
+------------------
+Bulk plotters such as create_histogram() hand matplotlib one list per
+styling field (all the data, all the colors, all the labels, ...). A list of
+SeriesConfig objects (array-of-structures) has to be split field by field
+before every call.
+
+SeriesBundle stores those fields as parallel columns up front, so the
+plotter can pass them straight through without the split.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, List, Sequence, Union
+import numpy as np
+
+from .series_config import SeriesConfig
+
+
+@dataclass
+class SeriesBundle:
+    """
+    Parallel per-field columns for several data series.
+
+    Entry i of every column describes series i. Styling columns may be
+    omitted. Omitted colors and labels are None (the series follows the
+    colour cycle and gets no legend entry). Omitted edgecolors are None
+    (the edge follows the series colour, as SeriesConfig.marker_edgecolor
+    does), linewidths default to SeriesConfig's 0.5 and hatches to None.
+
+    Examples:
+    ---------
+    Build directly from arrays:
+        >>> bundle = SeriesBundle(
+        ...     ys=[data1, data2],
+        ...     colors=['#0066CC', '#CC6666'],
+        ...     labels=['Group A', 'Group B']
+        ... )
+        >>> fig, ax = create_histogram(bundle, config, bins=20)
+
+    Convert an existing list of SeriesConfig:
+        >>> bundle = SeriesBundle.from_series([series1, series2])
+    """
+
+    # ========== Data ==========
+    ys: List[np.ndarray]
+
+    # ========== Styling Columns (object arrays, one entry per series) ==========
+    colors: Optional[Sequence[str]] = None
+    labels: Optional[Sequence[str]] = None
+    edgecolors: Optional[Sequence[str]] = None
+    linewidths: Optional[Sequence[float]] = None
+    hatches: Optional[Sequence[Optional[str]]] = None
+
+    def __post_init__(self):
+        """Convert columns to arrays and validate their lengths"""
+        self.ys = [np.asarray(y) for y in self.ys]
+        n = len(self.ys)
+
+        # Colours/labels unset (colour cycle, no legend entry); edges follow
+        # the series colour at SeriesConfig's default width
+        defaults = {
+            'colors': None,
+            'labels': None,
+            'edgecolors': None,
+            'linewidths': 0.5,
+            'hatches': None,
+        }
+        for name, default in defaults.items():
+            column = getattr(self, name)
+            if column is None:
+                column = np.full(n, default, dtype=object)
+            else:
+                column = np.asarray(column, dtype=object)
+                if column.shape != (n,):
+                    raise ValueError(
+                        f"{name} must have one entry per series. "
+                        f"Got {column.shape[0] if column.ndim else 0}, expected {n}"
+                    )
+            setattr(self, name, column)
+
+    def __len__(self) -> int:
+        return len(self.ys)
+
+    @classmethod
+    def from_series(
+        cls,
+        series: Union[SeriesConfig, List[SeriesConfig]]
+    ) -> 'SeriesBundle':
+        """
+        Build a bundle from one or more SeriesConfig objects.
+
+        Example:
+            >>> bundle = SeriesBundle.from_series([series1, series2])
+        """
+        if not isinstance(series, list):
+            series = [series]
+
+        ys, colors, labels, edgecolors, linewidths, hatches = [], [], [], [], [], []
+        for s in series:
+            ys.append(s.y)
+            colors.append(s.color or None)
+            labels.append(s.label or None)
+            edgecolors.append(s.marker_edgecolor or 'black')
+            linewidths.append(s.marker_edgewidth or 0)
+            hatches.append(s.hatch or None)
+
+        return cls(
+            ys=ys,
+            colors=colors,
+            labels=labels,
+            edgecolors=edgecolors,
+            linewidths=linewidths,
+            hatches=hatches
+        )
@@ -80,6 +80,7 @@ class SeriesConfig:
     line_style: str = '-'
     line_width: float = 1.5
     line_alpha: float = 1.0  # 0.0 (transparent) to 1.0 (opaque)
+    line_color: Optional[str] = None  # Outline color for area plots. None = use series color
     
     # ========== Marker Properties ==========
     # Marker style: '' (none), 'o' (circle), 's' (square), '^' (triangle up),
@@ -125,12 +126,13 @@ class SeriesConfig:
     
     def __post_init__(self):
         """Validate and convert data to numpy arrays"""
-        # Convert y to numpy array (always required)
-        self.y = np.array(self.y)
+        # Convert y to numpy array (always required). asarray does not copy
+        # existing arrays, so several series can share one x array.
+        self.y = np.asarray(self.y)
         
         # Convert x to numpy array only if provided (optional for histograms)
         if self.x is not None:
-            self.x = np.array(self.x)
+            self.x = np.asarray(self.x)
             
             # Validate data lengths match (only if x is provided)
             if len(self.x) != len(self.y):
@@ -205,6 +207,7 @@ class SeriesConfig:
             line_style=self.line_style,
             line_width=self.line_width,
             line_alpha=self.line_alpha,
+            line_color=self.line_color,
             marker=self.marker,
             marker_size=self.marker_size,
             marker_facecolor=self.marker_facecolor,
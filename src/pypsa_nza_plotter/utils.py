@@ -8,14 +8,126 @@ such as saving publication-quality figures with consistent defaults.
 
 from __future__ import annotations
 
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from io import BytesIO
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import matplotlib.figure
+import numpy as np
+
+# pybase64 is an optional, SIMD-accelerated drop-in for the stdlib encoder
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # pragma: no cover
+    from base64 import b64encode as _b64encode
+
+if TYPE_CHECKING:
+    from matplotlib.font_manager import FontProperties
 
 
 PathLike = Union[str, Path]
 
+# zlib level for PNG output. Level 1 encodes several times faster than the
+# libpng default (6) at the cost of somewhat larger files.
+PNG_COMPRESS_LEVEL = 1
+
+
+def png_save_kwargs(
+    filepath: PathLike,
+    png_compress_level: int = PNG_COMPRESS_LEVEL,
+) -> dict:
+    """
+    Extra ``fig.savefig()`` arguments for fast PNG encoding.
+
+    Returns ``{"pil_kwargs": ...}`` with the given zlib level when
+    ``filepath`` is a PNG, and an empty dict for every other format.
+    """
+    if Path(filepath).suffix.lower() != ".png":
+        return {}
+    return {"pil_kwargs": {"compress_level": png_compress_level, "optimize": False}}
+
+
+def as_plot_array(values, dtype: Optional[str] = None) -> np.ndarray:
+    """
+    Return numeric data as a C-contiguous array of ``dtype``.
+
+    Non-numeric data (datetimes, strings) and ``dtype=None`` pass through
+    unchanged (see ``PlotConfig.data_dtype``).
+    """
+    values = np.asarray(values)
+    if dtype is None or values.dtype.kind not in "fiu":
+        return values
+    return np.ascontiguousarray(values, dtype=dtype)
+
+
+@lru_cache(maxsize=128)
+def get_font_props(family: str, size: float) -> FontProperties:
+    """
+    Return a shared FontProperties for (family, size).
+    
+    Every axes with the same legend font reuses one object. The legend's
+    Text artists copy the properties they are given, so sharing is safe as
+    long as the returned object is not mutated. font_manager is imported
+    here, on the legend path, rather than at module import.
+    """
+    from matplotlib.font_manager import FontProperties
+
+    return FontProperties(family=family, size=size)
+
+
+def _can_write_canvas_png(
+    fig: matplotlib.figure.Figure,
+    path: Path,
+    dpi: float,
+    transparent: bool,
+    bbox_inches,
+    savefig_kwargs: dict,
+) -> bool:
+    """Whether savefig would output exactly the Agg canvas buffer"""
+    from matplotlib import rcParams
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    return (
+        path.suffix.lower() == ".png"
+        and isinstance(fig.canvas, FigureCanvasAgg)
+        and dpi == fig.dpi
+        and not transparent
+        and bbox_inches is None
+        and rcParams["savefig.bbox"] != "tight"
+        and rcParams["savefig.facecolor"] == "auto"
+        and rcParams["savefig.edgecolor"] == "auto"
+        and set(savefig_kwargs) == {"pil_kwargs"}
+    )
+
+
+def _write_png_from_canvas(
+    fig: matplotlib.figure.Figure,
+    path: Path,
+    pil_kwargs: dict,
+) -> None:
+    """
+    Write the figure's Agg pixel buffer straight to a PNG file.
+
+    Only called when savefig would produce the same pixels (see save_plot).
+    The buffer is encoded as-is when the figure is unchanged since the
+    canvas last rendered it; otherwise it is drawn once first.
+    """
+    # PIL is a matplotlib dependency
+    from PIL import Image
+
+    canvas = fig.canvas
+    rendered = getattr(fig, "_save_renderer", None)
+    if fig.stale or rendered is None or rendered is not getattr(canvas, "renderer", None):
+        canvas.draw()
+        fig._save_renderer = canvas.renderer
+
+    size = canvas.get_width_height(physical=True)
+    image = Image.frombuffer("RGBA", size, canvas.buffer_rgba(), "raw", "RGBA", 0, 1)
+    image.save(path, format="png", **pil_kwargs)
+
 
 def save_plot(
     fig: matplotlib.figure.Figure,
@@ -23,8 +135,12 @@ def save_plot(
     *,
     dpi: int = 300,
     transparent: bool = False,
-    bbox_inches: str = "tight",
+    bbox_inches: Optional[str] = "tight",
     pad_inches: float = 0.02,
+    png_compress_level: int = PNG_COMPRESS_LEVEL,
+    close: bool = False,
+    fast: bool = False,
+    **savefig_kwargs,
 ) -> Path:
     """
     Save a matplotlib figure with sensible publication defaults.
@@ -44,11 +160,34 @@ def save_plot(
         Whether to save with transparent background.
 
     bbox_inches : str, optional
-        Bounding box behaviour passed to matplotlib. Default is "tight".
+        Bounding box behaviour passed to matplotlib. Default is "tight",
+        which crops to the drawn artists at the cost of an extra layout
+        pass. Pass None to skip that pass and defer to
+        ``rcParams["savefig.bbox"]``.
 
     pad_inches : float, optional
         Padding around the figure.
 
+    png_compress_level : int, optional
+        zlib compression level (0-9) used when writing PNG files. Default is
+        1, which favours write speed over file size. Ignored for other formats.
+
+    close : bool, optional
+        Close the figure after saving, releasing its canvas and renderer.
+        Useful in loops that render many figures. Default is False.
+
+    fast : bool, optional
+        Encode the canvas pixel buffer directly instead of calling
+        ``fig.savefig()`` when that gives the same image: PNG output at the
+        figure's own dpi, no bbox cropping or transparency, default save
+        colours and no extra savefig arguments. An unchanged figure that
+        was already drawn is then written without being rendered again.
+        PNG text metadata (e.g. Software) is not written on this path.
+        Default is False, so output always comes from savefig.
+
+    **savefig_kwargs
+        Additional keyword arguments passed through to ``fig.savefig()``.
+
     Returns
     -------
     Path
@@ -56,8 +195,8 @@ def save_plot(
 
     Notes
     -----
-    This function does not close the figure. Users retain control over
-    figure lifecycle.
+    Unless ``close=True``, this function does not close the figure. Users
+    retain control over figure lifecycle.
     """
 
     path = Path(filepath).expanduser().resolve()
@@ -65,12 +204,148 @@ def save_plot(
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    for key, value in png_save_kwargs(path, png_compress_level).items():
+        savefig_kwargs.setdefault(key, value)
+
+    if fast and _can_write_canvas_png(fig, path, dpi, transparent,
+                                      bbox_inches, savefig_kwargs):
+        _write_png_from_canvas(fig, path, savefig_kwargs["pil_kwargs"])
+    else:
+        fig.savefig(
+            path,
+            dpi=dpi,
+            transparent=transparent,
+            bbox_inches=bbox_inches,
+            pad_inches=pad_inches,
+            **savefig_kwargs,
+        )
+
+    if close:
+        # Same as plt.close(fig): a figure the caller still references
+        # keeps its contents
+        close_figure(fig, clear=False)
+
+    return path
+
+
+def close_figure(fig: matplotlib.figure.Figure, *, clear: bool = True) -> None:
+    """
+    Release a figure and its artists, whether or not pyplot manages it.
+
+    Figures created through pyplot are removed from its registry (as
+    ``plt.close``). Figures built directly with ``Figure(...)`` are never
+    registered; with ``clear=True`` (default) their artists are dropped
+    even while the caller still holds a reference. ``clear=False`` only
+    does the ``plt.close`` part. pyplot is not imported if it is not loaded.
+    """
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    if pyplot is not None:
+        pyplot.close(fig)
+    if clear:
+        fig.clear()
+
+
+def fig_to_png_bytes(
+    fig: matplotlib.figure.Figure,
+    *,
+    dpi: Optional[float] = None,
+    png_compress_level: int = PNG_COMPRESS_LEVEL,
+) -> bytes:
+    """
+    Render a figure to PNG bytes in memory, without touching the filesystem.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to render.
+
+    dpi : float, optional
+        Output resolution. Default is None, which uses the figure's dpi.
+
+    png_compress_level : int, optional
+        zlib compression level (0-9). Default favours speed (see save_plot).
+
+    Returns
+    -------
+    bytes
+        The encoded PNG image.
+    """
+    buffer = BytesIO()
     fig.savefig(
-        path,
-        dpi=dpi,
-        transparent=transparent,
-        bbox_inches=bbox_inches,
-        pad_inches=pad_inches,
+        buffer,
+        format="png",
+        dpi=dpi or fig.dpi,
+        **png_save_kwargs(".png", png_compress_level),
     )
+    return buffer.getvalue()
 
-    return path
+
+def fig_to_data_uri(fig: matplotlib.figure.Figure, **kwargs) -> str:
+    """
+    Render a figure as a ``data:image/png;base64,...`` URI (e.g. for HTML).
+
+    Keyword arguments are passed to :func:`fig_to_png_bytes`. Encoding uses
+    pybase64 when it is installed and the standard library otherwise.
+    """
+    encoded = _b64encode(fig_to_png_bytes(fig, **kwargs)).decode("ascii")
+    return "data:image/png;base64," + encoded
+
+
+def _render_png(
+    creator: Callable,
+    job: Tuple[tuple, Dict[str, Any]],
+    savefig_kwargs: dict,
+) -> bytes:
+    """Build one figure off pyplot and return it as PNG bytes (worker side)"""
+    args, kwargs = job
+    fig, _ = creator(*args, **dict(kwargs, use_pyplot=False))
+    buffer = BytesIO()
+    fig.savefig(buffer, format="png", **savefig_kwargs)
+    return buffer.getvalue()
+
+
+def render_many(
+    creator: Callable,
+    jobs: Sequence[Tuple[tuple, Dict[str, Any]]],
+    n_jobs: Optional[int] = None,
+    *,
+    png_compress_level: int = PNG_COMPRESS_LEVEL,
+    **savefig_kwargs,
+) -> List[bytes]:
+    """
+    Render a batch of independent plots in parallel and return PNG bytes.
+
+    Parameters
+    ----------
+    creator : callable
+        Module-level plot function returning ``(fig, ax)`` and accepting
+        ``use_pyplot`` (e.g. ``create_box_plot`` or ``create_contour_plot``).
+        Figures are built on an Agg canvas with ``use_pyplot=False``.
+
+    jobs : sequence of (tuple, dict)
+        One ``(args, kwargs)`` pair per figure, passed to ``creator``.
+
+    n_jobs : int, optional
+        Worker processes. Default is None (one per CPU). 1 renders in this
+        process without a pool.
+
+    png_compress_level : int, optional
+        zlib compression level (0-9). Default favours speed (see save_plot).
+
+    **savefig_kwargs
+        Additional keyword arguments passed through to ``fig.savefig()``
+        (e.g. ``dpi``).
+
+    Returns
+    -------
+    list of bytes
+        The encoded PNG images, in job order. Only these bytes leave the
+        worker processes, so no figure state is pickled.
+    """
+    for key, value in png_save_kwargs(".png", png_compress_level).items():
+        savefig_kwargs.setdefault(key, value)
+    render = partial(_render_png, creator, savefig_kwargs=savefig_kwargs)
+    if n_jobs == 1:
+        return [render(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        return list(pool.map(render, jobs))
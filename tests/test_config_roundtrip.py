@@ -10,3 +10,82 @@ def test_yaml_roundtrip(tmp_path):
     cfg2 = PlotConfig.from_yaml(str(p))
     assert cfg2.title == "roundtrip test"
     assert cfg2.tick_label_size == 9
+
+
+def test_cached_formatting_kwargs_follow_mutation():
+    cfg = PlotConfig(title_size=14)
+    first = cfg.title_kwargs()
+    assert cfg.title_kwargs() is first
+    assert first["fontsize"] == 14
+
+    cfg.title_size = 20
+    assert cfg.title_kwargs()["fontsize"] == 20
+    assert "_style_cache" not in cfg.to_dict()
+
+
+def test_used_config_pickles_and_deepcopies():
+    import copy
+    import pickle
+    cfg = PlotConfig(title_size=14)
+    cfg.title_kwargs()
+    cfg.formatting_plan()
+    for cfg2 in (pickle.loads(pickle.dumps(cfg)), copy.deepcopy(cfg)):
+        assert "_style_cache" not in cfg2.__dict__
+        assert cfg2.title_kwargs()["fontsize"] == 14
+        cfg2.title_size = 20
+        assert cfg.title_kwargs()["fontsize"] == 14
+
+
+def test_formatting_plan_skips_defaults():
+    cfg = PlotConfig()
+    plan = cfg.formatting_plan()
+    assert not plan["set_xscale"] and not plan["set_xlim"]
+
+    cfg.y_scale = "log"
+    cfg.show_top_spine = False
+    plan = cfg.formatting_plan()
+    assert plan["set_yscale"]
+    assert "top" in plan["hidden_spines"]
+
+
+def test_package_import_does_not_load_matplotlib():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, pypsa_nza_plotter as p; "
+        "assert 'matplotlib' not in sys.modules; "
+        "p.create_line_plot; "
+        "assert 'matplotlib' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_tight_layout_skipped_only_when_fully_overridden():
+    margins = dict(left=0.1, right=0.9, bottom=0.1, top=0.9)
+    assert PlotConfig().tight_layout_needed()
+    assert not PlotConfig(tight_layout=False).tight_layout_needed()
+    assert not PlotConfig(subplot_adjust=margins).tight_layout_needed()
+    # a 2x1 grid also needs hspace pinned before tight_layout is redundant
+    assert PlotConfig(subplot_adjust=margins).tight_layout_needed(2, 1)
+    assert not PlotConfig(subplot_adjust=dict(margins, hspace=0.3)).tight_layout_needed(2, 1)
+
+
+def test_effective_sizes_fall_back_and_follow_mutation():
+    cfg = PlotConfig(tick_label_size=9)
+    assert cfg.effective_x_tick_label_size == 9
+
+    cfg.x_tick_label_size = None
+    cfg.tick_label_size = 11
+    assert cfg.effective_x_tick_label_size == 11
+    assert cfg.effective_y_tick_label_size == 9
+
+
+def test_data_dtype_passes_data_through_by_default():
+    import numpy as np
+    from pypsa_nza_plotter.utils import as_plot_array
+
+    assert PlotConfig().data_dtype is None
+    big = np.array([1_700_000_000, 1_700_000_001], dtype=np.int64)
+    assert as_plot_array(big) is big
+    assert as_plot_array(big, "float32").dtype == np.float32
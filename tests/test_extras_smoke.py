@@ -0,0 +1,129 @@
+"""
+"""
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+from matplotlib import cbook
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.contour import QuadContourSet
+
+from pypsa_nza_plotter import PlotConfig, SeriesConfig
+
+
+def _assert_stats_equal(ours, reference):
+    assert len(ours) == len(reference)
+    for got, want in zip(ours, reference):
+        assert got.keys() == want.keys()
+        for key, value in want.items():
+            if key == 'label':
+                assert got[key] == value
+            else:
+                np.testing.assert_allclose(got[key], value, err_msg=key)
+
+
+@pytest.mark.parametrize("whis", [1.5, 0.5, 3.0, (5, 95)])
+@pytest.mark.parametrize("case", ["normal", "nan", "all_equal", "ragged"])
+def test_box_stats_match_cbook(case, whis):
+    from pypsa_nza_plotter.extras.box_plotter import _box_stats
+
+    rng = np.random.default_rng(0)
+    datasets = [rng.normal(size=200), rng.standard_t(3, size=200), rng.exponential(size=200)]
+    if case == "nan":
+        datasets[1][[3, 50]] = np.nan
+    elif case == "all_equal":
+        datasets = [np.full(50, 2.5), np.arange(50.0)]
+    elif case == "ragged":
+        datasets[2] = datasets[2][:120]
+    labels = [f"s{i}" for i in range(len(datasets))]
+
+    _assert_stats_equal(
+        _box_stats(datasets, whis, labels=labels),
+        cbook.boxplot_stats(datasets, whis=whis, labels=labels)
+    )
+
+
+def test_area_overlapping_series_draw_as_one_collection():
+    from pypsa_nza_plotter.extras.area_plotter import create_area_plot
+
+    x = np.linspace(0, 1, 30)
+    series = [SeriesConfig(x=x, y=(i + 1) * np.sin(x), color=c)
+              for i, c in enumerate(["#0066CC", "#CC6666", "#66CC66"])]
+
+    _, ax = create_area_plot(series, PlotConfig())
+
+    fills = [c for c in ax.collections if isinstance(c, PolyCollection)]
+    lines = [c for c in ax.collections if isinstance(c, LineCollection)]
+    assert len(fills) == 1 and len(fills[0].get_paths()) == 3
+    assert len(lines) == 1 and len(lines[0].get_segments()) == 3
+    assert ax.dataLim.x0 == 0 and ax.dataLim.x1 == 1
+    assert ax.dataLim.y1 == pytest.approx(3 * np.sin(1))
+
+
+def test_contour_downsamples_to_max_cells_keeping_extent():
+    from pypsa_nza_plotter.extras.contour_plotter import create_contour_plot
+
+    X, Y = np.meshgrid(np.linspace(0, 1, 50), np.linspace(-1, 1, 50))
+    _, ax = create_contour_plot(
+        X, Y, X * Y, PlotConfig(), max_cells=100, use_pcolormesh=True, cbar=False
+    )
+
+    # stride 5 over 50 points: every 5th row/column plus the last one
+    mesh = ax.collections[0]
+    assert mesh.get_array().shape == (11, 11)
+    assert ax.dataLim.x0 <= 0 and ax.dataLim.x1 >= 1
+    assert ax.dataLim.y0 <= -1 and ax.dataLim.y1 >= 1
+
+
+def test_contour_lines_reuse_filled_levels():
+    from pypsa_nza_plotter.extras.contour_plotter import create_contour_plot
+
+    X, Y = np.meshgrid(np.linspace(-2, 2, 40), np.linspace(-2, 2, 40))
+    _, ax = create_contour_plot(
+        X, Y, np.exp(-X**2 - Y**2), PlotConfig(), filled=True, lines=True, levels=7
+    )
+
+    filled, line = [c for c in ax.collections if isinstance(c, QuadContourSet)]
+    assert filled.filled and not line.filled
+    np.testing.assert_array_equal(line.levels, filled.levels)
+
+
+@pytest.mark.parametrize("module", ["surface_plotter", "contour_plotter"])
+def test_function_plots_evaluate_on_sparse_grid(module):
+    import importlib
+
+    plotter = importlib.import_module(f"pypsa_nza_plotter.extras.{module}")
+    create = getattr(plotter, f"create_{module.split('_')[0]}_from_function")
+
+    shapes = []
+
+    def broadcasting(x, y):
+        shapes.append((x.shape, y.shape))
+        return x * y
+
+    def needs_full_grid(x, y):
+        shapes.append((x.shape, y.shape))
+        return np.stack([x, y]).sum(axis=0)
+
+    create(broadcasting, (0, 1), (0, 2), PlotConfig(), resolution=20)
+    assert shapes == [((1, 20), (20, 1))]
+
+    # Non-broadcasting functions fall back to the full meshgrid
+    shapes.clear()
+    create(needs_full_grid, (0, 1), (0, 2), PlotConfig(), resolution=20)
+    assert shapes == [((1, 20), (20, 1)), ((20, 20), (20, 20))]
+
+
+def test_function_plots_allow_in_place_arithmetic_on_sparse_grid():
+    from pypsa_nza_plotter.extras.surface_plotter import create_surface_from_function
+
+    def shifted(x, y):
+        x -= 0.5
+        y -= 1.0
+        return x * y
+
+    create_surface_from_function(shifted, (0, 1), (0, 2), PlotConfig(), resolution=10)
+    # The cached grid is untouched for the next call
+    _, ax = create_surface_from_function(shifted, (0, 1), (0, 2), PlotConfig(), resolution=10)
+    assert ax.get_xlim3d()[0] <= 0 and ax.get_xlim3d()[1] >= 1
@@ -24,3 +24,240 @@ def test_line_plot_smoke(tmp_path):
     assert out.stat().st_size > 0
 
 
+
+
+def test_histogram_series_bundle_matches_series_list():
+    from pypsa_nza_plotter import create_histogram
+    from pypsa_nza_plotter.models import SeriesBundle
+
+    rng = np.random.default_rng(0)
+    series = [
+        SeriesConfig(y=rng.normal(size=200), label="a", color="#0066CC", hatch="//"),
+        SeriesConfig(y=rng.normal(size=200), label="b", color="#CC6666"),
+    ]
+    cfg = PlotConfig()
+
+    _, ax_list = create_histogram(series, cfg, bins=15)
+    _, ax_bundle = create_histogram(SeriesBundle.from_series(series), cfg, bins=15)
+
+    heights = [p.get_height() for p in ax_list.patches]
+    assert heights == [p.get_height() for p in ax_bundle.patches]
+    assert ax_bundle.patches[0].get_hatch() == "//"
+    assert ax_bundle.patches[-1].get_hatch() is None
+
+
+def test_series_bundle_defaults_follow_color_cycle():
+    from matplotlib.colors import to_rgba
+    from pypsa_nza_plotter import create_histogram
+    from pypsa_nza_plotter.models import SeriesBundle
+
+    rng = np.random.default_rng(0)
+    bundle = SeriesBundle(ys=[rng.normal(size=50), rng.normal(size=50)])
+    assert list(bundle.colors) == [None, None]
+    assert list(bundle.labels) == [None, None]
+
+    _, ax = create_histogram(bundle, PlotConfig(), bins=5)
+    first, last = ax.patches[0].get_facecolor(), ax.patches[-1].get_facecolor()
+    assert first[:3] == to_rgba("C0")[:3]
+    assert last[:3] == to_rgba("C1")[:3]
+    assert ax.get_legend() is None
+
+    # Unset edges follow the series colour at SeriesConfig's default width
+    _, ax = create_histogram(SeriesBundle(ys=[rng.normal(size=50)]), PlotConfig(), bins=5)
+    assert ax.patches[0].get_edgecolor()[:3] == to_rgba("C0")[:3]
+    assert ax.patches[0].get_linewidth() == 0.5
+
+
+def test_line_plot_shows_spine_hidden_by_rcparams():
+    import matplotlib
+
+    x = np.linspace(0, 1, 10)
+    cfg = PlotConfig(show_top_spine=True)
+    with matplotlib.rc_context({'axes.spines.top': False}):
+        _, ax = create_line_plot(SeriesConfig(x=x, y=x), cfg)
+    assert ax.spines['top'].get_visible()
+
+
+def test_histogram_shows_spine_hidden_by_rcparams():
+    import matplotlib
+    from pypsa_nza_plotter import create_histogram
+
+    cfg = PlotConfig(show_top_spine=True)
+    with matplotlib.rc_context({'axes.spines.top': False}):
+        _, ax = create_histogram(SeriesConfig(y=np.arange(20.0)), cfg, bins=5)
+    assert ax.spines['top'].get_visible()
+
+
+def test_histogram_on_given_figure_creates_no_pyplot_figures():
+    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+    from pypsa_nza_plotter import create_histogram
+
+    plt.close('all')
+    fig = Figure()
+    out_fig, _ = create_histogram(
+        SeriesConfig(y=np.arange(20.0)), PlotConfig(tight_layout=True), bins=5, fig=fig
+    )
+    assert out_fig is fig
+    assert plt.get_fignums() == []
+
+
+def test_line_plot_reuses_given_figure():
+    import matplotlib.pyplot as plt
+
+    x = np.linspace(0, 1, 10)
+    cfg = PlotConfig(figure_width=5, figure_height=3)
+    fig = plt.figure()
+
+    out_fig, ax = create_line_plot(SeriesConfig(x=x, y=x), cfg, fig=fig)
+    out_fig, ax = create_line_plot(SeriesConfig(x=x, y=-x), cfg, fig=fig)
+
+    assert out_fig is fig
+    assert fig.axes == [ax]
+    assert len(ax.lines) == 1
+    assert tuple(fig.get_size_inches()) == (5, 3)
+    plt.close(fig)
+
+
+def test_histogram_fast_path_matches_hist_limits():
+    from pypsa_nza_plotter import create_histogram
+
+    y = np.random.default_rng(1).normal(size=500)
+    series = SeriesConfig(y=y, label="a")
+    cfg = PlotConfig()
+
+    _, ax_hist = create_histogram(series, cfg, bins=40)
+    _, ax_fast = create_histogram(series, cfg, bins=40, fast=True)
+
+    assert len(ax_fast.patches) == 0
+    assert len(ax_fast.collections) == 1
+    assert np.allclose(ax_hist.get_ylim(), ax_fast.get_ylim())
+    assert np.allclose(ax_hist.get_xlim(), ax_fast.get_xlim())
+
+
+def test_line_plot_auto_downsample_keeps_extremes():
+    x = np.arange(200_000, dtype=float)
+    y = np.sin(x / 500.0)
+    y[123_457] = 5.0  # single spike must survive decimation
+
+    cfg = PlotConfig(auto_downsample=True, figure_width=4, dpi=100)
+    fig, ax = create_line_plot(SeriesConfig(x=x, y=y), cfg)
+
+    line = ax.lines[0]
+    assert len(line.get_xdata()) <= 4 * 4 * 100 + 400
+    assert line.get_ydata().max() == 5.0
+    assert line.get_xdata()[0] == 0 and line.get_xdata()[-1] == x[-1]
+
+
+def test_save_plot_tight_bbox_follows_figure_changes(tmp_path):
+    from PIL import Image
+
+    x = np.linspace(0, 1, 20)
+    fig, ax = create_line_plot(SeriesConfig(x=x, y=x), PlotConfig(title="bbox"))
+
+    save_plot(fig, tmp_path / "a.png", dpi=100)
+    fig.text(1.1, 0.5, "outside the axes")
+    save_plot(fig, tmp_path / "b.png", dpi=100)
+
+    width_a = Image.open(tmp_path / "a.png").size[0]
+    assert Image.open(tmp_path / "b.png").size[0] > width_a
+
+
+def test_line_plot_merges_same_style_unlabelled_series():
+    x = np.linspace(0, 1, 50)
+    runs = [SeriesConfig(x=x, y=x * k, color="#888888") for k in range(1, 6)]
+    highlight = SeriesConfig(x=x, y=1 - x, color="red", label="ref")
+
+    fig, ax = create_line_plot(runs + [highlight], PlotConfig())
+
+    assert len(ax.collections) == 1
+    assert len(ax.collections[0].get_segments()) == 5
+    assert [line.get_label() for line in ax.lines] == ["ref"]
+    assert ax.get_ylim()[1] >= 5
+
+
+def test_line_plot_skips_empty_unlabelled_series():
+    empty = SeriesConfig(x=[], y=[], fill_below=True)
+    kept = SeriesConfig(x=[], y=[], label="filtered out")
+
+    fig, ax = create_line_plot([empty, kept], PlotConfig())
+
+    assert [line.get_label() for line in ax.lines] == ["filtered out"]
+    assert not ax.collections
+
+
+def test_save_plot_close_releases_figure(tmp_path):
+    import matplotlib.pyplot as plt
+
+    fig, ax = create_line_plot(SeriesConfig(x=[0, 1], y=[0, 1]), PlotConfig())
+    assert plt.fignum_exists(fig.number)
+
+    save_plot(fig, tmp_path / "closed.png", dpi=50, close=True)
+    assert not plt.fignum_exists(fig.number)
+    assert fig.axes == [ax] and ax.lines
+
+
+def test_save_plot_fast_png_matches_savefig(tmp_path):
+    from PIL import Image
+
+    x = np.linspace(0, 1, 20)
+    fig, ax = create_line_plot(SeriesConfig(x=x, y=x), PlotConfig(title="fast"))
+
+    save_plot(fig, tmp_path / "slow.png", dpi=fig.dpi, bbox_inches=None)
+    save_plot(fig, tmp_path / "fast.png", dpi=fig.dpi, bbox_inches=None, fast=True)
+    renderer = fig._save_renderer
+    save_plot(fig, tmp_path / "again.png", dpi=fig.dpi, bbox_inches=None, fast=True)
+    assert fig._save_renderer is renderer and not fig.stale
+
+    slow = np.asarray(Image.open(tmp_path / "slow.png"))
+    for name in ("fast.png", "again.png"):
+        assert np.array_equal(np.asarray(Image.open(tmp_path / name)), slow)
+
+
+def test_png_bytes_and_close_without_pyplot():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from pypsa_nza_plotter.utils import close_figure, fig_to_data_uri, fig_to_png_bytes
+
+    fig = Figure(figsize=(2, 2), dpi=50)
+    FigureCanvasAgg(fig)
+    fig.add_subplot().plot([0, 1], [1, 0])
+
+    assert fig_to_png_bytes(fig).startswith(b"\x89PNG\r\n\x1a\n")
+    assert fig_to_data_uri(fig).startswith("data:image/png;base64,iVBORw0KGgo")
+
+    close_figure(fig)
+    assert not fig.axes
+
+
+def test_line_x_keeps_precision_with_float32_data_dtype():
+    import matplotlib.pyplot as plt
+
+    x = 1.7e9 + np.arange(5, dtype=float)  # epoch seconds, 1 s apart
+    fig, ax = create_line_plot(SeriesConfig(x=x, y=np.arange(5.0)),
+                               PlotConfig(data_dtype="float32"))
+    line = ax.get_lines()[0]
+    assert np.array_equal(line.get_xdata(), x)
+    assert line.get_ydata().dtype == np.float32
+    plt.close(fig)
+
+
+def _agg_line_figure(slope, use_pyplot=True):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(2, 2), dpi=50)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot([0, 1], [0, slope])
+    return fig, ax
+
+
+def test_render_many_matches_in_process_rendering():
+    from pypsa_nza_plotter.utils import render_many
+
+    jobs = [((slope,), {}) for slope in (1, 2, 3)]
+    serial = render_many(_agg_line_figure, jobs, n_jobs=1)
+    assert all(png.startswith(b"\x89PNG") for png in serial)
+    assert render_many(_agg_line_figure, jobs, n_jobs=2) == serial
@@ -15,3 +15,51 @@ def test_subplots_smoke(tmp_path):
     out = tmp_path / "subplots.png"
     save_plot(fig, out, dpi=150)
     assert out.exists()
+
+
+def test_subplots_ratios_gridspec_per_figure(tmp_path):
+    cfg = PlotConfig()
+    fig1, axes1 = create_subplots(2, 2, cfg, width_ratios=[2, 1])
+    fig2, axes2 = create_subplots(2, 2, cfg, width_ratios=[2, 1])
+
+    gs1, gs2 = axes1[0, 0].get_gridspec(), axes2[0, 0].get_gridspec()
+    assert gs1 is not gs2
+    gs1.update(wspace=0.8)
+    assert gs2.wspace != 0.8
+    w_wide, w_narrow = axes2[0, 0].get_position().width, axes2[0, 1].get_position().width
+    assert w_wide > w_narrow
+
+    out = tmp_path / "ratios.png"
+    save_plot(fig2, out, dpi=100)
+    assert out.exists()
+
+
+def test_subplots_reuse_given_figure():
+    import matplotlib.pyplot as plt
+
+    cfg = PlotConfig(figure_width=5, figure_height=3)
+    before = len(plt.get_fignums())
+    fig, axes = create_subplots(1, 2, cfg)
+    assert len(plt.get_fignums()) == before + 1
+
+    fig2, axes2 = create_subplots(2, 2, cfg, fig=fig)
+    assert fig2 is fig
+    assert len(fig.axes) == 4
+    assert len(plt.get_fignums()) == before + 1
+    plt.close(fig)
+
+
+def test_apply_subplot_formatting_legend_only_when_labelled():
+    from pypsa_nza_plotter.core.subplot_plotter import apply_subplot_formatting
+
+    cfg = PlotConfig(legend_font_size=8)
+    fig, axes = create_subplots(1, 2, cfg)
+    axes[0].plot([0, 1], [0, 1], label="a")
+    axes[1].plot([0, 1], [1, 0])
+
+    for ax in axes:
+        apply_subplot_formatting(ax, cfg)
+
+    assert axes[0].get_legend() is not None
+    assert axes[0].get_legend().get_texts()[0].get_fontsize() == 8
+    assert axes[1].get_legend() is None